@@ -38,6 +38,7 @@ from .ie_clip import ie_clip
 from .ie_param_format import ie_param_format
 from .ie_session_get import ie_session_get
 from .ie_session_set import ie_session_set
+from .ie_precision import ie_precision, ie_as_float
 from .ie_save_session import ie_save_session
 from .ie_load_session import ie_load_session
 from .vc_add_and_select_object import vc_add_and_select_object
@@ -102,12 +103,28 @@ from .ie_gamma import ie_gamma
 from .ie_tone import ie_tone_curve, ie_apply_tone
 from .ie_cov_ellipsoid import ie_cov_ellipsoid
 from .ie_read_spectra import ie_read_spectra
+from .ie_spectral_projector import SpectralProjector, ie_spectral_projector
+from .ie_spectra_cache import (
+    ie_spectra_cache_load,
+    ie_spectra_cache_info,
+    ie_spectra_cache_clear,
+    ie_spectra_cache_configure,
+)
+from .ie_spectral_resample import ie_spectral_resample, ie_spectral_resample_matrix
 from .ie_hist_image import ie_hist_image
 from .ie_scale import ie_scale
 from .ie_scale_columns import ie_scale_columns
 from .ie_prctile import ie_prctile
 from .ie_mvnrnd import ie_mvnrnd
 from .ie_poisson import ie_poisson
+from .ie_noise import (
+    ie_noise_normal,
+    ie_noise_uniform,
+    ie_noise_poisson,
+    ie_noise_seed,
+)
+from .ie_trace import IETrace, TraceSpan, ie_trace, ie_trace_span, ie_trace_enabled
+from .ie_roi_stats import ROIStats
 from .ie_normpdf import ie_normpdf
 from .ie_tikhonov import ie_tikhonov
 from .ie_format_figure import (
@@ -122,6 +139,8 @@ from .imgproc import (
     ie_bilinear,
     adaptive_laplacian,
     bayer_indices,
+    bayer_masks,
+    bayer_phases,
     pocs,
     faulty_insert,
     faulty_list,
@@ -203,6 +222,8 @@ from .io import (
     pfm_read,
     pfm_write,
     dng_read,
+    dng_read_raw,
+    dng_read_stack,
     dng_write,
     ie_read_color_filter,
     ie_save_color_filter,
@@ -243,6 +264,8 @@ __all__ = [
     'ie_param_format',
     'ie_session_get',
     'ie_session_set',
+    'ie_precision',
+    'ie_as_float',
     'ie_save_session',
     'ie_load_session',
     'rgb_to_xw_format',
@@ -286,12 +309,30 @@ __all__ = [
     'ie_apply_tone',
     'ie_cov_ellipsoid',
     'ie_read_spectra',
+    'SpectralProjector',
+    'ie_spectral_projector',
+    'ie_spectra_cache_load',
+    'ie_spectra_cache_info',
+    'ie_spectra_cache_clear',
+    'ie_spectra_cache_configure',
+    'ie_spectral_resample',
+    'ie_spectral_resample_matrix',
     'ie_hist_image',
     'ie_scale',
     'ie_scale_columns',
     'ie_prctile',
     'ie_mvnrnd',
     'ie_poisson',
+    'ie_noise_normal',
+    'ie_noise_uniform',
+    'ie_noise_poisson',
+    'ie_noise_seed',
+    'IETrace',
+    'TraceSpan',
+    'ie_trace',
+    'ie_trace_span',
+    'ie_trace_enabled',
+    'ROIStats',
     'ie_normpdf',
     'ie_tikhonov',
     'ie_format_figure',
@@ -304,6 +345,8 @@ __all__ = [
     'ie_bilinear',
     'adaptive_laplacian',
     'bayer_indices',
+    'bayer_masks',
+    'bayer_phases',
     'pocs',
     'faulty_insert',
     'faulty_list',
@@ -390,6 +433,8 @@ __all__ = [
     'pfm_read',
     'pfm_write',
     'dng_read',
+    'dng_read_raw',
+    'dng_read_stack',
     'dng_write',
     'ie_read_color_filter',
     'ie_save_color_filter',
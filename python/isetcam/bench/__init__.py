@@ -0,0 +1,14 @@
+# mypy: ignore-errors
+"""Benchmarks of the simulation pipeline stages."""
+
+from .bench_cases import BenchCase, BENCH_CASES
+from .bench_run import bench_run, bench_save, bench_load, bench_compare
+
+__all__ = [
+    "BenchCase",
+    "BENCH_CASES",
+    "bench_run",
+    "bench_save",
+    "bench_load",
+    "bench_compare",
+]
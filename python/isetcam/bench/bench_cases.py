@@ -0,0 +1,116 @@
+# mypy: ignore-errors
+"""Benchmark cases for the main pipeline stages."""
+
+from __future__ import annotations
+
+from typing import Callable, Dict, NamedTuple
+
+import numpy as np
+
+
+class BenchCase(NamedTuple):
+    """A benchmarked stage.
+
+    ``setup(size, n_wave)`` prepares the inputs outside of the timed region
+    and returns the zero-argument callable that is timed.  Stages that do
+    not depend on the number of wavelengths have ``uses_wave=False`` and
+    are run once per image size.
+    """
+
+    setup: Callable[[int, int], Callable[[], object]]
+    uses_wave: bool
+
+
+def _wave(n_wave: int) -> np.ndarray:
+    return np.linspace(400, 700, n_wave)
+
+
+def _scene(size: int, n_wave: int):
+    from ..scene import scene_create
+
+    return scene_create("frequency sweep", size=size, wave=_wave(n_wave))
+
+
+def _setup_scene_create(size: int, n_wave: int):
+    from ..scene import scene_create
+
+    wave = _wave(n_wave)
+    return lambda: scene_create("frequency sweep", size=size, wave=wave)
+
+
+def _setup_oi_compute(size: int, n_wave: int):
+    from ..opticalimage import oi_compute
+    from ..optics import optics_create
+
+    scene = _scene(size, n_wave)
+    optics = optics_create(wave=scene.wave)
+    return lambda: oi_compute(scene, optics)
+
+
+def _setup_sensor_compute(size: int, n_wave: int):
+    from ..opticalimage import oi_compute
+    from ..optics import optics_create
+    from ..sensor import sensor_compute, sensor_create
+
+    scene = _scene(size, n_wave)
+    oi = oi_compute(scene, optics_create(wave=scene.wave))
+    sensor = sensor_create(wave=scene.wave)
+    return lambda: sensor_compute(sensor, oi)
+
+
+def _setup_ip_compute(size: int, n_wave: int):
+    from ..display import display_create
+    from ..ip import ip_compute
+    from ..sensor import sensor_create
+
+    wave = _wave(n_wave)
+    sensor = sensor_create(wave=wave)
+    sensor.volts = np.random.default_rng(0).random((size, size))
+    display = display_create(wave=wave)
+    return lambda: ip_compute(sensor, display)
+
+
+def _demosaic_setup(method: str):
+    def setup(size: int, n_wave: int):
+        from ..ip import ip_demosaic
+
+        bayer = np.random.default_rng(0).random((size, size))
+        return lambda: ip_demosaic(bayer, "rggb", method=method)
+
+    return setup
+
+
+def _setup_scielab(size: int, n_wave: int):
+    from ..metrics import sc_params, scielab
+
+    rng = np.random.default_rng(0)
+    xyz1 = rng.random((size, size, 3)) * 100
+    xyz2 = xyz1 * (1 + 0.05 * rng.random((size, size, 3)))
+    white = np.array([95.05, 100.0, 108.88])
+    params = sc_params()
+    return lambda: scielab(xyz1, xyz2, white, params)
+
+
+def _setup_iso12233_sfr(size: int, n_wave: int):
+    from ..metrics import iso12233_sfr
+
+    x, y = np.meshgrid(np.arange(size), np.arange(size))
+    edge = (x >= 0.1 * y + size / 4).astype(float)
+    return lambda: iso12233_sfr(edge, delta_x=1)
+
+
+BENCH_CASES: Dict[str, BenchCase] = {
+    "scene_create": BenchCase(_setup_scene_create, True),
+    "oi_compute": BenchCase(_setup_oi_compute, True),
+    "sensor_compute": BenchCase(_setup_sensor_compute, True),
+    "ip_compute": BenchCase(_setup_ip_compute, True),
+    "demosaic_nearest": BenchCase(_demosaic_setup("nearest"), False),
+    "demosaic_bilinear": BenchCase(_demosaic_setup("bilinear"), False),
+    "demosaic_adaptive": BenchCase(_demosaic_setup("adaptive"), False),
+    "demosaic_pocs": BenchCase(_demosaic_setup("pocs"), False),
+    "scielab": BenchCase(_setup_scielab, False),
+    "iso12233_sfr": BenchCase(_setup_iso12233_sfr, False),
+}
+
+
+__all__ = ["BenchCase", "BENCH_CASES"]
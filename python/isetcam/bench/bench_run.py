@@ -0,0 +1,172 @@
+# mypy: ignore-errors
+"""Time pipeline stages and compare the results against a baseline."""
+
+from __future__ import annotations
+
+import json
+import platform
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Sequence
+
+import numpy as np
+
+from .bench_cases import BENCH_CASES
+
+DEF_SIZES = (64, 256)
+DEF_WAVES = (16, 31)
+
+
+def _measure(fn, repeat: int) -> Dict[str, Any]:
+    """Return wall times of ``repeat`` runs and the peak traced memory."""
+    fn()  # Warm caches and lazy imports outside of the measurements.
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+
+    # Memory is traced in a separate run so tracing does not slow the timings.
+    was_tracing = tracemalloc.is_tracing()
+    if was_tracing:
+        tracemalloc.reset_peak()
+    else:
+        tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    fn()
+    peak = tracemalloc.get_traced_memory()[1] - base
+    if not was_tracing:
+        tracemalloc.stop()
+    return {
+        "times": times,
+        "best": min(times),
+        "median": float(np.median(times)),
+        "peak_bytes": int(max(peak, 0)),
+    }
+
+
+def bench_run(
+    stages: Sequence[str] | None = None,
+    sizes: Sequence[int] = DEF_SIZES,
+    n_waves: Sequence[int] = DEF_WAVES,
+    repeat: int = 3,
+) -> Dict[str, Any]:
+    """Benchmark pipeline stages over a grid of image sizes and wavelengths.
+
+    Parameters
+    ----------
+    stages : sequence of str, optional
+        Names from :data:`BENCH_CASES`.  Defaults to all stages.
+    sizes : sequence of int, optional
+        Image sizes; images are ``size x size`` pixels.
+    n_waves : sequence of int, optional
+        Numbers of wavelength samples between 400 and 700 nm.  Stages that
+        do not use spectra run once per size with ``n_wave`` set to ``None``.
+    repeat : int, optional
+        Number of timed runs per grid point, after one warm-up run.
+
+    Returns
+    -------
+    dict
+        ``{"meta": {...}, "results": [...]}`` where every result holds the
+        stage, size, n_wave, individual times, best and median time in
+        seconds and the peak memory allocated during one run in bytes.
+    """
+    import isetcam
+
+    if repeat < 1:
+        raise ValueError("repeat must be positive")
+    names = list(BENCH_CASES) if stages is None else list(stages)
+    unknown = [n for n in names if n not in BENCH_CASES]
+    if unknown:
+        raise ValueError(f"Unknown benchmark stage(s): {', '.join(unknown)}")
+
+    results: List[Dict[str, Any]] = []
+    for name in names:
+        case = BENCH_CASES[name]
+        waves = [int(w) for w in n_waves] if case.uses_wave else [None]
+        for size in sizes:
+            for n_wave in waves:
+                fn = case.setup(int(size), n_wave or 1)
+                entry = {"stage": name, "size": int(size), "n_wave": n_wave}
+                entry.update(_measure(fn, repeat))
+                results.append(entry)
+
+    meta = {
+        "isetcam": isetcam.__version__,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "repeat": repeat,
+    }
+    return {"meta": meta, "results": results}
+
+
+def bench_save(report: Dict[str, Any], path: str | Path) -> None:
+    """Write a :func:`bench_run` report to ``path`` as JSON."""
+    Path(path).write_text(json.dumps(report, indent=2))
+
+
+def bench_load(path: str | Path) -> Dict[str, Any]:
+    """Read a report written by :func:`bench_save`."""
+    return json.loads(Path(path).read_text())
+
+
+def bench_compare(
+    report: Dict[str, Any],
+    baseline: Dict[str, Any],
+    threshold: float = 0.1,
+) -> List[Dict[str, Any]]:
+    """Return the regressions of ``report`` relative to ``baseline``.
+
+    A grid point regresses when its median time or its peak memory exceeds
+    the baseline value by more than the fraction ``threshold``.  Grid
+    points missing from either report are ignored.
+
+    Returns
+    -------
+    list of dict
+        One entry per regression with the stage, size, n_wave, the
+        ``metric`` (``"median"`` or ``"peak_bytes"``), both values and
+        their ``ratio``.
+    """
+    def key(r):
+        return r["stage"], r["size"], r["n_wave"]
+
+    base = {key(r): r for r in baseline.get("results", [])}
+    regressions = []
+    for cur in report.get("results", []):
+        ref = base.get(key(cur))
+        if ref is None:
+            continue
+        for metric in ("median", "peak_bytes"):
+            old, new = ref.get(metric), cur.get(metric)
+            if not old or new is None:
+                continue
+            ratio = new / old
+            if ratio > 1.0 + threshold:
+                regressions.append(
+                    {
+                        "stage": cur["stage"],
+                        "size": cur["size"],
+                        "n_wave": cur["n_wave"],
+                        "metric": metric,
+                        "baseline": old,
+                        "current": new,
+                        "ratio": ratio,
+                    }
+                )
+    return regressions
+
+
+__all__ = [
+    "bench_run",
+    "bench_save",
+    "bench_load",
+    "bench_compare",
+    "DEF_SIZES",
+    "DEF_WAVES",
+]
@@ -16,6 +16,8 @@ from .camera_vsnr_sl import camera_vsnr_sl, VSNRSLResult
 from .camera_acutance import camera_acutance
 from .camera_color_accuracy import camera_color_accuracy
 from .camera_compute_sequence import camera_compute_sequence
+from .camera_compute_batch import camera_compute_batch
+from .camera_compute_tiled import camera_compute_tiled
 from .camera_clear_data import camera_clear_data
 from .camera_full_reference import camera_full_reference
 from .camera_computesrgb import camera_computesrgb
@@ -38,6 +40,8 @@ __all__ = [
     "camera_acutance",
     "camera_color_accuracy",
     "camera_compute_sequence",
+    "camera_compute_batch",
+    "camera_compute_tiled",
     "camera_clear_data",
     "camera_full_reference",
     "camera_computesrgb",
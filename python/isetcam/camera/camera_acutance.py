@@ -1,6 +1,8 @@
 # mypy: ignore-errors
 from __future__ import annotations
 
+from typing import Sequence
+
 import numpy as np
 
 from .camera_class import Camera
@@ -16,9 +18,19 @@ def _freq_to_cpd(freq: np.ndarray, f_length: float) -> np.ndarray:
     return freq / deg_per_mm
 
 
-def camera_acutance(camera: Camera) -> float:
-    """Return the ISO acutance of ``camera``."""
-    freqs, mtf = camera_mtf(camera)
+def camera_acutance(
+    camera: Camera,
+    method: str = "product",
+    *,
+    image: np.ndarray | None = None,
+    rects: Sequence[Sequence[int]] | None = None,
+) -> float:
+    """Return the ISO acutance of ``camera``.
+
+    ``method``, ``image`` and ``rects`` select how the MTF is obtained,
+    see :func:`camera_mtf`.
+    """
+    freqs, mtf = camera_mtf(camera, method=method, image=image, rects=rects)
     f_length = getattr(camera.optics, "f_length", _DEF_F_LENGTH)
     cpd = _freq_to_cpd(freqs, f_length)
     return iso_acutance(cpd, mtf)
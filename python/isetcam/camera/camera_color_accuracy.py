@@ -7,18 +7,16 @@ from .camera_class import Camera
 from .camera_compute import camera_compute
 from ..scene import scene_create, scene_adjust_luminance
 from ..luminance_from_photons import luminance_from_photons
+from ..ie_roi_stats import ROIStats
 
 
 _DEF_LUMINANCE = 100.0
 
 
 def _patch_means(img: np.ndarray, patch_size: int) -> np.ndarray:
-    means = []
-    for r in range(4):
-        for c in range(6):
-            patch = img[r*patch_size:(r+1)*patch_size, c*patch_size:(c+1)*patch_size]
-            means.append(np.mean(patch))
-    return np.array(means, dtype=float)
+    rows, cols = np.mgrid[0:4, 0:6].reshape(2, -1) * patch_size
+    rects = np.column_stack([cols, rows, np.full((24, 2), patch_size)])
+    return ROIStats(img).mean(rects).mean(axis=1)
 
 
 def camera_color_accuracy(camera: Camera, lum: float = _DEF_LUMINANCE,
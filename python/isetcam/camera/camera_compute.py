@@ -8,6 +8,7 @@ from typing import Union
 import numpy as np
 
 from .camera_class import Camera
+from ..ie_trace import ie_trace_span
 from ..sensor import Sensor, sensor_compute
 from ..opticalimage import OpticalImage
 from ..scene import Scene
@@ -57,6 +58,11 @@ def camera_compute(camera: Camera, start: Union[str, Scene, OpticalImage, Sensor
         ``camera`` with updated state.
     """
 
+    with ie_trace_span("camera_compute", start=type(start).__name__):
+        return _camera_compute(camera, start)
+
+
+def _camera_compute(camera: Camera, start) -> Camera:
     # Determine the starting point
     if isinstance(start, Scene):
         oi = _scene_to_oi(start)
@@ -0,0 +1,184 @@
+# mypy: ignore-errors
+"""Run the camera pipeline on a stack of frames."""
+
+from __future__ import annotations
+
+from typing import Iterable, Iterator, Sequence, Tuple
+
+import numpy as np
+
+from .camera_class import Camera
+from .camera_compute import _prepare_sensor
+from ..display import Display
+from ..ie_precision import ie_as_float, ie_precision
+from ..ip import ip_color_pipeline, ip_compute_batch
+from ..optics import Optics
+from ..opticalimage.oi_compute import _apply_optics
+from ..scene import Scene
+from ..sensor import sensor_add_noise, sensor_cfa_integrate
+from ..sensor.sensor_compute import _exposure_from_signal
+from ..sensor.sensor_gain_offset import sensor_gain_offset
+
+
+def _chunks(
+    scenes: np.ndarray | Iterable[Scene],
+    wave: np.ndarray | None,
+    chunk_size: int,
+) -> Iterator[Tuple[np.ndarray, np.ndarray, float | None]]:
+    """Yield ``(photons, wave, sample_spacing)`` for consecutive chunks."""
+    if isinstance(scenes, np.ndarray):
+        if scenes.ndim != 4:
+            raise ValueError("scene stack must have shape (frames, rows, cols, n_wave)")
+        if wave is None:
+            raise ValueError("wave is required for a photon stack")
+        for start in range(0, scenes.shape[0], chunk_size):
+            yield scenes[start : start + chunk_size], wave, None
+        return
+
+    batch: list[np.ndarray] = []
+    ref_wave = None
+    ref_shape = None
+    spacing = None
+    for sc in scenes:
+        sc_wave = np.asarray(sc.wave, dtype=float).reshape(-1)
+        photons = np.asarray(sc.photons)
+        if ref_wave is None:
+            ref_wave, ref_shape = sc_wave, photons.shape
+            spacing = getattr(sc, "sample_spacing", None)
+        elif photons.shape != ref_shape or not np.array_equal(sc_wave, ref_wave):
+            raise ValueError("All scenes must share the same shape and wavelengths")
+        batch.append(photons)
+        if len(batch) == chunk_size:
+            yield np.stack(batch), ref_wave, spacing
+            batch = []
+    if batch:
+        yield np.stack(batch), ref_wave, spacing
+
+
+def camera_compute_batch(
+    camera: Camera,
+    scenes: np.ndarray | Iterable[Scene],
+    *,
+    wave: Sequence[float] | None = None,
+    exposure_times: Sequence[float] | float | None = None,
+    optics: Optics | None = None,
+    display: Display | None = None,
+    chunk_size: int = 8,
+    shift_invariant: bool = False,
+    workers: int | None = None,
+) -> Tuple[np.ndarray, np.ndarray | None]:
+    """Render many frames through optics, sensor and image processing.
+
+    Frames are processed ``chunk_size`` at a time.  Within a chunk every
+    stage acts on the whole ``(frames, rows, cols, ...)`` stack: the optics
+    resampling and blur, the CFA integration, exposure, noise, analog gain
+    and offset and, when ``display`` is given, :func:`ip_compute_batch`.
+    Only one chunk of photon data is held in memory at a time.
+
+    Parameters
+    ----------
+    camera : Camera
+        Camera whose sensor is used.  On return ``camera.sensor`` holds the
+        volts and exposure time of the last frame.  Frame ``k`` draws its
+        noise as frame ``noise_frame + k``, so the result equals that of
+        successive :func:`sensor_compute` calls.
+    scenes : np.ndarray or iterable of Scene
+        Either a photon stack ``(frames, rows, cols, n_wave)`` together with
+        ``wave``, or an iterable of scenes sharing shape and wavelengths.
+        Iterables, including generators, are consumed lazily.
+    wave : sequence of float, optional
+        Wavelength samples of a photon stack.
+    exposure_times : float or sequence of float, optional
+        Exposure time for all frames or one per frame.  Defaults to the
+        sensor exposure time.  Ignored when ``sensor.auto_exposure`` is set.
+    optics : Optics, optional
+        Optics applied as in :func:`oi_compute`.  Without optics the scene
+        photons reach the sensor unchanged, as in :func:`camera_compute`.
+    display : Display, optional
+        When given, the volts are also rendered to display RGB.
+    chunk_size : int, optional
+        Number of frames processed together.
+    shift_invariant, workers :
+        Forwarded to the optics stage, see :func:`oi_compute`.
+
+    Returns
+    -------
+    tuple
+        ``(volts, rgb)`` where ``volts`` has shape ``(frames, rows, cols)``
+        and ``rgb`` has shape ``(frames, rows, cols, 3)`` or is ``None``
+        when no display is given.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+    if wave is not None:
+        wave = np.asarray(wave, dtype=float).reshape(-1)
+
+    sensor = camera.sensor
+    if exposure_times is None:
+        exposure_times = sensor.exposure_time
+    exp = np.atleast_1d(np.asarray(exposure_times, dtype=float))
+
+    pipeline = ip_color_pipeline(sensor, display) if display is not None else None
+    volts_out: list[np.ndarray] = []
+    rgb_out: list[np.ndarray] = []
+    done = 0
+    for photons, sc_wave, spacing in _chunks(scenes, wave, chunk_size):
+        n = photons.shape[0]
+        photons = ie_as_float(photons, ie_precision(sensor))
+        if optics is not None:
+            photons, oi_wave = _apply_optics(
+                photons,
+                sc_wave,
+                optics,
+                spacing,
+                shift_invariant,
+                True,
+                workers,
+            )
+        else:
+            oi_wave = sc_wave
+        sensor = _prepare_sensor(sensor, oi_wave)
+
+        signal = sensor_cfa_integrate(sensor, photons)
+        if getattr(sensor, "auto_exposure", False):
+            times = np.array(
+                [_exposure_from_signal(sensor, frame, 0.95) for frame in signal]
+            )
+        elif exp.size == 1:
+            times = np.full(n, exp[0])
+        else:
+            times = exp[done : done + n]
+            if times.size != n:
+                raise ValueError("Number of exposure_times must be 1 or n_frames")
+        signal *= times[:, np.newaxis, np.newaxis]
+
+        sensor.volts = signal
+        sensor_add_noise(sensor)
+        gain = getattr(sensor, "analog_gain", 1.0)
+        offset = getattr(sensor, "analog_offset", 0.0)
+        sensor_gain_offset(sensor, gain=gain, offset=offset)
+        volts_out.append(sensor.volts)
+
+        if display is not None:
+            rgb_out.append(
+                ip_compute_batch(sensor.volts, sensor, display, pipeline=pipeline)
+            )
+        sensor.exposure_time = float(times[-1])
+        sensor.noise_frame = int(getattr(sensor, "noise_frame", 0)) + n
+        done += n
+
+    if not volts_out:
+        raise ValueError("No frames to compute")
+    if exp.size not in {1, done}:
+        raise ValueError("Number of exposure_times must be 1 or n_frames")
+
+    volts = np.concatenate(volts_out) if len(volts_out) > 1 else volts_out[0]
+    sensor.volts = volts[-1].copy()
+    camera.sensor = sensor
+    rgb = None
+    if rgb_out:
+        rgb = np.concatenate(rgb_out) if len(rgb_out) > 1 else rgb_out[0]
+    return volts, rgb
+
+
+__all__ = ["camera_compute_batch"]
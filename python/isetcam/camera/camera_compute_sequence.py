@@ -8,7 +8,8 @@ from typing import Sequence, Tuple, List, Tuple as TypingTuple
 import numpy as np
 
 from .camera_class import Camera
-from .camera_compute import camera_compute
+from .camera_compute import _scene_to_oi, camera_compute
+from .camera_compute_batch import camera_compute_batch
 from ..scene import Scene
 
 
@@ -75,6 +76,18 @@ def camera_compute_sequence(
     if len(exp_list) == 1:
         exp_list *= n_frames
 
+    # Scenes sharing a photon shape and wavelength grid are rendered as one
+    # stack; anything else falls back to one ``camera_compute`` per frame.
+    first = scenes_list[0]
+    if all(
+        np.shape(sc.photons) == np.shape(first.photons)
+        and np.array_equal(sc.wave, first.wave)
+        for sc in scenes_list[1:]
+    ):
+        volts, _ = camera_compute_batch(camera, scenes_list, exposure_times=exp_list)
+        camera.optical_image = _scene_to_oi(scenes_list[-1])
+        return camera, list(volts)
+
     images: List[np.ndarray] = []
 
     for sc, et in zip(scenes_list, exp_list):
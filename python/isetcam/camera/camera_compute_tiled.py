@@ -0,0 +1,311 @@
+# mypy: ignore-errors
+"""Run the camera pipeline tile by tile with overlapping halos."""
+
+from __future__ import annotations
+
+import copy
+import os
+from collections import deque
+from concurrent.futures import Executor
+from typing import Tuple
+
+import numpy as np
+from scipy.fft import irfft2
+
+from .camera_class import Camera
+from .camera_compute import _prepare_sensor
+from ..display import Display
+from ..ie_noise import ie_noise_seed
+from ..ie_precision import ie_precision
+from ..ip import IPColorPipeline, ip_color_pipeline, ip_compute_batch
+from ..optics import Optics
+from ..opticalimage.oi_compute import _apply_optics, _rfft_otf
+from ..scene import Scene
+from ..sensor import sensor_add_noise, sensor_cfa_integrate
+from ..sensor.sensor_cfa_integrate import _parse_pattern
+from ..sensor.sensor_compute import _exposure_from_signal
+from ..sensor.sensor_gain_offset import sensor_gain_offset
+
+# Radius in pixels of the neighbourhood read by each demosaic method.
+_DEMOSAIC_RADIUS = {"bilinear": 1, "nearest": 1, "nearest_neighbor": 1}
+# Largest grid on which the PSF radius is measured.
+_PSF_PROBE_MAX = 1024
+
+
+def _psf_radius(
+    optics: Optics, spacing: float, wave: np.ndarray, energy: float = 0.999
+) -> int:
+    """Return the radius in pixels holding ``energy`` of every waveband's PSF.
+
+    The energy is that of ``psf**2``, whose ringing tails decay fast enough
+    to be cut.  The PSF is sampled on a periodic grid that is doubled until
+    the radius lies well inside it, so wrap-around does not inflate it.
+    The probe OTFs are not stored in the :func:`oi_compute` cache.
+    """
+    n = 32
+    while True:
+        otf = _rfft_otf(optics, n, n, spacing, wave)
+        psf = irfft2(otf, s=(n, n), axes=(0, 1))
+        power = np.fft.fftshift(psf * psf, axes=(0, 1)).reshape(n * n, -1)
+        c = n // 2
+        offset = np.abs(np.arange(n) - c)
+        ring = np.maximum(offset[:, None], offset[None, :]).ravel()
+        # Energy inside the square of each radius, per waveband.
+        inner = np.zeros((c + 1, power.shape[1]))
+        np.add.at(inner, ring, power)
+        np.cumsum(inner, axis=0, out=inner)
+        r = int(np.argmax(np.all(inner >= energy * inner[-1], axis=1)))
+        if r < n // 4 or n >= _PSF_PROBE_MAX:
+            return r
+        n *= 2
+
+
+def _cfa_period(sensor) -> int:
+    if not hasattr(sensor, "filter_color_letters"):
+        return 1
+    pattern = _parse_pattern(sensor.filter_color_letters)
+    return 1 if pattern is None else int(max(pattern.shape))
+
+
+def _read_tile(
+    photons: np.ndarray, bounds: Tuple[int, int, int, int], dtype
+) -> np.ndarray:
+    """Return ``photons[r0:r1, c0:c1]`` as ``dtype`` with zeros outside the frame."""
+    r0, r1, c0, c1 = bounds
+    rows, cols, n_wave = photons.shape
+    out = np.zeros((r1 - r0, c1 - c0, n_wave), dtype=dtype)
+    rs, re = max(r0, 0), min(r1, rows)
+    cs, ce = max(c0, 0), min(c1, cols)
+    if rs < re and cs < ce:
+        out[rs - r0 : re - r0, cs - c0 : ce - c0] = photons[rs:re, cs:ce]
+    return out
+
+
+def _render_tile(
+    photons: np.ndarray,
+    sc_wave: np.ndarray,
+    sensor,
+    optics: Optics | None,
+    display: Display | None,
+    pipeline: IPColorPipeline | None,
+    spacing: float | None,
+    shift_invariant: bool,
+    bounds: Tuple[int, int, int, int],
+    frame_shape: Tuple[int, int],
+    halo: int,
+    exposure: float | None,
+):
+    """Render one padded tile.
+
+    With ``exposure=None`` the peak of the integrated signal is returned,
+    otherwise ``(volts, rgb)`` of the tile without its halo.
+    """
+    if optics is not None:
+        photons, oi_wave = _apply_optics(
+            photons, sc_wave, optics, spacing, shift_invariant, False, None
+        )
+    else:
+        oi_wave = sc_wave
+    sensor = _prepare_sensor(sensor, oi_wave)
+    signal = sensor_cfa_integrate(sensor, photons)
+
+    # Only pixels inside the frame receive exposure and noise; outside it
+    # the volts stay zero, matching the zero padding of a full frame.
+    r0, r1, c0, c1 = bounds
+    rows, cols = frame_shape
+    inside = (
+        slice(max(r0, 0) - r0, min(r1, rows) - r0),
+        slice(max(c0, 0) - c0, min(c1, cols) - c0),
+    )
+    if exposure is None:
+        return float(signal[inside].max()) if signal[inside].size else 0.0
+
+    volts = np.zeros_like(signal)
+    sensor.volts = signal[inside] * exposure
+    sensor_add_noise(sensor, origin=(max(r0, 0), max(c0, 0)))
+    gain = getattr(sensor, "analog_gain", 1.0)
+    offset = getattr(sensor, "analog_offset", 0.0)
+    sensor_gain_offset(sensor, gain=gain, offset=offset)
+    volts[inside] = sensor.volts
+
+    core = (slice(halo, volts.shape[0] - halo), slice(halo, volts.shape[1] - halo))
+    rgb = None
+    if display is not None:
+        # Demosaic only the part inside the frame so frame edges are treated
+        # as in a full-frame computation.
+        rgb = np.zeros(volts.shape + (3,), dtype=volts.dtype)
+        rgb[inside] = ip_compute_batch(
+            volts[inside][np.newaxis], sensor, display, pipeline=pipeline
+        )[0]
+        rgb = rgb[core]
+    return volts[core], rgb
+
+
+def camera_compute_tiled(
+    camera: Camera,
+    scene: Scene,
+    *,
+    optics: Optics | None = None,
+    display: Display | None = None,
+    tile: int = 512,
+    halo: int | None = None,
+    shift_invariant: bool = False,
+    executor: Executor | None = None,
+    max_pending: int | None = None,
+    volts_out: np.ndarray | None = None,
+    rgb_out: np.ndarray | None = None,
+) -> Tuple[np.ndarray, np.ndarray | None]:
+    """Render ``scene`` through optics, sensor and display in tiles.
+
+    The frame is cut into ``tile x tile`` blocks.  Each block is read with a
+    surrounding halo, run through :func:`oi_compute`'s optics stage, CFA
+    integration, exposure, noise, gain and offset and, when ``display`` is
+    given, :func:`ip_compute_batch`.  The halo is then cropped and the block
+    written to the output.  The halo covers the optics PSF (when
+    ``shift_invariant``) plus the demosaic neighbourhood, so the stitched
+    result matches the full-frame computation up to the PSF energy
+    truncation.  Only a few tiles are in memory at a time, so ``scene``
+    may be memory mapped (see :func:`scene_from_memmap`) and the outputs
+    may be memory-mapped arrays as well.
+
+    Noise is seamless across tiles because :func:`sensor_add_noise` keys
+    the samples by absolute pixel position.  Set ``sensor.noise_seed`` for
+    reproducible results; otherwise one seed is drawn for the whole frame.
+    With ``sensor.auto_exposure`` a first pass over the tiles finds the peak
+    signal.
+
+    Parameters
+    ----------
+    camera : Camera
+        Camera whose sensor is used.  On return ``camera.sensor.volts`` is
+        the stitched volts image.
+    scene : Scene
+        Input scene.
+    optics : Optics, optional
+        Optics applied as in :func:`oi_compute`.  Without optics the scene
+        photons reach the sensor unchanged, as in :func:`camera_compute`.
+    display : Display, optional
+        When given, the volts are also rendered to display RGB with the
+        bilinear demosaic.
+    tile : int, optional
+        Tile size in pixels, rounded up to a multiple of the CFA period.
+    halo : int, optional
+        Halo width in pixels.  By default it is the radius holding 99.9% of
+        the PSF power plus the demosaic radius; the faint PSF tails beyond
+        it are cut, so pass a wider halo for closer agreement with the full
+        frame.
+    shift_invariant : bool, optional
+        Apply the optics blur, see :func:`oi_compute`.
+    executor : concurrent.futures.Executor, optional
+        Executor used to render tiles, for example a
+        :class:`~concurrent.futures.ProcessPoolExecutor`.  Tiles are
+        rendered serially when omitted.
+    max_pending : int, optional
+        Maximum number of tiles submitted but not yet stored, which bounds
+        the memory held by in-flight tiles.  Defaults to twice the number
+        of CPUs; pass about twice the executor's worker count for smaller
+        pools.
+    volts_out, rgb_out : np.ndarray, optional
+        Preallocated ``(rows, cols)`` and ``(rows, cols, 3)`` outputs.
+
+    Returns
+    -------
+    tuple
+        ``(volts, rgb)``; ``rgb`` is ``None`` without a display.
+    """
+    if max_pending is None:
+        max_pending = 2 * (os.cpu_count() or 1)
+    elif max_pending < 1:
+        raise ValueError("max_pending must be positive")
+    photons = scene.photons
+    if photons.ndim != 3:
+        raise ValueError("scene.photons must have shape (rows, cols, n_wave)")
+    rows, cols = photons.shape[:2]
+    sc_wave = np.asarray(scene.wave, dtype=float).reshape(-1)
+    spacing = getattr(scene, "sample_spacing", None)
+
+    oi_wave = sc_wave if optics is None else np.asarray(optics.wave, dtype=float)
+    sensor = _prepare_sensor(camera.sensor, oi_wave.reshape(-1))
+    period = _cfa_period(sensor)
+    tile = max(period, -(-int(tile) // period) * period)
+    if halo is None:
+        halo = _DEMOSAIC_RADIUS["bilinear"] if display is not None else 0
+        if optics is not None and shift_invariant:
+            s = 1.0 if spacing is None else float(spacing)
+            halo += _psf_radius(optics, s, sensor.wave)
+    halo = -(-int(halo) // period) * period
+
+    dtype = ie_precision(sensor)
+    if volts_out is None:
+        volts_out = np.empty((rows, cols), dtype=dtype)
+    if display is not None and rgb_out is None:
+        rgb_out = np.empty((rows, cols, 3), dtype=dtype)
+    pipeline = ip_color_pipeline(sensor, display) if display is not None else None
+
+    blocks = [
+        (r, min(r + tile, rows), c, min(c + tile, cols))
+        for r in range(0, rows, tile)
+        for c in range(0, cols, tile)
+    ]
+
+    # Workers receive a copy of the sensor without its volts.  A shared noise
+    # seed keeps the noise of pixels in overlapping halos identical.
+    template = copy.copy(sensor)
+    template.volts = np.zeros((0, 0))
+    template.noise_seed = ie_noise_seed(getattr(sensor, "noise_seed", None))
+
+    def tasks(exposure):
+        for r, r_end, c, c_end in blocks:
+            bounds = (r - halo, r + tile + halo, c - halo, c + tile + halo)
+            yield (r, r_end, c, c_end), (
+                _read_tile(photons, bounds, dtype),
+                sc_wave,
+                template,
+                optics,
+                display,
+                pipeline,
+                spacing,
+                shift_invariant,
+                bounds,
+                (rows, cols),
+                halo,
+                exposure,
+            )
+
+    def run(exposure, store):
+        if executor is None:
+            for block, args in tasks(exposure):
+                store(block, _render_tile(*args))
+            return
+        pending: deque = deque()
+        for block, args in tasks(exposure):
+            pending.append((block, executor.submit(_render_tile, *args)))
+            if len(pending) >= max_pending:
+                b, fut = pending.popleft()
+                store(b, fut.result())
+        while pending:
+            b, fut = pending.popleft()
+            store(b, fut.result())
+
+    if getattr(sensor, "auto_exposure", False):
+        peaks = []
+        run(None, lambda block, peak: peaks.append(peak))
+        peak_signal = np.array([max(peaks, default=0.0)])
+        sensor.exposure_time = _exposure_from_signal(sensor, peak_signal, 0.95)
+
+    def store(block, result):
+        r, r_end, c, c_end = block
+        volts, rgb = result
+        volts_out[r:r_end, c:c_end] = volts[: r_end - r, : c_end - c]
+        if rgb is not None:
+            rgb_out[r:r_end, c:c_end] = rgb[: r_end - r, : c_end - c]
+
+    run(float(sensor.exposure_time), store)
+
+    sensor.volts = volts_out
+    sensor.noise_frame = int(getattr(sensor, "noise_frame", 0)) + 1
+    camera.sensor = sensor
+    return volts_out, rgb_out if display is not None else None
+
+
+__all__ = ["camera_compute_tiled"]
@@ -15,8 +15,7 @@ except Exception:  # pragma: no cover - matplotlib might not be installed
 from .camera_class import Camera
 from .camera_compute import camera_compute
 from ..scene import Scene, scene_create, scene_adjust_luminance
-from ..quanta2energy import quanta_to_energy
-from ..ie_xyz_from_energy import ie_xyz_from_energy
+from ..ie_xyz_from_photons import ie_xyz_from_photons
 from ..srgb_xyz import xyz_to_srgb
 from ..ie_format_figure import ie_format_figure
 
@@ -78,8 +77,7 @@ def camera_computesrgb(
     volts = camera.sensor.volts.astype(float)
 
     # Ideal sRGB rendering from the scene
-    energy = quanta_to_energy(sc.wave, sc.photons)
-    xyz = ie_xyz_from_energy(energy, sc.wave)
+    xyz = ie_xyz_from_photons(sc.photons, sc.wave)
     srgb_ideal, _, _ = xyz_to_srgb(xyz)
 
     # Camera result scaled to [0, 1] and replicated across channels
@@ -12,8 +12,7 @@ from .camera_compute import camera_compute
 from .camera_mtf import camera_mtf
 from .camera_vsnr import camera_vsnr
 from ..scene import Scene
-from ..quanta2energy import quanta_to_energy
-from ..ie_xyz_from_energy import ie_xyz_from_energy
+from ..ie_xyz_from_photons import ie_xyz_from_photons
 from ..srgb_xyz import xyz_to_srgb
 from ..srgb_to_lab import srgb_to_lab
 from ..metrics import delta_e_ab
@@ -42,8 +41,7 @@ def camera_full_reference(camera: Camera, scene: Scene) -> Dict[str, Any]:
     camera = camera_compute(camera, scene)
 
     # Ideal XYZ image from the scene photon data
-    energy = quanta_to_energy(scene.wave, scene.photons)
-    xyz_ideal = ie_xyz_from_energy(energy, scene.wave)
+    xyz_ideal = ie_xyz_from_photons(scene.photons, scene.wave)
     srgb_ideal, _, _ = xyz_to_srgb(xyz_ideal)
     lab_ideal = srgb_to_lab(srgb_ideal, _WHITEPOINT)
 
@@ -8,6 +8,7 @@ from typing import Sequence, Tuple
 import numpy as np
 
 from .camera_class import Camera
+from ..metrics.iso12233_sfr import iso12233_sfr_batch
 
 
 _DEF_PIXEL_SIZE = 2.8e-6  # meters, matches sensor_create default
@@ -40,9 +41,32 @@ def _diffraction_mtf(freq: np.ndarray, f_number: float, wavelength: float) -> np
     return mtf
 
 
+def _sfr_mtf(camera: Camera,
+             freqs: np.ndarray | None,
+             image: np.ndarray | None,
+             rects: Sequence[Sequence[int]] | None) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the slanted-edge MTF averaged over ``rects`` of ``image``."""
+    if image is None:
+        image = camera.sensor.volts
+    if image is None or np.asarray(image).size == 0:
+        raise ValueError("An image with slanted edges is required")
+    pixel_size = getattr(camera.sensor, "pixel_size", _DEF_PIXEL_SIZE)
+    results = iso12233_sfr_batch(
+        np.asarray(image), rects, delta_x=pixel_size * 1e3
+    )
+    if freqs is None:
+        freqs = results[0][0]
+    mtf = np.mean([np.interp(freqs, f, m) for f, m in results], axis=0)
+    return freqs, mtf
+
+
 def camera_mtf(camera: Camera,
                freqs: Sequence[float] | None = None,
-               method: str = "product") -> Tuple[np.ndarray, np.ndarray]:
+               method: str = "product",
+               *,
+               image: np.ndarray | None = None,
+               rects: Sequence[Sequence[int]] | None = None,
+               ) -> Tuple[np.ndarray, np.ndarray]:
     """Return the modulation transfer function of ``camera``.
 
     Parameters
@@ -51,10 +75,16 @@ def camera_mtf(camera: Camera,
         Camera instance containing ``sensor`` and ``optics`` models.
     freqs : sequence of float, optional
         Spatial frequencies in cycles/mm. When ``None`` a range from 0 to
-        the optics diffraction limit is used.
+        the optics diffraction limit is used, or for ``method="sfr"`` the
+        frequencies of the first ROI.
     method : str, optional
-        Combination method. Only ``"product"`` (pixel MTF times optics MTF)
-        is implemented.
+        ``"product"`` multiplies the pixel and diffraction-limited optics
+        MTFs.  ``"sfr"`` measures the ISO 12233 slanted-edge MTF of every
+        ROI with :func:`iso12233_sfr_batch` and averages them.
+    image : np.ndarray, optional
+        Image measured by ``method="sfr"``.  Defaults to the sensor volts.
+    rects : sequence of (x, y, width, height), optional
+        Slanted-edge ROIs of ``image``.  By default the whole image is used.
 
     Returns
     -------
@@ -63,6 +93,11 @@ def camera_mtf(camera: Camera,
     mtf : np.ndarray
         MTF values corresponding to ``freqs``.
     """
+    if method == "sfr":
+        if freqs is not None:
+            freqs = np.asarray(freqs, dtype=float)
+        return _sfr_mtf(camera, freqs, image, rects)
+
     pixel_size = getattr(camera.sensor, "pixel_size", _DEF_PIXEL_SIZE)
     f_number = getattr(camera.optics, "f_number", 4.0)
     wavelength = float(np.mean(camera.sensor.wave)) * 1e-9 if getattr(camera.sensor, "wave", None) is not None else _DEF_WAVELENGTH  # noqa: E501
@@ -9,8 +9,7 @@ from .camera_class import Camera
 from ..scene import Scene
 from ..opticalimage import OpticalImage
 from ..sensor import sensor_compute
-from ..quanta2energy import quanta_to_energy
-from ..ie_xyz_from_energy import ie_xyz_from_energy
+from ..ie_xyz_from_photons import ie_xyz_from_photons
 from ..metrics import xyz_to_vsnr
 
 
@@ -19,8 +18,8 @@ def camera_vsnr(camera: Camera, scene: Scene) -> float:
 
     The scene is converted to an optical image which is passed through the
     sensor model using :func:`~isetcam.sensor.sensor_compute`. The scene
-    spectral energy is converted to CIE XYZ by
-    :func:`~isetcam.ie_xyz_from_energy` and the S-CIELAB domain variance is
+    photons are converted to CIE XYZ by
+    :func:`~isetcam.ie_xyz_from_photons` and the S-CIELAB domain variance is
     summarized with :func:`~isetcam.metrics.xyz_to_vsnr`.
     """
 
@@ -36,9 +35,8 @@ def camera_vsnr(camera: Camera, scene: Scene) -> float:
     # Update the sensor response
     sensor_compute(camera.sensor, oi)
 
-    # Convert scene photon data to energy and then to XYZ
-    energy = quanta_to_energy(scene.wave, scene.photons)
-    xyz = ie_xyz_from_energy(energy, scene.wave)
+    # Convert scene photon data to XYZ
+    xyz = ie_xyz_from_photons(scene.photons, scene.wave)
 
     white = np.array([1.0, 1.0, 1.0], dtype=float)
     return float(xyz_to_vsnr(xyz, white))
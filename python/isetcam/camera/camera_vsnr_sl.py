@@ -11,8 +11,7 @@ import numpy as np
 from .camera_class import Camera
 from .camera_compute import camera_compute
 from ..scene import Scene, scene_adjust_luminance
-from ..quanta2energy import quanta_to_energy
-from ..ie_xyz_from_energy import ie_xyz_from_energy
+from ..ie_xyz_from_photons import ie_xyz_from_photons
 from ..metrics import xyz_to_vsnr
 
 
@@ -52,8 +51,7 @@ def camera_vsnr_sl(
         scene = _base_scene()
         scene = scene_adjust_luminance(scene, "mean", float(lum))
         camera_compute(camera, scene)
-        energy = quanta_to_energy(scene.wave, scene.photons)
-        xyz = ie_xyz_from_energy(energy, scene.wave)
+        xyz = ie_xyz_from_photons(scene.photons, scene.wave)
         vsnr_vals[i] = float(xyz_to_vsnr(xyz, np.array([1.0, 1.0, 1.0])))
 
     return VSNRSLResult(vsnr=vsnr_vals, mean_luminances=levels)
@@ -8,6 +8,14 @@ import numpy as np
 from scipy.io import loadmat
 
 from .data_path import data_path
+from .ie_spectra_cache import ie_spectra_cache_load
+
+
+CCT_CHUNK = 1 << 16
+
+
+def _read_cct_table(path: Path) -> dict:
+    return {"table": np.asarray(loadmat(path)["table"], dtype=float)}
 
 
 def _load_cct_table() -> np.ndarray:
@@ -18,8 +26,49 @@ def _load_cct_table() -> np.ndarray:
         path = data_path("color/cct.mat")
         if not path.exists():
             path = data_path("lights/cct.mat")
-    data = loadmat(path)
-    return data["table"]
+    return ie_spectra_cache_load(path, _read_cct_table, ("cct",))["table"]
+
+
+def _cct_uv(u: np.ndarray, v: np.ndarray, chunk_size: int = CCT_CHUNK) -> np.ndarray:
+    """Return the correlated color temperature of each ``(u, v)`` pair.
+
+    For every point the signed distances ``d`` to all isotemperature lines
+    of the table are computed at once and the pair of neighbouring lines
+    where ``d`` changes sign brackets the temperature, which is then
+    interpolated in reciprocal Kelvin (Robertson's method).  Points are
+    processed ``chunk_size`` at a time to bound the ``(lines, points)``
+    work arrays.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+    table = _load_cct_table()
+    inv_T = 1.0 / table[:, 0]
+    tu = table[:, 1][:, np.newaxis]
+    tv = table[:, 2][:, np.newaxis]
+    tt = table[:, 3][:, np.newaxis]
+    norm = np.sqrt(1 + tt**2)
+
+    u = np.asarray(u, dtype=float).ravel()
+    v = np.asarray(v, dtype=float).ravel()
+    out = np.empty(u.size)
+    for start in range(0, u.size, chunk_size):
+        us = u[start : start + chunk_size]
+        vs = v[start : start + chunk_size]
+        d = ((us - tu) - tt * (vs - tv)) / norm
+
+        ds = np.sign(d)
+        ds[ds == 0] = 1
+        cross = ds[:-1] * ds[1:] < 0
+        if np.any(cross.sum(axis=0) != 1):
+            raise ValueError("Check input range of uv coordinates")
+        j = cross.argmax(axis=0)
+        cols = np.arange(us.size)
+        dj = d[j, cols]
+        dj1 = d[j + 1, cols]
+        out[start : start + us.size] = 1.0 / (
+            inv_T[j] + dj / (dj - dj1) * (inv_T[j + 1] - inv_T[j])
+        )
+    return out
 
 
 def cct(uv: np.ndarray) -> np.ndarray:
@@ -36,42 +85,9 @@ def cct(uv: np.ndarray) -> np.ndarray:
         Estimated correlated color temperature in Kelvin.
     """
     uv = np.asarray(uv, dtype=float)
-    if uv.shape[0] == 2:
-        uv = uv.copy()
-    elif uv.shape[1] == 2:
+    if uv.shape[0] != 2:
+        if uv.shape[1] != 2:
+            raise ValueError("uv must be (2,N) or (N,2)")
         uv = uv.T
-    else:
-        raise ValueError("uv must be (2,N) or (N,2)")
 
-    table = _load_cct_table()
-    T = table[:, 0][:, np.newaxis]
-    u = table[:, 1][:, np.newaxis]
-    v = table[:, 2][:, np.newaxis]
-    t = table[:, 3][:, np.newaxis]
-
-    Nd = uv.shape[1]
-    us = np.tile(uv[0], (len(table), 1))
-    vs = np.tile(uv[1], (len(table), 1))
-    T = np.tile(T, (1, Nd))
-    u = np.tile(u, (1, Nd))
-    v = np.tile(v, (1, Nd))
-    t = np.tile(t, (1, Nd))
-
-    d = ((us - u) - t * (vs - v)) / np.sqrt(1 + t**2)
-
-    ds = np.sign(d)
-    ds = np.where(ds == 0, 1, ds)
-    ds = np.vstack([ds, np.zeros((1, Nd))])
-
-    j = np.where(np.abs(np.diff(ds, axis=0)) == 2)[0]
-    if j.size != Nd:
-        raise ValueError("Check input range of uv coordinates")
-
-    Tc = 1.0 / (
-        1.0 / T[j, range(Nd)]
-        + d[j, range(Nd)]
-        / (d[j, range(Nd)] - d[j + 1, range(Nd)])
-        * (1.0 / T[j + 1, range(Nd)] - 1.0 / T[j, range(Nd)])
-    )
-
-    return Tc.squeeze()
+    return _cct_uv(uv[0], uv[1]).squeeze()
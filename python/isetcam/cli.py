@@ -56,6 +56,45 @@ def _cmd_pipeline(args: argparse.Namespace) -> int:
     return 0
 
 
+def _int_list(text: str) -> list[int]:
+    return [int(v) for v in text.split(",") if v]
+
+
+def _cmd_bench(args: argparse.Namespace) -> int:
+    """Benchmark pipeline stages and optionally compare with a baseline."""
+    from isetcam.bench import bench_compare, bench_load, bench_run, bench_save
+
+    stages = args.stages.split(",") if args.stages else None
+    report = bench_run(
+        stages=stages,
+        sizes=_int_list(args.sizes),
+        n_waves=_int_list(args.waves),
+        repeat=args.repeat,
+    )
+    print(f"{'stage':<20} {'size':>6} {'waves':>6} {'median ms':>10} {'peak MB':>9}")
+    for r in report["results"]:
+        n_wave = "-" if r["n_wave"] is None else r["n_wave"]
+        print(
+            f"{r['stage']:<20} {r['size']:>6} {n_wave:>6} "
+            f"{1e3 * r['median']:>10.2f} {r['peak_bytes'] / 2**20:>9.1f}"
+        )
+    if args.output:
+        bench_save(report, args.output)
+
+    if not args.baseline:
+        return 0
+    regressions = bench_compare(report, bench_load(args.baseline), args.threshold)
+    for r in regressions:
+        print(
+            f"REGRESSION {r['stage']} size={r['size']} n_wave={r['n_wave']} "
+            f"{r['metric']}: {r['baseline']:.4g} -> {r['current']:.4g} "
+            f"({r['ratio']:.2f}x)"
+        )
+    if not regressions:
+        print("No regressions")
+    return 1 if regressions else 0
+
+
 def _available_tutorials() -> list[str]:
     """Return a sorted list of available tutorial script names."""
     base = Path(__file__).resolve().parents[1] / "tutorials"
@@ -98,6 +137,25 @@ def main(argv: list[str] | None = None) -> int:
     p_pipe.add_argument("--output", required=True, help="Output MAT-file path")
     p_pipe.set_defaults(func=_cmd_pipeline)
 
+    p_bench = subparsers.add_parser("bench", help="Benchmark pipeline stages")
+    p_bench.add_argument(
+        "--stages", default="", help="Comma separated stages (default: all)"
+    )
+    p_bench.add_argument("--sizes", default="64,256", help="Comma separated sizes")
+    p_bench.add_argument(
+        "--waves", default="16,31", help="Comma separated wavelength counts"
+    )
+    p_bench.add_argument("--repeat", type=int, default=3, help="Timed runs per case")
+    p_bench.add_argument("--output", help="Write results to this JSON file")
+    p_bench.add_argument("--baseline", help="Baseline JSON file to compare with")
+    p_bench.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Allowed relative slowdown or memory growth (default: 0.1)",
+    )
+    p_bench.set_defaults(func=_cmd_bench)
+
     tut_list = ', '.join(_available_tutorials())
     p_tut = subparsers.add_parser(
         "tutorial",
@@ -2,15 +2,30 @@
 """Lightweight computational photography tools."""
 
 from .cp_scene import CPScene
-from .cp_cmodule import CPCModule
+from .cp_cmodule import CPCModule, cp_capture
 from .cp_camera import CPCamera
 from .cp_burst_camera import cp_burst_camera
+from .cp_burst_merge import CPBurstMerger
+from .cp_render_cache import (
+    cp_render_key,
+    cp_render_cache_load,
+    cp_render_cache_info,
+    cp_render_cache_clear,
+    cp_render_cache_configure,
+)
 from .cp_burst_ip import cp_burst_ip
 
 __all__ = [
     "CPScene",
     "CPCModule",
+    "cp_capture",
     "CPCamera",
     "cp_burst_camera",
+    "CPBurstMerger",
+    "cp_render_key",
+    "cp_render_cache_load",
+    "cp_render_cache_info",
+    "cp_render_cache_clear",
+    "cp_render_cache_configure",
     "cp_burst_ip",
 ]
@@ -1,21 +1,25 @@
 # mypy: ignore-errors
 from __future__ import annotations
 
-from typing import Sequence
+from typing import Iterable
 
 import numpy as np
 
 from ..sensor import Sensor
+from .cp_burst_merge import CPBurstMerger
 
 
-def cp_burst_ip(sensors: Sequence[Sensor], mode: str = "sum") -> np.ndarray:
-    """Combine a sequence of sensor frames."""
-    if not sensors:
+def cp_burst_ip(sensors: Iterable[Sensor], mode: str = "sum", **options) -> np.ndarray:
+    """Combine a sequence of sensor frames.
+
+    Frames are consumed one at a time by a :class:`CPBurstMerger`, so
+    ``sensors`` may be a generator producing the burst lazily and memory
+    does not grow with its length.  ``mode`` is ``"sum"``, ``"longest"``
+    or ``"aligned"``; ``options`` are passed to :class:`CPBurstMerger`.
+    """
+    merger = CPBurstMerger(mode, **options)
+    for sensor in sensors:
+        merger.add(sensor)
+    if merger.count == 0:
         raise ValueError("sensors list is empty")
-    stack = np.stack([s.volts for s in sensors], axis=0)
-    mode = mode.lower()
-    if mode == "sum":
-        return stack.sum(axis=0)
-    if mode == "longest":
-        return stack[-1]
-    raise ValueError("Unknown mode")
+    return merger.result()
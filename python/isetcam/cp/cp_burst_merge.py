@@ -0,0 +1,283 @@
+# mypy: ignore-errors
+"""Streaming merge of burst frames with optional tile alignment."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from ..sensor import Sensor
+
+_MODES = ("sum", "longest", "aligned")
+# Smallest window, in pixels, over which tiles are compared during alignment.
+_MIN_WINDOW = 8
+
+
+def _downsample(img: np.ndarray) -> np.ndarray:
+    """Return the 2x2 box average of ``img``, dropping an odd last row/col."""
+    r, c = img.shape[0] // 2 * 2, img.shape[1] // 2 * 2
+    img = img[:r, :c]
+    return 0.25 * (
+        img[0::2, 0::2] + img[1::2, 0::2] + img[0::2, 1::2] + img[1::2, 1::2]
+    )
+
+
+def _align_base(volts: np.ndarray) -> tuple[np.ndarray, int]:
+    """Return the grayscale image used for alignment and its pixel scale.
+
+    Raw mosaics are reduced to one value per 2x2 CFA quad so that offsets,
+    scaled back by 2, never change the color filter phase.  Multi-channel
+    images are averaged over their channels.
+    """
+    if volts.ndim == 2:
+        return _downsample(volts.astype(float, copy=False)), 2
+    if volts.ndim == 3:
+        return volts.mean(axis=2, dtype=float), 1
+    raise ValueError("volts must be 2-D or 3-D")
+
+
+def _pyramid(base: np.ndarray, levels: int) -> list[np.ndarray]:
+    pyr = [base]
+    for _ in range(levels - 1):
+        pyr.append(_downsample(pyr[-1]))
+    return pyr
+
+
+def _candidates(radius: int) -> np.ndarray:
+    """Return all shifts within ``radius``, the smallest displacements first."""
+    d = np.arange(-radius, radius + 1)
+    dy, dx = (a.ravel() for a in np.meshgrid(d, d, indexing="ij"))
+    order = np.argsort(np.abs(dy) + np.abs(dx), kind="stable")
+    return np.stack([dy[order], dx[order]], axis=1)
+
+
+def _tiles(img: np.ndarray, n_ty: int, n_tx: int, tile: int) -> np.ndarray:
+    """Return the ``(n_ty, n_tx, tile, tile)`` tiles of ``img``."""
+    img = img[: n_ty * tile, : n_tx * tile]
+    return img.reshape(n_ty, tile, n_tx, tile).transpose(0, 2, 1, 3)
+
+
+def _windows(img: np.ndarray, row0: np.ndarray, col0: np.ndarray, size: int):
+    """Return the ``size x size`` windows of ``img`` at ``(row0, col0)``.
+
+    Windows reaching outside ``img`` read its replicated border.
+    """
+    span = np.arange(size)
+    rows = np.clip(row0[..., None] + span, 0, img.shape[0] - 1)
+    cols = np.clip(col0[..., None] + span, 0, img.shape[1] - 1)
+    return img[rows[..., :, None], cols[..., None, :]]
+
+
+def _align_level(
+    ref: np.ndarray, alt: np.ndarray, guess: np.ndarray, tile: int, radius: int
+) -> np.ndarray:
+    """Refine the per-tile offsets ``guess`` by an exhaustive L2 search.
+
+    Tiles smaller than ``_MIN_WINDOW`` pixels, as found on the coarse
+    levels, are compared over a centered window of that size so that
+    the match is not dominated by noise.
+    """
+    n_ty, n_tx = guess.shape[:2]
+    size = max(tile, _MIN_WINDOW)
+    margin = (size - tile) // 2
+    row0 = (np.arange(n_ty) * tile - margin)[:, None] + np.zeros_like(guess[..., 0])
+    col0 = (np.arange(n_tx) * tile - margin)[None, :] + np.zeros_like(guess[..., 1])
+    ref_t = _windows(ref, row0, col0, size)
+    row0 = row0 + guess[..., 0]
+    col0 = col0 + guess[..., 1]
+
+    best = np.full((n_ty, n_tx), np.inf)
+    offset = guess.copy()
+    for dy, dx in _candidates(radius):
+        diff = _windows(alt, row0 + dy, col0 + dx, size) - ref_t
+        cost = np.einsum("abij,abij->ab", diff, diff)
+        better = cost < best
+        best[better] = cost[better]
+        offset[better] = guess[better] + (dy, dx)
+    return offset
+
+
+def _noise_var(base: np.ndarray) -> float:
+    """Estimate the noise variance of ``base`` from second differences.
+
+    The median absolute deviation makes the estimate insensitive to edges,
+    and second differences cancel smooth shading.
+    """
+    d = (base[:, 2:] - 2 * base[:, 1:-1] + base[:, :-2]).ravel()
+    if d.size == 0:
+        return 0.0
+    mad = np.median(np.abs(d - np.median(d)))
+    return float((1.4826 * mad) ** 2 / 6)
+
+
+class CPBurstMerger:
+    """Merge burst frames one at a time.
+
+    Frames are folded into running accumulators as they arrive, so memory
+    does not grow with the burst length.
+
+    Parameters
+    ----------
+    mode : str, optional
+        ``"sum"`` adds the volts of all frames.  ``"longest"`` keeps the
+        last frame.  ``"aligned"`` aligns every frame to the first one and
+        merges them robustly; the result has the scale of ``"sum"``.
+    tile : int, optional
+        Alignment tile size in pixels of the alignment image (2x2 CFA quads
+        for raw mosaics).  Must be divisible by ``2**(levels - 1)``.
+    levels : int, optional
+        Number of pyramid levels searched coarse to fine.
+    search : int, optional
+        Search radius in pixels at the coarser levels; the finest level is
+        refined by one pixel.
+    noise_var : float, optional
+        Noise variance of the alignment image.  By default it is estimated
+        from the first frame.
+    robustness : float, optional
+        Tiles whose mean squared difference to the reference exceeds the
+        expected noise are down-weighted by
+        ``1 / (1 + (excess / robustness)**2)`` where ``excess`` is the
+        surplus difference in units of the expected noise.  Smaller values
+        reject moving content more aggressively.
+    """
+
+    def __init__(
+        self,
+        mode: str = "sum",
+        *,
+        tile: int = 16,
+        levels: int = 3,
+        search: int = 4,
+        noise_var: float | None = None,
+        robustness: float = 2.0,
+    ) -> None:
+        mode = mode.lower()
+        if mode not in _MODES:
+            raise ValueError("Unknown mode")
+        if levels < 1 or search < 1:
+            raise ValueError("levels and search must be positive")
+        if tile < 1 or tile % 2 ** (levels - 1):
+            raise ValueError("tile must be divisible by 2**(levels - 1)")
+        if robustness <= 0:
+            raise ValueError("robustness must be positive")
+        self.mode = mode
+        self.tile = int(tile)
+        self.levels = int(levels)
+        self.search = int(search)
+        self.noise_var = noise_var
+        self.robustness = float(robustness)
+        self.count = 0
+        self.offsets: list[np.ndarray] = []
+        self.weights: list[np.ndarray] = []
+        self._acc = None
+
+    def add(self, frame: Sensor | np.ndarray) -> "CPBurstMerger":
+        """Fold the volts of ``frame`` (a sensor or an array) into the merge."""
+        volts = np.asarray(getattr(frame, "volts", frame))
+        if self._acc is not None and volts.shape != self._acc.shape:
+            raise ValueError("All frames must have the same shape")
+        if self.mode == "longest":
+            self._acc = volts
+        elif self.mode == "sum":
+            if self._acc is None:
+                # Accumulate in the type ``np.sum`` would use, so that small
+                # integer frames such as raw ``uint16`` data do not wrap.
+                self._acc = volts.astype(np.zeros(0, volts.dtype).sum().dtype)
+            else:
+                dtype = np.result_type(self._acc, volts)
+                if dtype != self._acc.dtype:
+                    self._acc = self._acc.astype(dtype)
+                self._acc += volts
+        elif self._acc is None:
+            self._start_aligned(volts)
+        else:
+            self._merge_aligned(volts)
+        self.count += 1
+        return self
+
+    def _start_aligned(self, volts: np.ndarray) -> None:
+        base, self._scale = _align_base(volts)
+        self._n_ty = base.shape[0] // self.tile
+        self._n_tx = base.shape[1] // self.tile
+        if self._n_ty == 0 or self._n_tx == 0:
+            raise ValueError("frames are smaller than one alignment tile")
+        self._ref_pyr = _pyramid(base, self.levels)
+        var = _noise_var(base) if self.noise_var is None else float(self.noise_var)
+        # The floor keeps identical noise-free frames at full weight.
+        self._var = max(var, 1e-12 * float(np.mean(base**2)), np.finfo(float).tiny)
+        self._acc = volts.astype(float)
+        self._den = np.ones((self._n_ty, self._n_tx))
+
+        # Pixel to tile lookup; pixels past the last full tile use the
+        # nearest one.
+        px_tile = self.tile * self._scale
+        rows, cols = volts.shape[:2]
+        self._ty = np.minimum(np.arange(rows) // px_tile, self._n_ty - 1)
+        self._tx = np.minimum(np.arange(cols) // px_tile, self._n_tx - 1)
+        self.offsets.append(np.zeros((self._n_ty, self._n_tx, 2), dtype=int))
+        self.weights.append(np.ones((self._n_ty, self._n_tx)))
+
+    def _align(self, alt_pyr: list[np.ndarray]) -> np.ndarray:
+        offset = np.zeros((self._n_ty, self._n_tx, 2), dtype=int)
+        for level in range(self.levels - 1, -1, -1):
+            radius = 1 if level == 0 and self.levels > 1 else self.search
+            offset = _align_level(
+                self._ref_pyr[level],
+                alt_pyr[level],
+                offset,
+                self.tile >> level,
+                radius,
+            )
+            if level:
+                offset *= 2
+        return offset
+
+    def _merge_aligned(self, volts: np.ndarray) -> None:
+        base, _ = _align_base(volts)
+        offset = self._align(_pyramid(base, self.levels))
+
+        # Robust weight per tile from the residual after alignment.
+        ref_t = _tiles(self._ref_pyr[0], self._n_ty, self._n_tx, self.tile)
+        r = np.arange(self._n_ty)[:, None] * self.tile + offset[..., 0]
+        c = np.arange(self._n_tx)[None, :] * self.tile + offset[..., 1]
+        diff = _windows(base, r, c, self.tile) - ref_t
+        d2 = np.einsum("abij,abij->ab", diff, diff) / self.tile**2
+        excess = np.maximum(d2 - 2 * self._var, 0) / (2 * self._var)
+        weight = 1.0 / (1.0 + (excess / self.robustness) ** 2)
+
+        # Shift every pixel by its tile offset in whole CFA quads; shifts
+        # past the border are clipped without changing the CFA phase.  The
+        # frame is warped one band of rows at a time to bound temporaries.
+        s = self._scale
+        rows, cols = volts.shape[:2]
+        x = np.arange(cols)
+        kx_lo, kx_hi = -(x // s), (cols - 1 - x) // s
+        band = self.tile * s
+        for r0 in range(0, rows, band):
+            y = np.arange(r0, min(r0 + band, rows))[:, None]
+            ty = self._ty[y]
+            ky = np.clip(offset[ty, self._tx, 0], -(y // s), (rows - 1 - y) // s)
+            kx = np.clip(offset[ty, self._tx, 1], kx_lo, kx_hi)
+            aligned = volts[y + s * ky, x + s * kx]
+            w = weight[ty, self._tx]
+            if aligned.ndim == 3:
+                w = w[..., None]
+            self._acc[r0 : r0 + band] += aligned * w
+        self._den += weight
+        self.offsets.append(offset)
+        self.weights.append(weight)
+
+    def result(self) -> np.ndarray:
+        """Return the merged frame."""
+        if self.count == 0:
+            raise ValueError("No frames added")
+        if self.mode == "longest":
+            return np.array(self._acc)
+        if self.mode == "sum":
+            return self._acc.copy()
+        den = self._den[self._ty[:, None], self._tx[None, :]]
+        if self._acc.ndim == 3:
+            den = den[..., None]
+        return self._acc / den * self.count
+
+
+__all__ = ["CPBurstMerger"]
@@ -5,7 +5,7 @@ from dataclasses import dataclass, field
 from typing import List, Sequence, Optional
 
 from .cp_scene import CPScene
-from .cp_cmodule import CPCModule
+from .cp_cmodule import CPCModule, cp_capture
 
 
 @dataclass
@@ -21,13 +21,18 @@ class CPCamera:
         exposure_times: Sequence[float] | float = 1.0,
         focus_dists: Sequence[float] | float | None = None,
         render_flags: Sequence[bool] | bool | None = None,
+        workers: int | None = None,
     ) -> List:
         """Capture ``scene`` using ``exposure_times`` for each frame.
 
         The method accepts PBRT-based :class:`CPScene` instances and forwards
         the optional ``focus_dists`` and ``render_flags`` arguments to
-        :meth:`CPScene.render` so that PBRT scenes can be rendered with
-        varying focus settings and rendering flags.
+        :meth:`CPScene.render` (which does not use them yet).
+
+        All modules and frames are captured concurrently on ``workers``
+        threads (see :func:`cp_capture`), and modules with identical optics
+        share one optical image per scene.  The captures are returned
+        module by module, each in frame order.
         """
         if isinstance(exposure_times, Sequence) and not isinstance(exposure_times, (str, bytes)):
             exp_list = list(exposure_times)
@@ -51,7 +56,6 @@ class CPCamera:
             render_list = None
 
         scenes = scene.render(exp_list, focus_dists=focus_list, render_flags=render_list)
-        all_images: List = []
-        for module in self.modules:
-            all_images.extend(module.compute(scenes, exp_list))
-        return all_images
+        if not self.modules:
+            return []
+        return cp_capture(self.modules, scenes, exp_list, workers)
@@ -1,17 +1,59 @@
 # mypy: ignore-errors
 from __future__ import annotations
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, replace
 from typing import List, Sequence
 
-import numpy as np
-
 from ..sensor import Sensor, sensor_compute
 from ..optics import Optics
 from ..opticalimage import OpticalImage, oi_compute
+from ..opticalimage.oi_compute import _array_digest
 from ..scene import Scene
 
 
+def _optics_key(optics: Optics) -> tuple:
+    """Return a key that is equal for optics forming the same image."""
+    return tuple(sorted((k, _array_digest(v)) for k, v in vars(optics).items()))
+
+
+def cp_capture(
+    modules: Sequence["CPCModule"],
+    scenes: List[Scene | OpticalImage],
+    exp_times: Sequence[float],
+    workers: int | None = None,
+) -> List[Sensor]:
+    """Capture ``scenes`` with every module, running the work concurrently.
+
+    Each optical image is computed once per scene and distinct optics, so
+    modules sharing identical optics reuse it.  The optical images and
+    then all sensor captures run on a pool of ``workers`` threads; the
+    NumPy stages release the GIL.  The result lists the captures of the
+    first module, then of the second and so on, each in frame order.
+    """
+    scenes = list(scenes)
+    exp_list = [float(t) for t in exp_times][: len(scenes)]
+    scenes = scenes[: len(exp_list)]
+    keys = [_optics_key(m.optics) for m in modules]
+    n_tasks = len(modules) * len(scenes)
+    if workers is None:
+        workers = min(n_tasks, os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as ex:
+        jobs = {}
+        for module, key in zip(modules, keys):
+            for sc in scenes:
+                if (key, id(sc)) not in jobs:
+                    jobs[(key, id(sc))] = ex.submit(module.optical_image, sc)
+        ois = {k: f.result() for k, f in jobs.items()}
+        captures = [
+            ex.submit(module.capture, ois[(key, id(sc))], t)
+            for module, key in zip(modules, keys)
+            for sc, t in zip(scenes, exp_list)
+        ]
+        return [f.result() for f in captures]
+
+
 @dataclass
 class CPCModule:
     """Simple camera module holding :class:`Sensor` and :class:`Optics`."""
@@ -19,25 +61,37 @@ class CPCModule:
     sensor: Sensor
     optics: Optics
 
-    def compute(
-        self, scenes: List[Scene | OpticalImage], exp_times: Sequence[float]
-    ) -> List[Sensor]:
-        """Return sensor captures for each scene or optical image.
+    def optical_image(self, scene: Scene | OpticalImage) -> OpticalImage:
+        """Return the optical image this module forms of ``scene``.
 
         When rendering PBRT scenes, ``CPScene.render`` may return an
         :class:`~isetcam.opticalimage.OpticalImage` instead of a
         :class:`~isetcam.scene.Scene`.  In that case the optical image is used
         directly without calling :func:`oi_compute`.
         """
+        if isinstance(scene, OpticalImage):
+            return scene
+        return oi_compute(scene, self.optics)
+
+    def capture(self, oi: OpticalImage, exp_time: float) -> Sensor:
+        """Return a copy of the module sensor exposed to ``oi``."""
+        s = replace(self.sensor)
+        s.exposure_time = float(exp_time)
+        return sensor_compute(s, oi)
+
+    def compute(
+        self,
+        scenes: List[Scene | OpticalImage],
+        exp_times: Sequence[float],
+        *,
+        workers: int | None = None,
+    ) -> List[Sensor]:
+        """Return sensor captures for each scene or optical image.
+
+        Frames are captured concurrently by :func:`cp_capture`; frames
+        sharing a scene share its optical image.
+        """
+        return cp_capture([self], scenes, exp_times, workers)
+
 
-        outputs: List[Sensor] = []
-        for sc, t in zip(scenes, exp_times):
-            if isinstance(sc, OpticalImage):
-                oi = sc
-            else:
-                oi = oi_compute(sc, self.optics)
-            s = replace(self.sensor)
-            s.exposure_time = float(t)
-            s = sensor_compute(s, oi)
-            outputs.append(s)
-        return outputs
+__all__ = ["CPCModule", "cp_capture"]
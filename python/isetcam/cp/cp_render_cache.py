@@ -0,0 +1,200 @@
+# mypy: ignore-errors
+"""Cache of PBRT renders keyed by scene content and render settings."""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import os
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Tuple
+
+import numpy as np
+
+from ..opticalimage import OpticalImage
+from ..scene import Scene
+
+_CACHE: "OrderedDict[str, Scene | OpticalImage]" = OrderedDict()
+_STATS = {"hits": 0, "misses": 0, "disk_hits": 0}
+_CONFIG: Dict[str, Any] = {"maxsize": 8, "max_bytes": 2 << 30, "disk": True}
+
+
+@lru_cache(maxsize=64)
+def _file_digest(path: str, mtime_ns: int, size: int) -> str:
+    """Return the SHA-1 of a file; cached by path, time and size."""
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _content_digest(path: str | Path | None) -> str | None:
+    if path is None:
+        return None
+    p = Path(path)
+    if not p.is_file():
+        return f"missing:{p}"
+    st = p.stat()
+    return _file_digest(str(p.resolve()), st.st_mtime_ns, st.st_size)
+
+
+def cp_render_key(
+    scene_path: str | Path,
+    lens_file: str | Path | None = None,
+) -> str:
+    """Return the cache key of a render.
+
+    The key hashes the content of the scene file and of ``lens_file``, so
+    renaming or touching them keeps their entries while editing them does
+    not.  Files included by the scene are not part of the key.
+    """
+    parts = (_content_digest(scene_path), _content_digest(lens_file))
+    return hashlib.sha1(repr(parts).encode()).hexdigest()
+
+
+def _freeze(obj: Scene | OpticalImage) -> Scene | OpticalImage:
+    for name in ("photons", "depth_map"):
+        arr = getattr(obj, name, None)
+        if isinstance(arr, np.ndarray):
+            arr.setflags(write=False)
+    return obj
+
+
+def _save(obj: Scene | OpticalImage, path: Path) -> None:
+    data = {
+        "kind": np.array("oi" if isinstance(obj, OpticalImage) else "scene"),
+        "photons": np.asarray(obj.photons),
+        "wave": np.asarray(obj.wave),
+    }
+    if getattr(obj, "name", None) is not None:
+        data["name"] = np.array(str(obj.name))
+    if getattr(obj, "depth_map", None) is not None:
+        data["depth_map"] = np.asarray(obj.depth_map)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.stem}.{os.getpid()}.tmp.npz")
+    np.savez(tmp, **data)
+    os.replace(tmp, path)
+
+
+def _load(path: Path) -> Scene | OpticalImage:
+    with np.load(path, allow_pickle=False) as npz:
+        cls = OpticalImage if str(npz["kind"]) == "oi" else Scene
+        name = str(npz["name"]) if "name" in npz.files else None
+        obj = cls(photons=npz["photons"], wave=npz["wave"], name=name)
+        if "depth_map" in npz.files:
+            obj.depth_map = npz["depth_map"]
+    return obj
+
+
+def _evict(disk_dir: Path, keep: Path) -> None:
+    """Delete the least recently used renders above the size bound."""
+    files = []
+    for f in disk_dir.glob("*.npz"):
+        st = f.stat()
+        files.append((st.st_mtime_ns, st.st_size, f))
+    total = sum(size for _, size, _ in files)
+    for _, size, f in sorted(files):
+        if total <= _CONFIG["max_bytes"]:
+            break
+        if f != keep:
+            f.unlink(missing_ok=True)
+            total -= size
+
+
+def cp_render_cache_load(
+    key: str,
+    render: Callable[[], Scene | OpticalImage],
+    disk_dir: str | Path | None = None,
+) -> Tuple[Scene | OpticalImage, bool]:
+    """Return the render stored under ``key``, calling ``render`` on a miss.
+
+    Renders are kept in a process-wide LRU and, unless disabled with
+    :func:`cp_render_cache_configure`, in ``disk_dir`` as ``.npz`` files.
+    The disk store is bounded to ``max_bytes``; the least recently used
+    files are evicted first.
+
+    Returns
+    -------
+    tuple
+        The render and ``True`` when ``render`` was called.  The returned
+        object is a shallow copy whose photons are shared and read-only.
+    """
+    obj = _CACHE.get(key)
+    rendered = False
+    if obj is not None:
+        _CACHE.move_to_end(key)
+        _STATS["hits"] += 1
+        return copy.copy(obj), rendered
+
+    disk = None
+    if _CONFIG["disk"] and disk_dir is not None:
+        disk = Path(disk_dir) / f"{key}.npz"
+    if disk is not None and disk.is_file():
+        obj = _load(disk)
+        os.utime(disk)
+        _STATS["disk_hits"] += 1
+    else:
+        _STATS["misses"] += 1
+        obj = render()
+        rendered = True
+        if disk is not None:
+            _save(obj, disk)
+            _evict(disk.parent, disk)
+
+    _CACHE[key] = _freeze(obj)
+    while len(_CACHE) > _CONFIG["maxsize"]:
+        _CACHE.popitem(last=False)
+    return copy.copy(obj), rendered
+
+
+def cp_render_cache_info() -> Dict[str, Any]:
+    """Return hit and miss counters and the cache configuration."""
+    return {**_STATS, "size": len(_CACHE), **_CONFIG}
+
+
+def cp_render_cache_clear(disk_dir: str | Path | None = None) -> None:
+    """Empty the in-memory cache and reset the counters.
+
+    When ``disk_dir`` is given its stored renders are removed as well.
+    """
+    _CACHE.clear()
+    for name in _STATS:
+        _STATS[name] = 0
+    if disk_dir is not None and Path(disk_dir).is_dir():
+        for f in Path(disk_dir).glob("*.npz"):
+            f.unlink()
+
+
+def cp_render_cache_configure(
+    maxsize: int | None = None,
+    max_bytes: int | None = None,
+    disk: bool | None = None,
+) -> None:
+    """Set the number of renders kept in memory and the disk store bound.
+
+    ``disk=False`` stops reading and writing renders on disk.
+    """
+    if maxsize is not None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be positive")
+        _CONFIG["maxsize"] = int(maxsize)
+        while len(_CACHE) > _CONFIG["maxsize"]:
+            _CACHE.popitem(last=False)
+    if max_bytes is not None:
+        if max_bytes < 0:
+            raise ValueError("max_bytes must be non-negative")
+        _CONFIG["max_bytes"] = int(max_bytes)
+    if disk is not None:
+        _CONFIG["disk"] = bool(disk)
+
+
+__all__ = [
+    "cp_render_key",
+    "cp_render_cache_load",
+    "cp_render_cache_info",
+    "cp_render_cache_clear",
+    "cp_render_cache_configure",
+]
@@ -10,6 +10,7 @@ from pathlib import Path
 
 from ..scene import Scene, scene_from_pbrt
 from ..iset_root_path import iset_root_path
+from .cp_render_cache import cp_render_cache_load, cp_render_key
 
 
 @dataclass(init=False)
@@ -45,7 +46,19 @@ class CPScene:
         focus_dists: Sequence[float] | None = None,
         render_flags: Sequence[bool] | None = None,
     ) -> List[Scene | object]:
-        """Return scenes or optical images for ``exp_times``."""
+        """Return scenes or optical images for ``exp_times``.
+
+        Exposure does not change radiance, so a PBRT scene is rendered once
+        and the result is shared by all frames.  The render is cached by the
+        content of the scene and lens files (see
+        :func:`cp_render_cache_load`), in memory and under
+        ``data/computed/render_cache``, so repeated captures of an unchanged
+        scene are not rendered again.
+
+        ``focus_dists`` and ``render_flags`` are accepted for the PBRT
+        workflow but are currently ignored: :func:`scene_from_pbrt` renders
+        the scene file as written.
+        """
 
         exp_list = list(exp_times)
 
@@ -53,15 +66,20 @@ class CPScene:
             path = Path(self.scene_path)
             computed_dir = iset_root_path() / "data" / "computed"
             computed_dir.mkdir(parents=True, exist_ok=True)
-            outputs: List[Scene | object] = []
-            for ii, t in enumerate(exp_list, start=1):
+
+            def render():
                 sc, oi, _ = scene_from_pbrt(path)
-                exr_path = path.with_suffix(".exr")
-                if exr_path.exists():
-                    dest = computed_dir / f"{exr_path.stem}-{ii:03d}-{int(round(t*1000))}{exr_path.suffix}"
-                    shutil.move(exr_path, dest)
-                outputs.append(oi if oi is not None else sc)
-            return outputs
+                return oi if oi is not None else sc
+
+            key = cp_render_key(path, self.lens_file)
+            out, fresh = cp_render_cache_load(
+                key, render, computed_dir / "render_cache"
+            )
+            exr_path = path.with_suffix(".exr")
+            if fresh and exr_path.exists():
+                name = f"{exr_path.stem}-{key[:12]}{exr_path.suffix}"
+                shutil.move(exr_path, computed_dir / name)
+            return [out] * len(exp_list)
 
         if len(self.scenes) == len(exp_list):
             return list(self.scenes)
@@ -13,6 +13,7 @@ from .display_class import Display
 from .display_create import display_create
 from .display_get import display_get
 from .display_set import display_set
+from .display_gamma import DisplayGamma, display_gamma
 from .display_apply_gamma import display_apply_gamma
 from .display_render import display_render
 from .display_compute import display_compute
@@ -33,6 +34,8 @@ __all__ = [
     "display_create",
     "display_get",
     "display_set",
+    "DisplayGamma",
+    "display_gamma",
     "display_apply_gamma",
     "display_render",
     "display_compute",
@@ -11,7 +11,13 @@ from ..rgb_to_xw_format import rgb_to_xw_format
 from ..xw_to_rgb_format import xw_to_rgb_format
 
 
-def display_compute(image: np.ndarray, display: Display, apply_gamma: bool = True) -> np.ndarray:
+def display_compute(
+    image: np.ndarray,
+    display: Display,
+    apply_gamma: bool = True,
+    *,
+    normalized: bool | None = None,
+) -> np.ndarray:
     """Return spectral radiance for ``image`` on ``display``.
 
     Parameters
@@ -23,6 +29,10 @@ def display_compute(image: np.ndarray, display: Display, apply_gamma: bool = Tru
     apply_gamma : bool, optional
         When ``True`` apply ``display``'s gamma table to ``image`` before
         computing the spectral radiance.
+    normalized : bool, optional
+        Passed to :func:`display_apply_gamma`: ``True`` for drive values in
+        ``[0, 1]``, ``False`` for code values.  By default the image
+        maximum decides.
 
     Returns
     -------
@@ -42,7 +52,7 @@ def display_compute(image: np.ndarray, display: Display, apply_gamma: bool = Tru
         raise ValueError("image must be (rows, cols, 3) or (n, 3)")
 
     if apply_gamma and display.gamma is not None:
-        xw = display_apply_gamma(xw, display)
+        xw = display_apply_gamma(xw, display, normalized=normalized)
 
     spd = np.asarray(display.spd, dtype=float)
     if spd.shape[1] != 3:
@@ -9,6 +9,7 @@ import numpy as np
 from scipy.io import loadmat
 
 from ..data_path import data_path
+from ..ie_spectra_cache import ie_spectra_cache_load
 
 from .display_class import Display
 
@@ -16,16 +17,22 @@ _DEFAULT_NAME = "LCD-Apple"
 _DEF_DIR = "data"
 
 
-def _load_display(path: Path) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
-    """Return ``wave``, ``spd`` and ``gamma`` arrays from ``path``."""
+def _read_display(path: Path) -> dict:
     data = loadmat(path)
     if "d" not in data:
         raise KeyError("No display struct 'd' found in file")
     d = data["d"][0, 0]
-    wave = d["wave"].ravel().astype(float)
-    spd = d["spd"].astype(float)
-    gamma = d["gamma"].astype(float)
-    return wave, spd, gamma
+    return {
+        "wave": d["wave"].ravel().astype(float),
+        "spd": d["spd"].astype(float),
+        "gamma": d["gamma"].astype(float),
+    }
+
+
+def _load_display(path: Path) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return ``wave``, ``spd`` and ``gamma`` arrays from ``path``."""
+    entry = ie_spectra_cache_load(path, _read_display, ("display",))
+    return entry["wave"].copy(), entry["spd"].copy(), entry["gamma"].copy()
 
 
 def display_create(name: str | None = None, wave: np.ndarray | None = None) -> Display:
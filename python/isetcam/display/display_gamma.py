@@ -0,0 +1,232 @@
+# mypy: ignore-errors
+"""Precomputed forward and inverse display gamma lookup tables."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from .display_class import Display
+from ..ie_precision import ie_as_float
+
+# Pixels processed per chunk.  Keeps the index temporaries small.
+GAMMA_CHUNK = 1 << 16
+DEF_LUT_SIZE = 1 << 16
+
+
+class _InverseGammaLUT:
+    """Inverse of a display gamma table evaluated through a dense LUT.
+
+    The result equals ``np.interp(x, gamma[:, c], linspace(0, 1, n))`` per
+    channel.  The input range of every channel is cut into ``size`` equal
+    bins and each bin stores the gamma table segment it falls in.  Only
+    values in the few bins that straddle a table entry fall back to a
+    binary search.  A single-column table serves every image channel.
+    """
+
+    def __init__(self, gamma: np.ndarray, size: int) -> None:
+        n_levels, g_channels = gamma.shape
+        if size < 1:
+            raise ValueError("lut_size must be positive")
+
+        xp = np.ascontiguousarray(gamma.T)
+        fp = np.linspace(0, 1, n_levels)
+        dx = np.diff(xp, axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            slope = np.where(dx > 0, np.diff(fp) / dx, 0.0)
+
+        lo = xp[:, 0]
+        hi = xp[:, -1]
+        span = hi - lo
+        scale = np.divide(size, span, out=np.zeros_like(span), where=span > 0)
+        edges = lo[:, np.newaxis] + span[:, np.newaxis] * (np.arange(size + 1) / size)
+        seg = np.stack(
+            [np.searchsorted(xp[c], e, side="right") - 1 for c, e in enumerate(edges)]
+        )
+        seg = np.clip(seg, 0, n_levels - 2)
+
+        # Tables are flattened over channels so that a single gather serves
+        # all of them; ``bin_offset`` and ``seg_offset`` select the channel.
+        self.size = size
+        self.n_seg = n_levels - 1
+        self.bin_offset = np.arange(g_channels) * size
+        self.seg_offset = np.arange(g_channels) * self.n_seg
+        self.segment = (seg[:, :-1] + self.seg_offset[:, np.newaxis]).ravel()
+        self.straddle = (seg[:, 1:] != seg[:, :-1]).ravel()
+        self.xp = xp
+        self.x0 = xp[:, :-1].ravel()
+        self.slope = slope.ravel()
+        self.f0 = np.tile(fp[:-1], g_channels)
+        self.lo = lo
+        self.hi = hi
+        self.scale = scale
+
+    def __call__(self, x: np.ndarray, out: np.ndarray) -> np.ndarray:
+        """Write the inverse gamma of ``x`` (``(pixels, channels)``) to ``out``."""
+        if np.shares_memory(x, out):
+            x = x.copy()
+        pos = (x - self.lo) * self.scale
+        # fmax/fmin map NaN to a valid bin; NaN inputs still yield NaN below.
+        np.fmax(pos, 0, out=pos)
+        np.fmin(pos, self.size - 1, out=pos)
+        b = pos.astype(np.intp)
+        b += self.bin_offset
+        k = self.segment[b]
+
+        rows, cols = np.nonzero(self.straddle[b])
+        if rows.size:
+            vals = x[rows, cols]
+            table = cols if self.xp.shape[0] > 1 else np.zeros_like(cols)
+            for c in np.unique(table):
+                m = table == c
+                j = np.searchsorted(self.xp[c], vals[m], side="right") - 1
+                k[rows[m], cols[m]] = np.clip(j, 0, self.n_seg - 1) + self.seg_offset[c]
+
+        # Interpolate in double precision like np.interp, then round once.
+        res = out if out.dtype == np.float64 else np.empty(out.shape)
+        with np.errstate(invalid="ignore"):
+            np.subtract(x, self.x0[k], out=res)
+            res *= self.slope[k]
+            res += self.f0[k]
+        if res is not out:
+            out[...] = res
+        out[x < self.lo] = 0.0
+        out[x >= self.hi] = 1.0
+        return out
+
+
+class DisplayGamma:
+    """Forward and inverse gamma of a display, precomputed.
+
+    The forward direction maps digital values to linear intensity by a
+    lookup in the gamma table, flattened over channels so that one gather
+    serves all of them.  The inverse direction runs through a dense
+    :class:`_InverseGammaLUT` with ``lut_size`` bins per channel.  Results
+    equal those of the per-channel code in :func:`display_apply_gamma`.
+
+    Images are ``(..., channels)`` arrays processed ``chunk`` pixels at a
+    time.  A single-column gamma table applies to every channel.
+    """
+
+    def __init__(
+        self,
+        gamma: np.ndarray,
+        lut_size: int = DEF_LUT_SIZE,
+        chunk: int = GAMMA_CHUNK,
+    ) -> None:
+        table = np.array(gamma, dtype=float)
+        if table.ndim == 1:
+            table = table.reshape(-1, 1)
+        if table.ndim != 2 or table.shape[0] < 2:
+            raise ValueError("Gamma table needs at least two levels")
+        if chunk < 1:
+            raise ValueError("chunk must be positive")
+        table.setflags(write=False)
+        self.shape = np.shape(gamma)
+        self.table = table
+        self.n_levels, self.n_channels = table.shape
+        self.lut_size = int(lut_size)
+        self.chunk = int(chunk)
+        self._flat = np.ascontiguousarray(table.T).ravel()
+        self._offset = np.arange(self.n_channels) * self.n_levels
+        self._inverse = None
+
+    def _check(self, x: np.ndarray, out: np.ndarray | None, dtype) -> np.ndarray:
+        if x.ndim < 1 or (self.n_channels != 1 and x.shape[-1] != self.n_channels):
+            raise ValueError("Gamma table channel mismatch with image")
+        if out is None:
+            return np.empty(x.shape, dtype=dtype)
+        if out.shape != x.shape:
+            raise ValueError("out must have the shape of the image")
+        if not out.flags.c_contiguous:
+            raise ValueError("out must be C-contiguous")
+        return out
+
+    def forward(
+        self,
+        img: np.ndarray,
+        out: np.ndarray | None = None,
+        *,
+        normalized: bool | None = None,
+    ) -> np.ndarray:
+        """Return the linear intensity of digital values ``img``.
+
+        Parameters
+        ----------
+        img : np.ndarray
+            Integer code values or floats, channels in the last axis.
+        out : np.ndarray, optional
+            C-contiguous output array; may be ``img`` itself.
+        normalized : bool, optional
+            ``True`` when ``img`` holds values in ``[0, 1]`` that are
+            scaled to the table levels, ``False`` for code values.  By
+            default values are treated as normalized when the image
+            maximum does not exceed 1.
+        """
+        x = np.asarray(img)
+        out = self._check(x, out, ie_as_float(x[..., :0]).dtype)
+        if normalized is None:
+            normalized = bool(x.size) and bool(x.max() <= 1)
+        top = self.n_levels - 1
+        src = x.reshape(-1, x.shape[-1])
+        dst = out.reshape(src.shape)
+        flat = self._flat.astype(out.dtype, copy=False)
+        for start in range(0, src.shape[0], self.chunk):
+            block = src[start : start + self.chunk]
+            if block.dtype.kind in "iub" and not normalized:
+                idx = block.astype(np.intp)
+                np.clip(idx, 0, top, out=idx)
+            else:
+                # Levels are picked in double precision, as by
+                # ``display_apply_gamma``, whatever the input precision.
+                pos = block.astype(np.float64)
+                if normalized:
+                    pos *= top
+                np.rint(pos, out=pos)
+                # fmax/fmin also map NaN to the first level.
+                np.fmax(pos, 0, out=pos)
+                np.fmin(pos, top, out=pos)
+                idx = pos.astype(np.intp)
+            if self.n_channels > 1:
+                idx += self._offset
+            np.take(flat, idx, out=dst[start : start + self.chunk], mode="clip")
+        return out
+
+    def inverse(self, img: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
+        """Return the normalized digital values producing linear ``img``.
+
+        ``out`` may be ``img`` itself.  The dense LUT is built on first use.
+        """
+        x = ie_as_float(img)
+        out = self._check(x, out, x.dtype)
+        if self._inverse is None:
+            self._inverse = _InverseGammaLUT(self.table, self.lut_size)
+        src = x.reshape(-1, x.shape[-1])
+        dst = out.reshape(src.shape)
+        for start in range(0, src.shape[0], self.chunk):
+            stop = start + self.chunk
+            self._inverse(src[start:stop], dst[start:stop])
+        return out
+
+
+def display_gamma(display: Display, lut_size: int = DEF_LUT_SIZE) -> DisplayGamma:
+    """Return the :class:`DisplayGamma` of ``display``.
+
+    The engine is built once and kept on the display.  It is rebuilt when
+    ``display.gamma`` is replaced or modified, or for a different
+    ``lut_size``.
+    """
+    if display.gamma is None:
+        raise ValueError("Display has no gamma table")
+    engine = getattr(display, "_gamma_engine", None)
+    if (
+        engine is None
+        or engine.lut_size != lut_size
+        or engine.shape != np.shape(display.gamma)
+        or not np.array_equal(engine.table.ravel(), np.ravel(display.gamma))
+    ):
+        engine = DisplayGamma(display.gamma, lut_size=lut_size)
+        display._gamma_engine = engine
+    return engine
+
+
+__all__ = ["DisplayGamma", "display_gamma"]
@@ -7,11 +7,18 @@ import numpy as np
 
 from .display_class import Display
 from .display_apply_gamma import display_apply_gamma
+from ..ie_precision import ie_as_float
 from ..rgb_to_xw_format import rgb_to_xw_format
 from ..xw_to_rgb_format import xw_to_rgb_format
 
 
-def display_render(image: np.ndarray, display: Display, apply_gamma: bool = True) -> np.ndarray:  # noqa: E501
+def display_render(
+    image: np.ndarray,
+    display: Display,
+    apply_gamma: bool = True,
+    *,
+    normalized: bool | None = None,
+) -> np.ndarray:
     """Return spectral radiance for ``image`` on ``display``.
 
     Parameters
@@ -23,14 +30,19 @@ def display_render(image: np.ndarray, display: Display, apply_gamma: bool = True
     apply_gamma : bool, optional
         When ``True`` apply ``display``'s gamma table to ``image`` before
         computing the spectral radiance.
+    normalized : bool, optional
+        Passed to :func:`display_apply_gamma`: ``True`` for drive values in
+        ``[0, 1]``, ``False`` for code values.  By default the image
+        maximum decides.
 
     Returns
     -------
     np.ndarray
         Spectral radiance image with one band per display wavelength.
-        The output has the same spatial organisation as ``image``.
+        The output has the same spatial organisation as ``image`` and keeps
+        its floating dtype (see :func:`ie_as_float`).
     """
-    img = np.asarray(image, dtype=float)
+    img = ie_as_float(image)
 
     if img.ndim == 3:
         reshape = True
@@ -42,9 +54,9 @@ def display_render(image: np.ndarray, display: Display, apply_gamma: bool = True
         raise ValueError("image must be (rows, cols, 3) or (n, 3)")
 
     if apply_gamma and display.gamma is not None:
-        xw = display_apply_gamma(xw, display)
+        xw = display_apply_gamma(xw, display, normalized=normalized)
 
-    spd = np.asarray(display.spd, dtype=float)
+    spd = np.asarray(display.spd, dtype=img.dtype)
     if spd.shape[1] != 3:
         raise ValueError("display.spd must have shape (n_wave, 3)")
 
@@ -39,7 +39,7 @@ def display_show_image(image: np.ndarray, display: Display):
 
     img = np.asarray(image, dtype=float)
     if display.gamma is not None:
-        img = display_apply_gamma(img, display)
+        img = display_apply_gamma(img, display, normalized=True)
 
     fig, ax = plt.subplots()
     ax.imshow(np.clip(img, 0.0, 1.0))
@@ -19,7 +19,7 @@ from .human_cone_isolating import human_cone_isolating
 from .human_cones import human_cones
 from .human_cone_mosaic import human_cone_mosaic
 from .human_cone_plot import human_cone_plot
-from .human_oi import human_oi
+from .human_oi import human_oi, human_oi_batch
 from .human_uv_safety import human_uv_safety
 from .watson_impulse_response import watson_impulse_response
 from .watson_rgc_spacing import watson_rgc_spacing
@@ -45,6 +45,7 @@ __all__ = [
     'human_cone_mosaic',
     'human_cone_plot',
     'human_oi',
+    'human_oi_batch',
     'human_uv_safety',
     'watson_impulse_response',
     'watson_rgc_spacing',
@@ -4,9 +4,7 @@
 from __future__ import annotations
 
 import numpy as np
-from ..ie_read_spectra import ie_read_spectra
-from ..data_path import data_path
-from ..quanta2energy import quanta_to_energy
+from ..ie_spectral_projector import ie_spectral_projector
 
 Units = "energy", "photons", "quanta"
 
@@ -43,12 +41,8 @@ def human_cone_contrast(
     if spd_signal.shape[0] != wave.size or spd_background.size != wave.size:
         raise ValueError("wave length must match spd dimensions")
 
-    if units.lower() in {"photons", "quanta"}:
-        spd_signal = quanta_to_energy(wave, spd_signal)
-        spd_background = quanta_to_energy(wave, spd_background)
-
-    cone_file = data_path("human/stockman.mat")
-    cones, _, _, _ = ie_read_spectra(cone_file, wave)
+    units = "photons" if units.lower() in {"photons", "quanta"} else "energy"
+    cones = ie_spectral_projector("lms", wave, units=units).matrix
 
     back_cones = cones.T @ spd_background
     sig_cones = cones.T @ spd_signal
@@ -3,14 +3,17 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+from itertools import chain, islice
+from typing import Iterable, Sequence
+
 import numpy as np
-from scipy.signal import fftconvolve
+from scipy.fft import irfft2, next_fast_len, rfft2
 
 from ..scene import Scene
-from ..optics import Optics, optics_cos4th, optics_otf
+from ..optics import optics_cos4th, optics_otf
 from ..opticalimage import (
     OpticalImage,
-    oi_spatial_support,
     oi_calculate_irradiance,
     oi_calculate_illuminance,
 )
@@ -19,19 +22,101 @@ from .human_otf import human_otf
 
 _DEF_FNUMBER = 4.0
 _DEF_FLENGTH = 0.017  # meters
+_DEF_PUPIL_RADIUS = 0.0015  # meters
+
+# Default working set of one batch in human_oi_batch.  Larger batches are
+# bound by memory traffic rather than by the FFTs.
+_BATCH_BYTES = 1 << 20
+
+
+@lru_cache(maxsize=16)
+def _human_psf(p_radius: float, wave: tuple) -> np.ndarray:
+    """Return the ``(rows, cols, n_wave)`` human PSF stack, read-only."""
+    otf, _, _ = human_otf(p_radius=p_radius, wave=np.asarray(wave))
+    psf = optics_otf(otf)
+    psf.setflags(write=False)
+    return psf
+
+
+@lru_cache(maxsize=16)
+def _human_psf_spectrum(
+    p_radius: float, wave: tuple, fshape: tuple, dtype: np.dtype
+) -> np.ndarray:
+    """Return the rfft2 of the PSF stack zero padded to ``fshape``."""
+    psf = _human_psf(p_radius, wave)
+    spec = rfft2(psf.astype(dtype, copy=False), s=fshape, axes=(0, 1))
+    spec.setflags(write=False)
+    return spec
+
+
+@lru_cache(maxsize=16)
+def _human_falloff(rows: int, cols: int, spacing: float) -> np.ndarray:
+    """Return the cos4th falloff of a ``rows x cols`` image, read-only."""
+    x = (np.arange(cols) - (cols - 1) / 2) * spacing
+    y = (np.arange(rows) - (rows - 1) / 2) * spacing
+    X, Y = np.meshgrid(x, y)
+    diag = np.sqrt(np.ptp(x) ** 2 + np.ptp(y) ** 2)
+    fall = optics_cos4th(X, Y, _DEF_FLENGTH, diag, _DEF_FNUMBER, magnification=0)
+    fall = np.ascontiguousarray(fall[..., np.newaxis])
+    fall.setflags(write=False)
+    return fall
+
+
+def _fft_shape(rows: int, cols: int, psf_shape: tuple) -> tuple:
+    """Return the padded FFT size of a linear convolution with the PSF."""
+    full = (rows + psf_shape[0] - 1, cols + psf_shape[1] - 1)
+    return tuple(next_fast_len(n, real=True) for n in full)
+
+
+def _human_blur(
+    photons: np.ndarray,
+    wave: np.ndarray,
+    spacing: float,
+    p_radius: float,
+    workers: int | None,
+) -> np.ndarray:
+    """Apply falloff and the human PSF to ``photons`` of shape ``(..., r, c, w)``.
+
+    All bands and leading frames are convolved in one batched FFT.  The
+    result equals a per-band ``fftconvolve(..., mode="same")``.
+    """
+    rows, cols = photons.shape[-3:-1]
+    wave_key = tuple(np.asarray(wave, dtype=float).tolist())
+    psf_shape = _human_psf(p_radius, wave_key).shape[:2]
+    fshape = _fft_shape(rows, cols, psf_shape)
+
+    photons = photons * _human_falloff(rows, cols, float(spacing))
+    spectrum = rfft2(photons, s=fshape, axes=(-3, -2), workers=workers)
+    spectrum *= _human_psf_spectrum(p_radius, wave_key, fshape, photons.dtype)
+    blurred = irfft2(spectrum, s=fshape, axes=(-3, -2), workers=workers)
+    r0 = (psf_shape[0] - 1) // 2
+    c0 = (psf_shape[1] - 1) // 2
+    return np.ascontiguousarray(blurred[..., r0 : r0 + rows, c0 : c0 + cols, :])
+
 
+def human_oi(
+    scene: Scene,
+    oi: OpticalImage | None = None,
+    *,
+    p_radius: float = _DEF_PUPIL_RADIUS,
+    workers: int | None = None,
+) -> OpticalImage:
+    """Return a human optical image computed from ``scene``.
 
-def human_oi(scene: Scene, oi: OpticalImage | None = None) -> OpticalImage:
-    """Return a human optical image computed from ``scene``."""
+    The human PSF stack and its Fourier transform are cached per pupil
+    radius, wavelength grid and padded image size, and the off-axis
+    falloff per image size and sample spacing, so repeated calls on
+    similar scenes only pay for the FFTs.  ``workers`` is passed to
+    :mod:`scipy.fft`.
+    """
     if scene is None:
         raise ValueError("scene is required")
 
+    wave = np.asarray(scene.wave, dtype=float)
     if oi is None:
-        photons = np.asarray(scene.photons, dtype=float).copy()
-        oi = OpticalImage(photons=photons, wave=np.asarray(scene.wave, dtype=float))
+        oi = OpticalImage(photons=np.zeros((0, 0, 0)), wave=wave)
     else:
-        oi.photons = np.asarray(scene.photons, dtype=float).copy()
-        oi.wave = np.asarray(scene.wave, dtype=float).copy()
+        oi.wave = wave.copy()
 
     if hasattr(scene, "fov"):
         oi.wangular = scene.fov
@@ -39,19 +124,118 @@ def human_oi(scene: Scene, oi: OpticalImage | None = None) -> OpticalImage:
     spacing = getattr(scene, "sample_spacing", 1.0)
     oi.sample_spacing = spacing
 
-    sup = oi_spatial_support(oi, units="meters")
-    X, Y = np.meshgrid(sup["x"], sup["y"])
-    diag = np.sqrt(np.ptp(sup["x"]) ** 2 + np.ptp(sup["y"]) ** 2)
-    fall = optics_cos4th(X, Y, _DEF_FLENGTH, diag, _DEF_FNUMBER, magnification=0)
-    oi.photons *= fall[..., np.newaxis]
-
-    otf, _, wave = human_otf(wave=oi.wave)
-    psf = optics_otf(otf)
-    for i in range(wave.size):
-        oi.photons[:, :, i] = fftconvolve(
-            oi.photons[:, :, i], psf[:, :, i], mode="same"
-        )
+    photons = np.asarray(scene.photons, dtype=float)
+    oi.photons = _human_blur(photons, oi.wave, spacing, p_radius, workers)
 
     oi.irradiance = oi_calculate_irradiance(oi)
     oi.illuminance = oi_calculate_illuminance(oi)
     return oi
+
+
+def _chunk_size(shape, wave: np.ndarray, p_radius: float) -> int:
+    """Return the number of frames of ``shape`` blurred in one batch."""
+    psf_shape = _human_psf(p_radius, tuple(wave.tolist())).shape[:2]
+    fr, fc = _fft_shape(shape[0], shape[1], psf_shape)
+    frame_bytes = 16 * fr * (fc // 2 + 1) * wave.size
+    return max(1, _BATCH_BYTES // frame_bytes)
+
+
+def _scene_photons(sc: Scene, ref) -> np.ndarray:
+    """Return the photons of ``sc`` after checking them against ``ref``."""
+    photons = np.asarray(sc.photons, dtype=float)
+    if (
+        photons.shape != ref[1]
+        or not np.array_equal(np.asarray(sc.wave, dtype=float).reshape(-1), ref[0])
+        or getattr(sc, "sample_spacing", 1.0) != ref[2]
+    ):
+        raise ValueError(
+            "All scenes must share the same shape, wavelengths and spacing"
+        )
+    return photons
+
+
+def human_oi_batch(
+    scenes: np.ndarray | Iterable[Scene],
+    *,
+    wave: Sequence[float] | None = None,
+    sample_spacing: float | None = None,
+    p_radius: float = _DEF_PUPIL_RADIUS,
+    chunk_size: int | None = None,
+    workers: int | None = None,
+) -> np.ndarray:
+    """Return the human optical image photons of many scenes.
+
+    Each frame equals ``human_oi(scene).photons``.  Frames are blurred
+    ``chunk_size`` at a time with one batched FFT per chunk, reusing the
+    cached PSF spectrum and falloff across the whole stack.  Scenes are
+    read and stacked one chunk at a time, so an iterable of scenes is
+    never held in memory as a whole.
+
+    Parameters
+    ----------
+    scenes : np.ndarray or iterable of Scene
+        Either a photon stack ``(frames, rows, cols, n_wave)`` together with
+        ``wave``, or an iterable of scenes sharing shape, wavelengths and
+        sample spacing.
+    wave : sequence of float, optional
+        Wavelength samples of a photon stack.
+    sample_spacing : float, optional
+        Sample spacing of a photon stack in meters.  Defaults to that of
+        the first scene, or 1.
+    p_radius : float, optional
+        Pupil radius in meters.
+    chunk_size : int, optional
+        Number of frames processed together.  By default it is chosen so
+        that the spectrum of a chunk stays within about a megabyte.
+    workers : int, optional
+        Forwarded to :mod:`scipy.fft`.
+
+    Returns
+    -------
+    np.ndarray
+        Photons with shape ``(frames, rows, cols, n_wave)``.
+    """
+    if chunk_size is not None and chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+    if isinstance(scenes, np.ndarray):
+        if scenes.ndim != 4:
+            raise ValueError("scene stack must have shape (frames, rows, cols, n_wave)")
+        if wave is None:
+            raise ValueError("wave is required for a photon stack")
+        stack = np.asarray(scenes, dtype=float)
+        wave = np.asarray(wave, dtype=float).reshape(-1)
+        if stack.shape[-1] != wave.size:
+            raise ValueError("wave length must match photons shape")
+        spacing = 1.0 if sample_spacing is None else sample_spacing
+        if chunk_size is None:
+            chunk_size = _chunk_size(stack.shape[1:3], wave, p_radius)
+        out = np.empty_like(stack)
+        for start in range(0, stack.shape[0], chunk_size):
+            out[start : start + chunk_size] = _human_blur(
+                stack[start : start + chunk_size], wave, spacing, p_radius, workers
+            )
+        return out
+
+    scenes = iter(scenes)
+    first = next(scenes, None)
+    if first is None:
+        raise ValueError("No scenes given")
+    wave = np.asarray(first.wave, dtype=float).reshape(-1)
+    shape = np.shape(first.photons)
+    ref = (wave, shape, getattr(first, "sample_spacing", 1.0))
+    if shape[-1] != wave.size:
+        raise ValueError("wave length must match photons shape")
+    spacing = ref[2] if sample_spacing is None else sample_spacing
+    if chunk_size is None:
+        chunk_size = _chunk_size(shape[:2], wave, p_radius)
+    frames = chain([first], scenes)
+    out = []
+    while True:
+        batch = [_scene_photons(sc, ref) for sc in islice(frames, chunk_size)]
+        if not batch:
+            break
+        out.append(_human_blur(np.stack(batch), wave, spacing, p_radius, workers))
+    return out[0] if len(out) == 1 else np.concatenate(out)
+
+
+__all__ = ["human_oi", "human_oi_batch"]
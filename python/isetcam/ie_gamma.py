@@ -3,12 +3,22 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 import numpy as np
 
 from .rgb_to_xw_format import rgb_to_xw_format
 from .xw_to_rgb_format import xw_to_rgb_format
 
 
+@lru_cache(maxsize=8)
+def _gamma_engine(data: bytes, shape: tuple):
+    """Return the gamma engine of a lookup table given by its bytes."""
+    from .display.display_gamma import DisplayGamma
+
+    return DisplayGamma(np.frombuffer(data, dtype=float).reshape(shape))
+
+
 def ie_gamma(img: np.ndarray, gamma: float | np.ndarray, inverse: bool = False) -> np.ndarray:
     """Apply or remove gamma correction.
 
@@ -51,26 +61,11 @@ def ie_gamma(img: np.ndarray, gamma: float | np.ndarray, inverse: bool = False)
         tbl = np.asarray(gamma, dtype=float)
         if tbl.ndim == 1:
             tbl = tbl[:, np.newaxis]
-        n_levels, g_channels = tbl.shape
         n_channels = xw.shape[1]
-        if g_channels == 1 and n_channels > 1:
-            tbl = np.tile(tbl, (1, n_channels))
-        elif g_channels != n_channels:
+        if tbl.shape[1] not in (1, n_channels):
             raise ValueError("Gamma table channel mismatch with image")
-
-        out = np.empty_like(xw)
-        if inverse:
-            inv_levels = np.linspace(0, 1, n_levels)
-            for i in range(n_channels):
-                out[:, i] = np.interp(xw[:, i], tbl[:, i], inv_levels)
-        else:
-            if xw.max() <= 1:
-                idx = np.round(xw * (n_levels - 1)).astype(int)
-            else:
-                idx = np.round(xw).astype(int)
-            idx = np.clip(idx, 0, n_levels - 1)
-            for i in range(n_channels):
-                out[:, i] = tbl[idx[:, i], i]
+        engine = _gamma_engine(tbl.tobytes(), tbl.shape)
+        out = engine.inverse(xw) if inverse else engine.forward(xw)
 
     if reshape:
         out = xw_to_rgb_format(out, rows, cols)
@@ -13,6 +13,7 @@ ISET_PREFS: Dict[str, Any] = {
     "waitbar": 0,
     "initClear": 0,
     "fontSize": 12,
+    "precision": "double",
 }
 
 
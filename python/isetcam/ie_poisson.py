@@ -65,6 +65,14 @@ def ie_poisson(
     tuple of np.ndarray and int
         ``(samples, seed)`` where ``samples`` contains the Poisson random
         values and ``seed`` is the seed used for generation.
+
+    Notes
+    -----
+    This function keeps its MATLAB-style seeding: one generator per call,
+    seeded by ``seed``.  Its samples therefore change when an image is
+    split into parts.  Use :func:`~isetcam.ie_noise.ie_noise_poisson`,
+    keyed on ``(seed, stream, frame, tile)``, for noise that is identical
+    for any split of a frame.
     """
     lam = np.asarray(lam, dtype=float)
 
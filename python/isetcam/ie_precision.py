@@ -0,0 +1,75 @@
+# mypy: ignore-errors
+"""Floating point precision policy for image data."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+
+from .ie_init_session import ISET_PREFS
+
+_PRECISIONS = {
+    "double": np.dtype(np.float64),
+    "float64": np.dtype(np.float64),
+    "single": np.dtype(np.float32),
+    "float32": np.dtype(np.float32),
+}
+
+
+def _to_dtype(precision: Any) -> np.dtype:
+    if isinstance(precision, str):
+        key = precision.replace(" ", "").lower()
+        if key not in _PRECISIONS:
+            raise ValueError("precision must be 'single' or 'double'")
+        return _PRECISIONS[key]
+    dtype = np.dtype(precision)
+    if dtype not in (np.float32, np.float64):
+        raise ValueError("precision must be float32 or float64")
+    return dtype
+
+
+def ie_precision(obj: Any = None) -> np.dtype:
+    """Return the floating point dtype used for the data of ``obj``.
+
+    The per-object ``precision`` attribute of a :class:`Scene`,
+    :class:`OpticalImage` or :class:`Sensor`, set with ``scene_set``,
+    ``oi_set`` or ``sensor_set``, takes priority.  When it is
+    ``None``, or no object is given, the session default set with
+    ``ie_session_set("precision", ...)`` is used.  The default is
+    ``"double"``.
+
+    Parameters
+    ----------
+    obj : object, optional
+        Object carrying an optional ``precision`` attribute.
+
+    Returns
+    -------
+    np.dtype
+        ``float32`` for ``"single"`` and ``float64`` for ``"double"``.
+    """
+    precision = getattr(obj, "precision", None)
+    if precision is None:
+        precision = ISET_PREFS.get("precision", "double")
+    return _to_dtype(precision)
+
+
+def ie_as_float(data: Any, dtype: Any = None) -> np.ndarray:
+    """Return ``data`` as a floating point array without needless copies.
+
+    With an explicit ``dtype`` (a precision name or numpy dtype) the data
+    are converted to it.  Otherwise ``float32`` and ``float64`` arrays are
+    returned unchanged and any other input is converted to the session
+    precision.  No copy is made when the input already has the target
+    dtype.
+    """
+    if dtype is not None:
+        return np.asarray(data, dtype=_to_dtype(dtype))
+    arr = np.asarray(data)
+    if arr.dtype in (np.float32, np.float64):
+        return arr
+    return arr.astype(ie_precision())
+
+
+__all__ = ["ie_precision", "ie_as_float"]
@@ -14,6 +14,8 @@ from typing import Iterable, Tuple
 import numpy as np
 from scipy.io import loadmat
 
+from .ie_spectra_cache import ie_spectra_cache_load
+
 
 def ie_read_spectra(
     fname: str | Path,
@@ -47,8 +49,31 @@ def ie_read_spectra(
         Comment string from the file if present, otherwise ``None``.
     fname:
         Path to the loaded file.
+
+    Notes
+    -----
+    Results are cached with :func:`ie_spectra_cache_load`, keyed by the file's
+    path and modification time together with ``wave``, ``extrap_val`` and
+    ``make_positive``.  Each call returns fresh copies of the arrays.
     """
     path = Path(fname)
+    wave_key = None
+    if wave is not None:
+        wave_key = tuple(np.asarray(list(wave), dtype=float).ravel())
+    key = ("ie_read_spectra", wave_key, float(extrap_val), bool(make_positive))
+    entry = ie_spectra_cache_load(
+        path, lambda p: _read_spectra(p, wave_key, extrap_val, make_positive), key
+    )
+    comment = str(entry["comment"]) if "comment" in entry else None
+    return entry["res"].copy(), entry["wave"].copy(), comment, path
+
+
+def _read_spectra(
+    path: Path,
+    wave: tuple | None,
+    extrap_val: float,
+    make_positive: bool,
+) -> dict:
     mat = loadmat(path)
 
     if "data" not in mat or "wavelength" not in mat:
@@ -67,7 +92,7 @@ def ie_read_spectra(
         wave_out = src_wave
         res = data.astype(float)
     else:
-        wave_out = np.asarray(list(wave), dtype=float).reshape(-1)
+        wave_out = np.asarray(wave, dtype=float)
         if data.ndim == 1:
             res = np.interp(wave_out, src_wave, data, left=extrap_val, right=extrap_val)
         else:
@@ -83,4 +108,4 @@ def ie_read_spectra(
         if np.mean(first) < 0:
             res = -res
 
-    return res, wave_out, comment, path
+    return {"res": res, "wave": wave_out, "comment": comment}
@@ -0,0 +1,198 @@
+# mypy: ignore-errors
+"""Rectangle statistics from summed-area tables."""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+import numpy as np
+
+# Relative rounding tolerance of the summed-area table differences.
+_VAR_RTOL = 64 * np.finfo(float).eps
+
+
+def _sat(plane: np.ndarray) -> np.ndarray:
+    """Return the summed-area table of ``plane`` with a leading zero row/col."""
+    out = np.zeros((plane.shape[0] + 1, plane.shape[1] + 1) + plane.shape[2:])
+    np.cumsum(plane, axis=0, out=out[1:, 1:])
+    np.cumsum(out[1:, 1:], axis=1, out=out[1:, 1:])
+    return out
+
+
+def _box(sat: np.ndarray, r0, r1, c0, c1) -> np.ndarray:
+    return sat[r1, c1] - sat[r0, c1] - sat[r1, c0] + sat[r0, c0]
+
+
+def _box_error(sat2: np.ndarray, r0, r1, c0, c1) -> tuple[np.ndarray, np.ndarray]:
+    """Return rounding scales of the box sums of values and of squares.
+
+    The corners of the table of squares bound the magnitude of the prefix
+    sums they are differences of; by Cauchy-Schwarz ``sqrt(count * sum2)``
+    bounds the prefix sums of the values.
+    """
+    e1 = np.zeros(sat2[r0, c0].shape)
+    e2 = np.zeros_like(e1)
+    for r in (r0, r1):
+        for c in (c0, c1):
+            corner = sat2[r, c]
+            e2 += corner
+            e1 += np.sqrt((r * c)[:, np.newaxis] * corner)
+    return e1, e2
+
+
+def _plane_mean(plane: np.ndarray) -> np.ndarray:
+    mean = plane.mean(axis=(0, 1))
+    if np.isnan(mean).any():
+        with np.errstate(invalid="ignore", divide="ignore"):
+            total = np.nansum(plane, axis=(0, 1))
+            mean = total / np.count_nonzero(~np.isnan(plane), axis=(0, 1))
+    return np.nan_to_num(mean)
+
+
+class ROIStats:
+    """Mean, variance and SNR of many rectangles of one frame.
+
+    Integral images of the values and of their squares are built once,
+    after which the statistics of any rectangle take a constant number of
+    lookups and no pixel data is copied.  The values are centered on the
+    mean of their channel before summing, which keeps the variance
+    accurate for large frames.  NaN pixels are ignored like in
+    ``np.nanmean``.
+
+    Parameters
+    ----------
+    data : np.ndarray
+        ``(rows, cols)`` or ``(rows, cols, channels)`` image.
+    pattern : array-like, optional
+        For a ``(rows, cols)`` mosaic, the ``(pr, pc)`` array of channel
+        indices of the repeating CFA pattern.  Statistics are then
+        returned per channel, pooling the pixels of every phase with the
+        same index.  Without a pattern a 2-D image has a single channel.
+    """
+
+    def __init__(self, data: np.ndarray, pattern: Sequence | None = None) -> None:
+        data = np.asarray(data, dtype=float)
+        if data.ndim not in (2, 3):
+            raise ValueError("data must be 2-D or 3-D")
+        self.shape = data.shape[:2]
+        if pattern is None:
+            pattern = np.zeros((1, 1), dtype=int)
+            planes = {(0, 0): data.reshape(self.shape + (-1,))}
+            channels = {(0, 0): np.arange(planes[(0, 0)].shape[2])}
+        else:
+            pattern = np.asarray(pattern, dtype=int)
+            if data.ndim != 2 or pattern.ndim != 2 or pattern.min() < 0:
+                raise ValueError("a CFA pattern needs 2-D data and channel indices")
+            pr, pc = pattern.shape
+            planes = {
+                (i, j): data[i::pr, j::pc, np.newaxis]
+                for i in range(min(pr, self.shape[0]))
+                for j in range(min(pc, self.shape[1]))
+            }
+            channels = {p: pattern[p].reshape(1) for p in planes}
+        self.period = pattern.shape
+        self.n_channels = int(max(c.max() for c in channels.values())) + 1
+
+        # One centering offset per channel, so that the sums of the phases
+        # sharing a channel add up directly.
+        self.shift = np.zeros(self.n_channels)
+        n_phases = np.zeros(self.n_channels)
+        for p, plane in planes.items():
+            self.shift[channels[p]] += _plane_mean(plane)
+            n_phases[channels[p]] += 1
+        self.shift /= np.maximum(n_phases, 1)
+
+        self._tables = []
+        for p, plane in planes.items():
+            ch = channels[p]
+            centered = plane - self.shift[ch]
+            valid = ~np.isnan(centered)
+            count = None
+            if not valid.all():
+                count = _sat(valid)
+                centered[~valid] = 0.0
+            sat1 = _sat(centered)
+            np.square(centered, out=centered)
+            self._tables.append((p, ch, count, sat1, _sat(centered)))
+
+    def _rois(self, rois) -> tuple[np.ndarray, bool]:
+        arr = np.asarray(rois, dtype=int)
+        single = arr.ndim == 1
+        arr = arr.reshape(-1, 4)
+        if np.any(arr[:, 2:] <= 0):
+            raise ValueError("width and height must be positive")
+        x, y, w, h = arr.T
+        rows, cols = self.shape
+        if np.any((x < 0) | (y < 0) | (x + w > cols) | (y + h > rows)):
+            raise ValueError("roi is outside the image bounds")
+        return arr, single
+
+    def moments(self, rois) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return the pixel count, mean and variance of ``rois``.
+
+        ``rois`` is one ``(x, y, width, height)`` rectangle in 0-based
+        pixels or an ``(n, 4)`` array of them.  Results are ``(n,
+        channels)`` arrays, or ``(channels,)`` for a single rectangle.
+        Channels without pixels in a rectangle have NaN mean and variance.
+        """
+        arr, single = self._rois(rois)
+        x, y, w, h = arr.T
+        shape = (arr.shape[0], self.n_channels)
+        n = np.zeros(shape)
+        s1 = np.zeros(shape)
+        s2 = np.zeros(shape)
+        e1 = np.zeros(shape)
+        e2 = np.zeros(shape)
+        pr, pc = self.period
+        for (i, j), ch, count, sat1, sat2 in self._tables:
+            # Index range, within the phase, of the pixels in the rectangle.
+            r0, r1 = -((i - y) // pr), -((i - y - h) // pr)
+            c0, c1 = -((j - x) // pc), -((j - x - w) // pc)
+            if count is None:
+                n[:, ch] += ((r1 - r0) * (c1 - c0))[:, np.newaxis]
+            else:
+                n[:, ch] += _box(count, r0, r1, c0, c1)
+            s1[:, ch] += _box(sat1, r0, r1, c0, c1)
+            s2[:, ch] += _box(sat2, r0, r1, c0, c1)
+            a, b = _box_error(sat2, r0, r1, c0, c1)
+            e1[:, ch] += a
+            e2[:, ch] += b
+        with np.errstate(divide="ignore", invalid="ignore"):
+            m = s1 / n
+            var = s2 / n - m * m
+            # Variances within the rounding error of the table differences
+            # are those of uniform regions.
+            tol = _VAR_RTOL * (e2 + 2 * np.abs(m) * e1) / n
+            var[var <= tol] = 0.0
+        mean = m + self.shift
+        mean[n == 0] = np.nan
+        var[n == 0] = np.nan
+        if single:
+            return n[0], mean[0], var[0]
+        return n, mean, var
+
+    def mean(self, rois) -> np.ndarray:
+        """Return the mean of ``rois`` per channel."""
+        return self.moments(rois)[1]
+
+    def var(self, rois) -> np.ndarray:
+        """Return the (population) variance of ``rois`` per channel."""
+        return self.moments(rois)[2]
+
+    def std(self, rois) -> np.ndarray:
+        """Return the standard deviation of ``rois`` per channel."""
+        return np.sqrt(self.var(rois))
+
+    def stats(self, rois) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return ``(mean, std, snr)`` of ``rois`` like :func:`sensor_stats`.
+
+        The SNR is ``mean / std`` and infinite where ``std`` is zero.
+        """
+        _, mean, var = self.moments(rois)
+        sd = np.sqrt(var)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            snr = np.where(sd == 0, np.inf, mean / sd)
+        return mean, sd, snr
+
+
+__all__ = ["ROIStats"]
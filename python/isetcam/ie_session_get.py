@@ -53,6 +53,8 @@ def ie_session_get(param: str, *args: Any) -> Any:
         return ISET_PREFS.get("fontSize", 12)
     if p in {"initclear", "init clear"}:
         return ISET_PREFS.get("initClear", 0)
+    if p == "precision":
+        return ISET_PREFS.get("precision", "double")
 
     if p == "selected":
         if not args:
@@ -5,7 +5,10 @@ from __future__ import annotations
 
 from typing import Any
 
+import numpy as np
+
 from .ie_init_session import vcSESSION, ISET_PREFS
+from .ie_precision import _to_dtype
 from .ie_param_format import ie_param_format
 
 
@@ -51,6 +54,10 @@ def ie_session_set(param: str, val: Any, *args: Any) -> None:
     if p in {"initclear", "init clear"}:
         ISET_PREFS["initClear"] = int(bool(val))
         return
+    if p == "precision":
+        dtype = np.dtype(_to_dtype(val))
+        ISET_PREFS["precision"] = "single" if dtype == np.float32 else "double"
+        return
 
     if p == "selected":
         if not args:
@@ -0,0 +1,163 @@
+# mypy: ignore-errors
+"""Process-wide cache for spectral data read from files."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+import numpy as np
+
+_UNSET = object()
+
+_CACHE: "OrderedDict[tuple, Dict[str, np.ndarray]]" = OrderedDict()
+_STATS = {"hits": 0, "misses": 0, "disk_hits": 0}
+# Guards ``_CACHE`` and ``_STATS`` against concurrent loads.
+_LOCK = threading.Lock()
+_CONFIG: Dict[str, Any] = {
+    "maxsize": 256,
+    "disk_dir": os.environ.get("ISETCAM_SPECTRA_CACHE") or None,
+}
+
+
+def _freeze(value: Dict[str, Any]) -> Dict[str, np.ndarray]:
+    out = {}
+    for name, arr in value.items():
+        if arr is None:
+            continue
+        arr = np.array(arr)
+        arr.setflags(write=False)
+        out[name] = arr
+    return out
+
+
+def _disk_file(key: tuple) -> Path | None:
+    disk_dir = _CONFIG["disk_dir"]
+    if disk_dir is None:
+        return None
+    digest = hashlib.sha1(repr(key).encode()).hexdigest()
+    return Path(disk_dir) / f"{digest}.npz"
+
+
+def ie_spectra_cache_load(
+    path: str | Path,
+    loader: Callable[[Path], Dict[str, Any]],
+    key: tuple = (),
+) -> Dict[str, np.ndarray]:
+    """Return ``loader(path)``, cached by file identity and ``key``.
+
+    The cache key combines the resolved path, its modification time and
+    size, and ``key``, which should describe any further processing done by
+    ``loader`` such as the target wavelength samples.  Editing the file
+    therefore invalidates its entries.  Results are kept in a process-wide
+    LRU and, when a cache directory is configured (see
+    :func:`ie_spectra_cache_configure`), also stored on disk as ``.npz``.
+
+    Parameters
+    ----------
+    path : str or Path
+        Data file.
+    loader : callable
+        Function reading ``path`` and returning a mapping from names to
+        arrays.  Entries that are ``None`` are dropped.
+    key : tuple, optional
+        Hashable description of the requested variant.
+
+    Returns
+    -------
+    dict of np.ndarray
+        The loaded arrays.  They are shared between callers and read-only;
+        copy them before modifying.
+    """
+    p = Path(path).resolve()
+    st = p.stat()
+    full_key = (str(p), st.st_mtime_ns, st.st_size, key)
+
+    with _LOCK:
+        value = _CACHE.get(full_key)
+        if value is not None:
+            _CACHE.move_to_end(full_key)
+            _STATS["hits"] += 1
+            return value
+
+    # Files are read outside the lock; concurrent misses may load twice.
+    disk = _disk_file(full_key)
+    if disk is not None and disk.is_file():
+        with np.load(disk, allow_pickle=False) as npz:
+            value = _freeze({name: npz[name] for name in npz.files})
+        stat = "disk_hits"
+    else:
+        stat = "misses"
+        value = _freeze(loader(p))
+        if disk is not None:
+            disk.parent.mkdir(parents=True, exist_ok=True)
+            tmp = disk.with_name(
+                f"{disk.stem}.{os.getpid()}.{threading.get_ident()}.tmp.npz"
+            )
+            np.savez(tmp, **value)
+            os.replace(tmp, disk)
+
+    with _LOCK:
+        _STATS[stat] += 1
+        _CACHE[full_key] = value
+        _CACHE.move_to_end(full_key)
+        while len(_CACHE) > _CONFIG["maxsize"]:
+            _CACHE.popitem(last=False)
+    return value
+
+
+def ie_spectra_cache_info() -> Dict[str, Any]:
+    """Return hit and miss counters and the cache configuration."""
+    return {
+        **_STATS,
+        "size": len(_CACHE),
+        "maxsize": _CONFIG["maxsize"],
+        "disk_dir": _CONFIG["disk_dir"],
+    }
+
+
+def ie_spectra_cache_clear(disk: bool = False) -> None:
+    """Empty the in-memory cache and reset the counters.
+
+    With ``disk=True`` the ``.npz`` files in the cache directory are
+    removed as well.
+    """
+    with _LOCK:
+        _CACHE.clear()
+        for name in _STATS:
+            _STATS[name] = 0
+    disk_dir = _CONFIG["disk_dir"]
+    if disk and disk_dir is not None and Path(disk_dir).is_dir():
+        for f in Path(disk_dir).glob("*.npz"):
+            f.unlink()
+
+
+def ie_spectra_cache_configure(
+    maxsize: int | None = None, disk_dir: Any = _UNSET
+) -> None:
+    """Set the LRU size and the on-disk cache directory.
+
+    ``disk_dir=None`` disables the disk cache.  Its initial value is taken
+    from the ``ISETCAM_SPECTRA_CACHE`` environment variable.
+    """
+    if maxsize is not None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be positive")
+        with _LOCK:
+            _CONFIG["maxsize"] = int(maxsize)
+            while len(_CACHE) > _CONFIG["maxsize"]:
+                _CACHE.popitem(last=False)
+    if disk_dir is not _UNSET:
+        _CONFIG["disk_dir"] = None if disk_dir is None else str(disk_dir)
+
+
+__all__ = [
+    "ie_spectra_cache_load",
+    "ie_spectra_cache_info",
+    "ie_spectra_cache_clear",
+    "ie_spectra_cache_configure",
+]
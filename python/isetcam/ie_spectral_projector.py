@@ -0,0 +1,138 @@
+# mypy: ignore-errors
+"""Cached linear maps from spectra to XYZ, LMS and luminance."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Sequence
+
+import numpy as np
+
+from .data_path import data_path
+from .ie_read_spectra import ie_read_spectra
+from .vc_constants import vc_constants
+from .vc_get_image_format import vc_get_image_format
+
+_DEF_BINWIDTH = 10
+
+# Observer name -> (data file, scale factor, multiply by the bin width,
+# single output channel).
+_OBSERVERS = {
+    "xyz": ("human/XYZ.mat", 683.0, True, False),
+    "luminance": ("human/luminosity.mat", 683.0, True, True),
+    "scotopic": ("human/rods.mat", 1745.0, True, True),
+    "lms": ("human/stockman.mat", 1.0, False, False),
+}
+
+
+@dataclass(frozen=True, eq=False)
+class SpectralProjector:
+    """Matrix projecting spectra sampled at ``wave`` onto an observer.
+
+    ``matrix`` has shape ``(n_wave, n_channels)``, or ``(n_wave,)`` for the
+    single-channel luminance observers, and already contains the observer
+    scale factor, the bin width and, for ``units='photons'``, the
+    photon-to-energy conversion.
+    """
+
+    observer: str
+    wave: np.ndarray
+    units: str
+    matrix: np.ndarray
+
+    def apply(self, data: np.ndarray) -> np.ndarray:
+        """Project ``data`` in RGB or XW format with a single matrix product.
+
+        The result has the spatial shape of ``data`` followed by the
+        channel axis, which is dropped for single-channel observers.
+        """
+        data = np.asarray(data)
+        if data.size == 0:
+            return np.array([])
+        n_wave = self.wave.size
+        img_format = vc_get_image_format(data, self.wave)
+        if img_format == "RGB":
+            if data.ndim == 2:
+                data = data[..., np.newaxis]
+            out = data.reshape(-1, data.shape[-1]) @ self.matrix
+            return out.reshape(data.shape[:2] + self.matrix.shape[1:])
+        if img_format == "XW":
+            if data.ndim == 1:
+                data = data[np.newaxis, :]
+            if data.shape[1] != n_wave:
+                if data.shape[0] == n_wave and data.shape[1] == 1:
+                    data = data.T
+                else:
+                    raise ValueError("Spectra must have wavelength columns")
+            return data @ self.matrix
+        raise ValueError("Unknown image format")
+
+
+@lru_cache(maxsize=32)
+def _projector(
+    observer: str, wave: tuple, units: str, binwidth: float | None
+) -> SpectralProjector:
+    fname, scale, use_binwidth, single = _OBSERVERS[observer]
+    w = np.asarray(wave, dtype=float)
+    basis, _, _, _ = ie_read_spectra(data_path(fname), w)
+    if basis.ndim == 1:
+        basis = basis[:, np.newaxis]
+    if single:
+        basis = basis[:, 0]
+
+    if use_binwidth:
+        if binwidth is None:
+            binwidth = w[1] - w[0] if w.size > 1 else _DEF_BINWIDTH
+        scale = scale * binwidth
+    weights = scale * np.ones_like(w)
+    if units == "photons":
+        weights = weights * (vc_constants("h") * vc_constants("c") / 1e-9) / w
+    matrix = basis * (weights if single else weights[:, np.newaxis])
+    matrix.setflags(write=False)
+    w.setflags(write=False)
+    return SpectralProjector(observer=observer, wave=w, units=units, matrix=matrix)
+
+
+def ie_spectral_projector(
+    observer: str,
+    wave: Sequence[float],
+    units: str = "energy",
+    binwidth: float | None = None,
+) -> SpectralProjector:
+    """Return the cached projector of ``observer`` on the grid ``wave``.
+
+    Parameters
+    ----------
+    observer : {'xyz', 'luminance', 'scotopic', 'lms'}
+        CIE 1931 XYZ, photopic luminance (cd/m^2), scotopic luminance or
+        Stockman LMS cone responses.
+    wave : sequence of float
+        Wavelength samples of the spectra in nanometers.
+    units : {'energy', 'photons', 'quanta'}, optional
+        Units of the spectra the projector is applied to.
+    binwidth : float, optional
+        Spectral bin width used by the XYZ and luminance observers.  By
+        default it is derived from ``wave``, or 10 nm for a single sample.
+
+    Returns
+    -------
+    SpectralProjector
+        Projectors are memoized per ``(observer, wave, units, binwidth)``
+        with least-recently-used eviction; their arrays are read-only.
+    """
+    key = observer.replace(" ", "").lower()
+    if key not in _OBSERVERS:
+        raise ValueError(f"Unknown observer '{observer}'")
+    u = units.lower()
+    if u == "quanta":
+        u = "photons"
+    if u not in {"energy", "photons"}:
+        raise ValueError("units must be 'energy' or 'photons'")
+    wave_key = tuple(np.asarray(wave, dtype=float).reshape(-1).tolist())
+    if binwidth is not None:
+        binwidth = float(binwidth)
+    return _projector(key, wave_key, u, binwidth)
+
+
+__all__ = ["SpectralProjector", "ie_spectral_projector"]
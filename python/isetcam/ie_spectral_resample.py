@@ -0,0 +1,82 @@
+# mypy: ignore-errors
+"""Resample spectral data between wavelength grids with a cached matrix."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Sequence
+
+import numpy as np
+
+
+@lru_cache(maxsize=64)
+def _resample_matrix(src: tuple[float, ...], tgt: tuple[float, ...]) -> np.ndarray:
+    src_wave = np.asarray(src, dtype=float)
+    tgt_wave = np.asarray(tgt, dtype=float)
+    # ``np.interp`` is linear in its sample values, so interpolating each
+    # unit vector yields the columns of the operator.  Every output sample
+    # depends on at most two neighbouring input samples.
+    eye = np.eye(src_wave.size)
+    mat = np.empty((src_wave.size, tgt_wave.size), dtype=float)
+    for k in range(src_wave.size):
+        mat[k] = np.interp(tgt_wave, src_wave, eye[k], left=0.0, right=0.0)
+    mat.setflags(write=False)
+    return mat
+
+
+def ie_spectral_resample_matrix(
+    src_wave: Sequence[float], tgt_wave: Sequence[float]
+) -> np.ndarray:
+    """Return the ``(n_src, n_tgt)`` linear interpolation matrix.
+
+    Right-multiplying spectra sampled at ``src_wave`` by this matrix gives
+    the result of ``np.interp(tgt_wave, src_wave, spectrum, left=0,
+    right=0)``.  Matrices are cached by wavelength-grid pair and returned
+    read-only.
+    """
+    src = tuple(np.asarray(src_wave, dtype=float).reshape(-1).tolist())
+    tgt = tuple(np.asarray(tgt_wave, dtype=float).reshape(-1).tolist())
+    return _resample_matrix(src, tgt)
+
+
+def ie_spectral_resample(
+    data: np.ndarray,
+    src_wave: Sequence[float],
+    tgt_wave: Sequence[float],
+    axis: int = -1,
+) -> np.ndarray:
+    """Linearly interpolate ``data`` along ``axis`` from ``src_wave`` to ``tgt_wave``.
+
+    Samples outside the range of ``src_wave`` are set to zero.  The whole
+    array is resampled with one matrix product.  When the two grids are
+    identical a copy of ``data`` is returned without interpolating.
+
+    Parameters
+    ----------
+    data : np.ndarray
+        Spectral data with ``len(src_wave)`` samples along ``axis``.
+    src_wave, tgt_wave : sequence of float
+        Source and target wavelength samples in nanometers.
+    axis : int, optional
+        Wavelength axis of ``data``.  Defaults to the last axis.
+
+    Returns
+    -------
+    np.ndarray
+        Data with ``len(tgt_wave)`` samples along ``axis``.  A new array
+        is returned even when the grids are equal.
+    """
+    data = np.asarray(data)
+    src = np.asarray(src_wave, dtype=float).reshape(-1)
+    tgt = np.asarray(tgt_wave, dtype=float).reshape(-1)
+    if data.shape[axis] != src.size:
+        raise ValueError("data length along axis must match src_wave")
+    if src.size == tgt.size and np.array_equal(src, tgt):
+        return data.copy()
+
+    mat = ie_spectral_resample_matrix(src, tgt)
+    moved = np.moveaxis(data, axis, -1)
+    return np.moveaxis(moved @ mat, -1, axis)
+
+
+__all__ = ["ie_spectral_resample", "ie_spectral_resample_matrix"]
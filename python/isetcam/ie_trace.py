@@ -0,0 +1,253 @@
+# mypy: ignore-errors
+"""Opt-in hierarchical timing and memory tracing of pipeline stages."""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+import numpy as np
+
+# The active trace.  ``None`` disables tracing, in which case
+# :func:`ie_trace_span` returns a shared no-op span.
+_ACTIVE: "IETrace | None" = None
+
+
+def _describe(value: Any) -> Any:
+    """Return a JSON friendly summary of an attribute value."""
+    if isinstance(value, np.ndarray) or hasattr(value, "__array_interface__"):
+        arr = np.asanyarray(value)
+        return {"shape": list(arr.shape), "dtype": str(arr.dtype), "nbytes": arr.nbytes}
+    if isinstance(value, (bool, int, float, str)) or value is None:
+        return value
+    return str(value)
+
+
+@dataclass
+class TraceSpan:
+    """One traced region.
+
+    Times are in seconds relative to the start of the trace.  ``alloc_bytes``
+    is the net change of traced memory over the span and ``peak_bytes`` the
+    peak above the memory in use when the span started; both are ``None``
+    unless the trace records memory.
+    """
+
+    name: str
+    start: float
+    duration: float = 0.0
+    depth: int = 0
+    parent: int | None = None
+    thread: int = 0
+    alloc_bytes: int | None = None
+    peak_bytes: int | None = None
+    attrs: Dict[str, Any] = field(default_factory=dict)
+
+
+class _NullSpan:
+    """Span returned while tracing is disabled; every method is a no-op."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def note(self, **attrs) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("_trace", "_span", "_index", "_mem0", "_peak")
+
+    def __init__(self, trace: "IETrace", name: str, attrs: Dict[str, Any]):
+        self._trace = trace
+        attrs = {k: _describe(v) for k, v in attrs.items()}
+        self._span = TraceSpan(name, 0.0, attrs=attrs)
+
+    def note(self, **attrs) -> None:
+        """Attach attributes, e.g. the arrays produced by the span."""
+        self._span.attrs.update({k: _describe(v) for k, v in attrs.items()})
+
+    def __enter__(self):
+        trace = self._trace
+        stack = trace._stack()
+        span = self._span
+        span.depth = len(stack)
+        span.parent = stack[-1]._index if stack else None
+        span.thread = threading.get_ident()
+        if trace.memory:
+            cur, peak = tracemalloc.get_traced_memory()
+            if stack:
+                stack[-1]._peak = max(stack[-1]._peak, peak)
+            tracemalloc.reset_peak()
+            self._mem0 = self._peak = cur
+        with trace._lock:
+            self._index = len(trace.spans)
+            trace.spans.append(span)
+        stack.append(self)
+        span.start = time.perf_counter() - trace._t0
+        return self
+
+    def __exit__(self, *exc):
+        trace = self._trace
+        span = self._span
+        span.duration = time.perf_counter() - trace._t0 - span.start
+        stack = trace._stack()
+        stack.pop()
+        if trace.memory:
+            cur, peak = tracemalloc.get_traced_memory()
+            peak = max(self._peak, peak)
+            span.alloc_bytes = int(cur - self._mem0)
+            span.peak_bytes = int(peak - self._mem0)
+            # Children reset the tracemalloc peak, so it is handed upwards.
+            if stack:
+                stack[-1]._peak = max(stack[-1]._peak, peak)
+            tracemalloc.reset_peak()
+        return False
+
+
+class IETrace:
+    """Spans recorded while tracing is enabled.
+
+    Use :func:`ie_trace` to enable tracing around a block of code.  Spans
+    opened by :func:`ie_trace_span` nest per thread and are stored in the
+    order they were entered.
+    """
+
+    def __init__(self, memory: bool = False):
+        self.memory = bool(memory)
+        self.spans: List[TraceSpan] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._t0 = time.perf_counter()
+
+    def _stack(self) -> list:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Return per-name totals.
+
+        Each entry holds the number of ``calls``, the ``total`` time in
+        seconds and the ``self`` time, which excludes time spent in child
+        spans.
+        """
+        child = [0.0] * len(self.spans)
+        for span in self.spans:
+            if span.parent is not None:
+                child[span.parent] += span.duration
+        out: Dict[str, Dict[str, float]] = {}
+        for span, inner in zip(self.spans, child):
+            entry = out.setdefault(span.name, {"calls": 0, "total": 0.0, "self": 0.0})
+            entry["calls"] += 1
+            entry["total"] += span.duration
+            entry["self"] += span.duration - inner
+        return out
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Return the spans in the Chrome trace event format.
+
+        The result can be saved as JSON and opened in ``chrome://tracing``
+        or Perfetto.  Every span becomes a complete (``"X"``) event with
+        microsecond timestamps; memory figures and attributes are stored in
+        the event ``args``.
+        """
+        pid = os.getpid()
+        events = []
+        for span in self.spans:
+            args = dict(span.attrs)
+            if span.alloc_bytes is not None:
+                args["alloc_bytes"] = span.alloc_bytes
+                args["peak_bytes"] = span.peak_bytes
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": "isetcam",
+                    "ph": "X",
+                    "ts": span.start * 1e6,
+                    "dur": span.duration * 1e6,
+                    "pid": pid,
+                    "tid": span.thread,
+                    "args": args,
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def save_chrome_trace(self, path: str | Path) -> None:
+        """Write :meth:`to_chrome_trace` to ``path`` as JSON."""
+        Path(path).write_text(json.dumps(self.to_chrome_trace()))
+
+
+def ie_trace_span(name: str, **attrs):
+    """Return a context manager tracing the enclosed code as ``name``.
+
+    Keyword arguments are stored with the span; arrays are recorded by
+    shape, dtype and size only.  More attributes can be attached with the
+    span's ``note`` method.  While tracing is disabled a shared no-op span
+    is returned, so instrumented code pays only for this call.
+    """
+    trace = _ACTIVE
+    if trace is None:
+        return _NULL_SPAN
+    return _Span(trace, name, attrs)
+
+
+def ie_trace_enabled() -> bool:
+    """Return ``True`` while a trace is recording."""
+    return _ACTIVE is not None
+
+
+@contextmanager
+def ie_trace(memory: bool = False) -> Iterator[IETrace]:
+    """Record the spans opened inside the ``with`` block.
+
+    Parameters
+    ----------
+    memory : bool, optional
+        Also record the memory allocated by each span using
+        :mod:`tracemalloc`.  This slows down the traced code considerably
+        and the figures are process wide, so spans running concurrently in
+        other threads are included.
+
+    Yields
+    ------
+    IETrace
+        The trace collecting the spans.  A nested ``ie_trace`` block records
+        into its own trace and restores the outer one on exit.
+    """
+    global _ACTIVE
+    trace = IETrace(memory=memory)
+    started = memory and not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    previous, _ACTIVE = _ACTIVE, trace
+    try:
+        yield trace
+    finally:
+        _ACTIVE = previous
+        if started:
+            tracemalloc.stop()
+
+
+__all__ = [
+    "IETrace",
+    "TraceSpan",
+    "ie_trace",
+    "ie_trace_span",
+    "ie_trace_enabled",
+]
@@ -3,11 +3,11 @@
 
 from __future__ import annotations
 
-from pathlib import Path
 import numpy as np
-from scipy.io import loadmat
 
 from .data_path import data_path
+from .ie_read_spectra import ie_read_spectra
+from .ie_spectral_projector import ie_spectral_projector
 
 from .vc_get_image_format import vc_get_image_format
 from .rgb_to_xw_format import rgb_to_xw_format
@@ -16,12 +16,7 @@ from .xw_to_rgb_format import xw_to_rgb_format
 
 def _xyz_color_matching(wave: np.ndarray) -> np.ndarray:
     """Interpolate the CIE XYZ color matching functions to ``wave``."""
-    data = loadmat(data_path("human/XYZ.mat"))
-    src_wave = data["wavelength"].ravel()
-    xyz = data["data"]
-    cmf = np.zeros((len(wave), 3))
-    for i in range(3):
-        cmf[:, i] = np.interp(wave, src_wave, xyz[:, i], left=0.0, right=0.0)
+    cmf, _, _, _ = ie_read_spectra(data_path("human/XYZ.mat"), wave)
     return cmf
 
 
@@ -46,7 +41,6 @@ def ie_xyz_from_energy(energy: np.ndarray, wavelength: np.ndarray) -> np.ndarray
         return np.array([])
 
     wave = np.asarray(wavelength).reshape(-1)
-    cmf = _xyz_color_matching(wave)
 
     img_format = vc_get_image_format(energy, wave)
     if img_format == "RGB":
@@ -60,8 +54,7 @@ def ie_xyz_from_energy(energy: np.ndarray, wavelength: np.ndarray) -> np.ndarray
     if xw.shape[1] != len(wave):
         raise ValueError("Energy must be arranged with wavelength columns")
 
-    binwidth = wave[1] - wave[0] if len(wave) > 1 else 10
-    xyz = 683 * xw.dot(cmf) * binwidth
+    xyz = xw @ ie_spectral_projector("xyz", wave).matrix
 
     if img_format == "RGB":
         return xw_to_rgb_format(xyz, r, c)
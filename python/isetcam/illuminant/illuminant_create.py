@@ -9,6 +9,7 @@ import numpy as np
 from scipy.io import loadmat
 
 from ..data_path import data_path
+from ..ie_spectra_cache import ie_spectra_cache_load
 
 from .illuminant_class import Illuminant
 
@@ -16,11 +17,14 @@ from .illuminant_class import Illuminant
 _DEF_DIR = 'data'
 
 
-def _load_spd(path: Path) -> tuple[np.ndarray, np.ndarray]:
+def _read_spd(path: Path) -> dict:
     data = loadmat(path)
-    wave = data['wavelength'].ravel()
-    spd = data['data'].ravel()
-    return wave, spd
+    return {'wave': data['wavelength'].ravel(), 'spd': data['data'].ravel()}
+
+
+def _load_spd(path: Path) -> tuple[np.ndarray, np.ndarray]:
+    entry = ie_spectra_cache_load(path, _read_spd, ('illuminant',))
+    return entry['wave'].copy(), entry['spd'].copy()
 
 
 def illuminant_create(name: str, wave: np.ndarray | None = None) -> Illuminant:
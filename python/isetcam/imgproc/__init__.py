@@ -10,6 +10,8 @@ from .demosaic import (
     ie_bilinear,
     adaptive_laplacian,
     bayer_indices,
+    bayer_masks,
+    bayer_phases,
     pocs,
     faulty_insert,
     faulty_list,
@@ -23,6 +25,8 @@ __all__ = [
     "ie_bilinear",
     "adaptive_laplacian",
     "bayer_indices",
+    "bayer_masks",
+    "bayer_phases",
     "pocs",
     "faulty_insert",
     "faulty_list",
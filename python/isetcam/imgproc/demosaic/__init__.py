@@ -5,6 +5,7 @@ from .ie_nearest_neighbor import ie_nearest_neighbor
 from .ie_bilinear import ie_bilinear
 from .adaptive_laplacian import adaptive_laplacian
 from .bayer_indices import bayer_indices
+from .bayer_masks import bayer_masks, bayer_phases
 from .pocs import pocs
 from .faulty_pixel import (
     faulty_insert,
@@ -17,6 +18,8 @@ __all__ = [
     "ie_bilinear",
     "adaptive_laplacian",
     "bayer_indices",
+    "bayer_masks",
+    "bayer_phases",
     "pocs",
     "faulty_insert",
     "faulty_list",
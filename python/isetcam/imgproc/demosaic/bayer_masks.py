@@ -0,0 +1,83 @@
+# mypy: ignore-errors
+"""Cached color masks and sub-lattice views for Bayer mosaics."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+
+_CHANNELS = "rgb"
+_PATTERNS = {"rggb", "bggr", "gbrg", "grbg"}
+
+
+def _check_pattern(pattern: str) -> str:
+    pattern = pattern.lower()
+    if pattern not in _PATTERNS:
+        raise ValueError("Unsupported CFA pattern")
+    return pattern
+
+
+@lru_cache(maxsize=None)
+def _phases(pattern: str) -> Dict[str, Tuple[Tuple[int, int], ...]]:
+    phases: Dict[str, List[Tuple[int, int]]] = {ch: [] for ch in _CHANNELS}
+    for k, ch in enumerate(pattern):
+        phases[ch].append((k // 2, k % 2))
+    return {ch: tuple(p) for ch, p in phases.items()}
+
+
+def bayer_phases(pattern: str) -> Dict[str, Tuple[Tuple[int, slice, slice], ...]]:
+    """Return the sub-lattice slices of each color in a Bayer ``pattern``.
+
+    Parameters
+    ----------
+    pattern : str
+        CFA pattern such as ``"rggb"``.
+
+    Returns
+    -------
+    dict
+        Mapping from ``"r"``, ``"g"`` and ``"b"`` to tuples of
+        ``(row_slice, col_slice)`` pairs.  Indexing a mosaic with a pair,
+        ``bayer[rs, cs]``, returns a strided view of one CFA phase.
+    """
+    pattern = _check_pattern(pattern)
+    return {
+        ch: tuple((slice(i, None, 2), slice(j, None, 2)) for i, j in p)
+        for ch, p in _phases(pattern).items()
+    }
+
+
+@lru_cache(maxsize=32)
+def _masks(pattern: str, rows: int, cols: int) -> Tuple[np.ndarray, ...]:
+    masks = np.zeros((len(_CHANNELS), rows, cols), dtype=bool)
+    for c, slices in enumerate(bayer_phases(pattern).values()):
+        for rs, cs in slices:
+            masks[c, rs, cs] = True
+    masks.setflags(write=False)
+    return tuple(masks)
+
+
+def bayer_masks(
+    pattern: str, shape: Sequence[int]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return boolean R, G and B site masks for a Bayer mosaic.
+
+    Masks are cached by ``(pattern, shape)`` and returned read-only, so
+    repeated calls for frames of the same size cost nothing.
+
+    Parameters
+    ----------
+    pattern : str
+        CFA pattern such as ``"rggb"``.
+    shape : sequence of int
+        ``(rows, cols)`` of the mosaic.
+    """
+    pattern = _check_pattern(pattern)
+    rows, cols = (int(v) for v in shape[:2])
+    return _masks(pattern, rows, cols)
+
+
+__all__ = ["bayer_masks", "bayer_phases"]
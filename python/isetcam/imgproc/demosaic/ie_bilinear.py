@@ -5,10 +5,57 @@ from __future__ import annotations
 
 import numpy as np
 
+from .bayer_masks import bayer_masks, bayer_phases
+
+
+def _box3(x: np.ndarray) -> np.ndarray:
+    """Return the zero-padded 3x3 box sum over the row and column axes of ``x``.
+
+    ``x`` is laid out as ``(..., rows, cols, channels)``.  The box kernel is
+    separable, so it is applied as two 1-D passes.
+    """
+    out = x.copy()
+    out[..., 1:, :, :] += x[..., :-1, :, :]
+    out[..., :-1, :, :] += x[..., 1:, :, :]
+    tmp = out.copy()
+    out[..., 1:, :] += tmp[..., :-1, :]
+    out[..., :-1, :] += tmp[..., 1:, :]
+    return out
+
+
+def _bilinear(bayer: np.ndarray, pattern: str) -> np.ndarray:
+    """Bilinear demosaic of ``bayer`` with shape ``(..., rows, cols)``.
+
+    Leading axes are treated as independent frames.  Returns float data with
+    shape ``(..., rows, cols, 3)``; ``float32`` input stays ``float32``.
+    """
+    rows, cols = bayer.shape[-2:]
+    masks = np.stack(bayer_masks(pattern, (rows, cols)), axis=-1)
+
+    dtype = bayer.dtype if bayer.dtype == np.float32 else np.dtype(float)
+    rgb = np.zeros(bayer.shape + (3,), dtype=dtype)
+    for c, slices in enumerate(bayer_phases(pattern).values()):
+        for rs, cs in slices:
+            rgb[..., rs, cs, c] = bayer[..., rs, cs]
+
+    weights = np.broadcast_to(masks, rgb.shape).astype(dtype)
+    weights[..., 1] = rgb[..., 1] != 0
+    sums = _box3(rgb)
+    counts = _box3(weights)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        interp = np.where(counts > 0, sums / counts, rgb)
+    return np.where(masks, rgb, interp)
+
 
 def ie_bilinear(bayer: np.ndarray, pattern: str) -> np.ndarray:
     """Demosaic ``bayer`` using simple bilinear interpolation.
 
+    Every missing sample is the mean of the same-color samples in its 3x3
+    neighbourhood.  For a Bayer mosaic these are the horizontal, vertical or
+    diagonal neighbours depending on the site, so all three planes are
+    computed with the same separable box filter.  Green neighbours equal to
+    zero are ignored.
+
     Parameters
     ----------
     bayer : np.ndarray
@@ -26,110 +73,7 @@ def ie_bilinear(bayer: np.ndarray, pattern: str) -> np.ndarray:
         raise ValueError("bayer must be a 2-D array")
 
     dtype = bayer.dtype
-    bayer = bayer.astype(float)
-    rows, cols = bayer.shape
-
-    pattern = pattern.lower()
-    if pattern not in {"rggb", "bggr", "grbg", "gbrg"}:
-        raise ValueError("Unsupported CFA pattern")
-
-    grid = np.array([[pattern[0], pattern[1]], [pattern[2], pattern[3]]])
-
-    r = np.zeros((rows, cols), float)
-    g = np.zeros((rows, cols), float)
-    b = np.zeros((rows, cols), float)
-
-    for i in range(rows):
-        for j in range(cols):
-            ch = grid[i % 2, j % 2]
-            if ch == "r":
-                r[i, j] = bayer[i, j]
-            elif ch == "g":
-                g[i, j] = bayer[i, j]
-            else:
-                b[i, j] = bayer[i, j]
-
-    r_pos = b_pos = (0, 0)
-    for rr in range(2):
-        for cc in range(2):
-            ch = grid[rr, cc]
-            if ch == "r":
-                r_pos = (rr, cc)
-            if ch == "b":
-                b_pos = (rr, cc)
-
-    g_new = g.copy()
-    for i in range(rows):
-        for j in range(cols):
-            if grid[i % 2, j % 2] != "g":
-                total = 0.0
-                count = 0
-                for di, dj in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                    ii, jj = i + di, j + dj
-                    if 0 <= ii < rows and 0 <= jj < cols and g[ii, jj] != 0:
-                        total += g[ii, jj]
-                        count += 1
-                if count > 0:
-                    g_new[i, j] = total / count
-    g = g_new
-
-    r_new = r.copy()
-    for i in range(rows):
-        for j in range(cols):
-            if grid[i % 2, j % 2] == "r":
-                continue
-            if grid[i % 2, j % 2] == "g":
-                if i % 2 == r_pos[0]:
-                    vals = [
-                        r[i, j - 1] if j - 1 >= 0 else None,
-                        r[i, j + 1] if j + 1 < cols else None,
-                    ]
-                else:
-                    vals = [
-                        r[i - 1, j] if i - 1 >= 0 else None,
-                        r[i + 1, j] if i + 1 < rows else None,
-                    ]
-            else:  # blue location
-                vals = [
-                    r[i - 1, j - 1] if i - 1 >= 0 and j - 1 >= 0 else None,
-                    r[i - 1, j + 1] if i - 1 >= 0 and j + 1 < cols else None,
-                    r[i + 1, j - 1] if i + 1 < rows and j - 1 >= 0 else None,
-                    r[i + 1, j + 1] if i + 1 < rows and j + 1 < cols else None,
-                ]
-            vals = [v for v in vals if v is not None]
-            if vals:
-                r_new[i, j] = sum(vals) / len(vals)
-    r = r_new
-
-    b_new = b.copy()
-    for i in range(rows):
-        for j in range(cols):
-            if grid[i % 2, j % 2] == "b":
-                continue
-            if grid[i % 2, j % 2] == "g":
-                if i % 2 == b_pos[0]:
-                    vals = [
-                        b[i, j - 1] if j - 1 >= 0 else None,
-                        b[i, j + 1] if j + 1 < cols else None,
-                    ]
-                else:
-                    vals = [
-                        b[i - 1, j] if i - 1 >= 0 else None,
-                        b[i + 1, j] if i + 1 < rows else None,
-                    ]
-            else:  # red location
-                vals = [
-                    b[i - 1, j - 1] if i - 1 >= 0 and j - 1 >= 0 else None,
-                    b[i - 1, j + 1] if i - 1 >= 0 and j + 1 < cols else None,
-                    b[i + 1, j - 1] if i + 1 < rows and j - 1 >= 0 else None,
-                    b[i + 1, j + 1] if i + 1 < rows and j + 1 < cols else None,
-                ]
-            vals = [v for v in vals if v is not None]
-            if vals:
-                b_new[i, j] = sum(vals) / len(vals)
-    b = b_new
-
-    rgb = np.stack([r, g, b], axis=2)
+    rgb = _bilinear(bayer, pattern)
     if np.issubdtype(dtype, np.integer):
         rgb = np.rint(rgb).astype(dtype)
     return rgb
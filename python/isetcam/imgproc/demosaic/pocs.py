@@ -7,26 +7,11 @@ import numpy as np
 from scipy.signal import convolve2d
 
 from .ie_bilinear import ie_bilinear
+from .bayer_masks import bayer_masks
 
 
 def _bayer_masks(pattern: str, rows: int, cols: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
-    pattern = pattern.lower()
-    if pattern not in {"rggb", "bggr", "gbrg", "grbg"}:
-        raise ValueError("Unsupported CFA pattern")
-    grid = np.array([[pattern[0], pattern[1]], [pattern[2], pattern[3]]])
-    r = np.zeros((rows, cols), bool)
-    g = np.zeros((rows, cols), bool)
-    b = np.zeros((rows, cols), bool)
-    for i in range(rows):
-        for j in range(cols):
-            ch = grid[i % 2, j % 2]
-            if ch == "r":
-                r[i, j] = True
-            elif ch == "g":
-                g[i, j] = True
-            else:
-                b[i, j] = True
-    return r, g, b
+    return bayer_masks(pattern, (rows, cols))
 
 
 def _rdwt2(x: np.ndarray, h0: np.ndarray, h1: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
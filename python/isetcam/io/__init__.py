@@ -4,7 +4,7 @@
 from .openexr_read import openexr_read
 from .openexr_write import openexr_write
 from .pfm_read import pfm_read
-from .dng_read import dng_read
+from .dng_read import dng_read, dng_read_raw, dng_read_stack
 from .dng_write import dng_write
 from .pfm_write import pfm_write
 from .color_filter import ie_read_color_filter, ie_save_color_filter
@@ -18,6 +18,8 @@ __all__ = [
     "pfm_read",
     "pfm_write",
     "dng_read",
+    "dng_read_raw",
+    "dng_read_stack",
     "dng_write",
     "ie_read_color_filter",
     "ie_save_color_filter",
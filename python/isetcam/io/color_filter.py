@@ -10,6 +10,8 @@ import numpy as np
 from scipy.io import loadmat, savemat
 import h5py
 
+from ..ie_spectra_cache import ie_spectra_cache_load
+
 
 def _read_mat(path: Path) -> tuple[np.ndarray, np.ndarray, List[str]]:
     """Read a MAT-file returning ``(data, wave, names)``."""
@@ -69,13 +71,19 @@ def _read_txt(path: Path) -> tuple[np.ndarray, np.ndarray, List[str]]:
     return data, wave, names
 
 
+def _read_filter_file(path: Path) -> dict:
+    if path.suffix.lower() == ".mat":
+        data, wave, names = _read_mat(path)
+    else:
+        data, wave, names = _read_txt(path)
+    return {"data": data, "wave": wave, "names": np.array(names, dtype=str)}
+
+
 def ie_read_color_filter(path: str | Path, wave: Iterable[float] | None = None) -> tuple[np.ndarray, List[str], np.ndarray]:
     """Load filter spectra from ``path`` and interpolate to ``wave``."""
-    p = Path(path)
-    if p.suffix.lower() == ".mat":
-        data, src_wave, names = _read_mat(p)
-    else:
-        data, src_wave, names = _read_txt(p)
+    entry = ie_spectra_cache_load(Path(path), _read_filter_file, ("color_filter",))
+    data, src_wave = entry["data"].copy(), entry["wave"].copy()
+    names = [str(n) for n in entry["names"]]
     if wave is None:
         out_wave = src_wave
         res = data
@@ -3,7 +3,10 @@
 
 from __future__ import annotations
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any, Dict, Iterable, List, Tuple
 
 import numpy as np
 
@@ -13,22 +16,121 @@ except Exception:  # pragma: no cover - library may not be present
     rawpy = None  # type: ignore
 
 
-def dng_read(path: str | Path) -> np.ndarray:
-    """Load ``path`` and return the raw pixel data.
+def _metadata(raw) -> Dict[str, Any]:
+    """Return the capture metadata of an open rawpy image."""
+    meta = getattr(raw, "metadata", None)
+    black_level = getattr(meta, "black_level_per_channel", None)
+    if black_level is None:
+        black_level = getattr(raw, "black_level_per_channel", None)
+    return {
+        "iso_speed": getattr(meta, "iso_speed", None),
+        "exposure": getattr(meta, "exposure", None),
+        "orientation": getattr(meta, "orientation", None),
+        "black_level": black_level,
+        "white_level": getattr(raw, "white_level", None),
+    }
+
+
+def dng_read_raw(
+    path: str | Path, out: np.ndarray | None = None
+) -> Tuple[np.ndarray, Dict[str, Any]]:
+    """Load the raw pixel data and the metadata of ``path`` in one pass.
 
     Parameters
     ----------
     path:
         File to read.
+    out:
+        Optional ``uint16`` array receiving the pixels, for example a slice
+        of a preallocated stack.  Its shape must match the image.
 
     Returns
     -------
-    numpy.ndarray
-        ``(H, W)`` array of ``uint16`` values containing the raw sensor data.
+    tuple
+        The ``(H, W)`` ``uint16`` raw data and a dictionary with the
+        ``iso_speed``, ``exposure``, ``orientation``, ``black_level`` and
+        ``white_level`` of the capture (``None`` when not recorded).
     """
     if rawpy is None:  # pragma: no cover - dependency missing
         raise RuntimeError("rawpy library is not available")
     p = Path(path)
     with rawpy.imread(str(p)) as raw:
-        data = np.asarray(raw.raw_image, dtype=np.uint16)
-    return data
+        # ``raw_image`` is only valid while the file is open, so the pixels
+        # are always copied out.
+        img = raw.raw_image
+        if out is None:
+            data = np.array(img, dtype=np.uint16)
+        else:
+            if out.shape != img.shape:
+                raise ValueError(f"{p.name}: image shape differs from out")
+            np.copyto(out, img, casting="unsafe")
+            data = out
+        meta = _metadata(raw)
+    return data, meta
+
+
+def dng_read(path: str | Path) -> np.ndarray:
+    """Load ``path`` and return the raw pixel data.
+
+    Parameters
+    ----------
+    path:
+        File to read.
+
+    Returns
+    -------
+    numpy.ndarray
+        ``(H, W)`` array of ``uint16`` values containing the raw sensor data.
+    """
+    return dng_read_raw(path)[0]
+
+
+def _dng_paths(paths: str | Path | Iterable[str | Path]) -> List[Path]:
+    if isinstance(paths, (str, Path)):
+        p = Path(paths)
+        if not p.is_dir():
+            return [p]
+        return sorted(f for f in p.iterdir() if f.suffix.lower() == ".dng")
+    return [Path(p) for p in paths]
+
+
+def dng_read_stack(
+    paths: str | Path | Iterable[str | Path],
+    workers: int | None = None,
+) -> Tuple[np.ndarray, List[Dict[str, Any]]]:
+    """Load a sequence of DNG files of equal size into one array.
+
+    Parameters
+    ----------
+    paths:
+        Files to read, or a directory whose ``.dng`` files are read in
+        name order.
+    workers:
+        Number of reader threads.  Defaults to the number of CPUs.
+
+    Returns
+    -------
+    tuple
+        A ``(N, H, W)`` ``uint16`` stack and the metadata dictionaries of
+        the files as returned by :func:`dng_read_raw`.  The first file
+        sets the stack shape; every file is decoded straight into its
+        slice.
+    """
+    files = _dng_paths(paths)
+    if not files:
+        raise ValueError("No DNG files to read")
+    first, meta0 = dng_read_raw(files[0])
+    stack = np.empty((len(files),) + first.shape, dtype=np.uint16)
+    stack[0] = first
+    if workers is None:
+        workers = os.cpu_count() or 1
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(files)))) as ex:
+        jobs = [
+            ex.submit(dng_read_raw, f, stack[i])
+            for i, f in enumerate(files[1:], start=1)
+        ]
+        metas = [meta0] + [job.result()[1] for job in jobs]
+    return stack, metas
+
+
+__all__ = ["dng_read", "dng_read_raw", "dng_read_stack"]
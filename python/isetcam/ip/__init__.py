@@ -3,7 +3,8 @@
 
 from .vcimage_class import VCImage
 from .ip_create import ip_create
-from .ip_compute import ip_compute
+from .ip_compute import ip_compute, ip_compute_batch
+from .ip_color_pipeline import IPColorPipeline, ip_color_pipeline
 from .ip_get import ip_get
 from .ip_set import ip_set
 from .ip_to_file import ip_to_file
@@ -19,6 +20,9 @@ __all__ = [
     "VCImage",
     "ip_create",
     "ip_compute",
+    "ip_compute_batch",
+    "IPColorPipeline",
+    "ip_color_pipeline",
     "ip_get",
     "ip_set",
     "ip_to_file",
@@ -0,0 +1,162 @@
+# mypy: ignore-errors
+"""Precompiled color conversion and inverse gamma stages of the IP."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from ..color_transform_matrix import color_transform_matrix
+from ..display import Display, DisplayGamma, display_gamma
+from ..ie_param_format import ie_param_format
+from ..imgproc.image_illuminant_correction import _gray_world, _white_world
+from ..sensor import Sensor
+
+# Pixels processed per chunk.  Keeps the temporaries of every stage small.
+IP_CHUNK = 1 << 16
+
+_ILLUMINANT_CORRECTIONS = {"grayworld": _gray_world, "whiteworld": _white_world}
+
+
+@dataclass
+class IPColorPipeline:
+    """Color conversion and inverse gamma of :func:`ip_compute`, precompiled.
+
+    Build it with :func:`ip_color_pipeline` and reuse it for every frame
+    rendered with the same sensor, display and processing options.
+    """
+
+    to_ics: np.ndarray | None
+    to_display: np.ndarray | None
+    fused: np.ndarray | None
+    illuminant_correction: str
+    wave: np.ndarray | None
+    gamma: DisplayGamma | None
+    chunk: int = IP_CHUNK
+
+    def apply(self, rgb: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
+        """Return display RGB for demosaiced ``rgb`` (``(..., rows, cols, 3)``).
+
+        Pixels are processed in chunks; ``out`` may be ``rgb`` itself.
+        Image-dependent illuminant corrections are estimated per image; XW
+        data ``(pixels, 3)`` counts as a single image.
+        """
+        rgb = np.asarray(rgb)
+        if rgb.shape[-1] != 3:
+            raise ValueError("rgb must have 3 channels in its last axis")
+        if out is None:
+            if (
+                self.illuminant_correction == "none"
+                and self.fused is None
+                and self.gamma is None
+            ):
+                return rgb
+            out = np.empty_like(rgb)
+
+        if self.illuminant_correction == "none":
+            self._run(rgb.reshape(-1, 3), out.reshape(-1, 3), self.fused)
+            return out
+
+        correct = _ILLUMINANT_CORRECTIONS[self.illuminant_correction]
+        if rgb.ndim >= 3:
+            images = rgb.reshape((-1,) + rgb.shape[-3:])
+        else:
+            # XW data, ``(pixels, 3)``, is corrected as one ``1 x pixels`` image.
+            images = rgb.reshape(1, 1, -1, 3)
+        outs = out.reshape(images.shape)
+        for img, dst in zip(images, outs):
+            ics = img if self.to_ics is None else img @ self.to_ics.astype(img.dtype)
+            D = correct(ics, None, self.wave, "D65")
+            T = D if self.to_display is None else D @ self.to_display
+            self._run(ics.reshape(-1, 3), dst.reshape(-1, 3), T)
+        return out
+
+    def _run(self, src: np.ndarray, dst: np.ndarray, T: np.ndarray | None) -> None:
+        if T is not None:
+            T = np.asarray(T).astype(src.dtype, copy=False)
+        for start in range(0, src.shape[0], self.chunk):
+            block = src[start : start + self.chunk]
+            if T is not None:
+                block = block @ T
+            if self.gamma is not None:
+                self.gamma.inverse(block, dst[start : start + self.chunk])
+            else:
+                dst[start : start + self.chunk] = block
+
+
+def ip_color_pipeline(
+    sensor: Sensor,
+    display: Display,
+    *,
+    internal_cs: str = "XYZ",
+    illuminant_correction_method: str = "none",
+    lut_size: int = 1 << 16,
+    chunk: int = IP_CHUNK,
+) -> IPColorPipeline:
+    """Compile the stages of :func:`ip_compute` that follow demosaicing.
+
+    The sensor-to-internal and internal-to-display 3x3 transforms are
+    folded into a single matrix when no image-dependent illuminant
+    correction sits between them, and identities are dropped.  The inverse
+    display gamma runs through the :class:`DisplayGamma` engine cached on
+    ``display`` (see :func:`display_gamma`), a dense LUT with ``lut_size``
+    bins per channel whose output equals the per-channel interpolation of
+    :func:`display_apply_gamma`.
+
+    Parameters
+    ----------
+    sensor : Sensor
+        Sensor whose ``wave`` is used by the illuminant correction.
+    display : Display
+        Target display.
+    internal_cs, illuminant_correction_method : str, optional
+        Processing options as in :func:`ip_compute_batch`.
+    lut_size : int, optional
+        Number of bins of the inverse gamma LUT.
+    chunk : int, optional
+        Number of pixels processed together.
+
+    Returns
+    -------
+    IPColorPipeline
+        Pipeline whose :meth:`~IPColorPipeline.apply` renders demosaiced
+        frames to display RGB.
+    """
+    cs_key = internal_cs.replace(" ", "").lower()
+    if cs_key == "xyz":
+        to_ics = color_transform_matrix("srgb2xyz")
+        to_display = color_transform_matrix("xyz2srgb")
+    elif cs_key in {"linearsrgb", "srgb"}:
+        to_ics = to_display = None
+    else:
+        raise ValueError("Unknown internal color space")
+
+    method = ie_param_format(illuminant_correction_method)
+    if method in {"manualmatrixentry", "manual"}:
+        raise ValueError("Manual correction requires 'transform'")
+    if method != "none" and method not in _ILLUMINANT_CORRECTIONS:
+        raise ValueError(f"Unknown illuminant correction method {method}")
+
+    fused = None
+    if method == "none" and to_ics is not None:
+        fused = to_ics @ to_display
+        if np.allclose(fused, np.eye(3), rtol=0, atol=1e-12):
+            fused = None
+
+    wave = sensor.wave if sensor.wave is not None else display.wave
+    gamma = None
+    if display.gamma is not None:
+        gamma = display_gamma(display, lut_size)
+    return IPColorPipeline(
+        to_ics=to_ics,
+        to_display=to_display,
+        fused=fused,
+        illuminant_correction=method,
+        wave=wave,
+        gamma=gamma,
+        chunk=chunk,
+    )
+
+
+__all__ = ["IPColorPipeline", "ip_color_pipeline"]
@@ -6,84 +6,134 @@ from __future__ import annotations
 import numpy as np
 
 from ..sensor import Sensor
-from ..display import Display, display_apply_gamma, display_render
-from ..color_transform_matrix import color_transform_matrix
-from ..rgb_to_xw_format import rgb_to_xw_format
-from ..xw_to_rgb_format import xw_to_rgb_format
-from ..imgproc.image_illuminant_correction import image_illuminant_correction
+from ..display import Display
+from ..ie_precision import ie_as_float, ie_precision
+from ..ie_trace import ie_trace_span
 from .vcimage_class import VCImage
 from .ip_create import ip_create
 from .ip_demosaic import ip_demosaic
+from .ip_color_pipeline import IPColorPipeline, ip_color_pipeline
+from ..imgproc.demosaic.ie_bilinear import _bilinear
 
 
-def _image_linear_transform(im: np.ndarray, T: np.ndarray) -> np.ndarray:
-    """Return ``im`` transformed by ``T`` in either RGB or XW format."""
-    if im.ndim == 3:
-        xw, r, c = rgb_to_xw_format(im)
-        out = xw @ T
-        return xw_to_rgb_format(out, r, c)
-    if im.ndim == 2:
-        if im.shape[1] != T.shape[0]:
-            raise ValueError("Matrix dimensions do not align")
-        return im @ T
-    raise ValueError("Image must be RGB or XW format")
+def ip_compute(
+    sensor: Sensor,
+    display: Display,
+    *,
+    pipeline: IPColorPipeline | None = None,
+) -> VCImage:
+    """Return ``VCImage`` rendered from ``sensor`` for ``display``.
 
+    The image is processed in the precision of ``sensor`` (see
+    :func:`ie_precision`).  The color transforms and inverse gamma run
+    through an :class:`IPColorPipeline`; pass one built with
+    :func:`ip_color_pipeline` to reuse it across frames.
+    """
 
-def ip_compute(sensor: Sensor, display: Display) -> VCImage:
-    """Return ``VCImage`` rendered from ``sensor`` for ``display``."""
+    with ie_trace_span("ip_compute"):
+        ip = ip_create(sensor, display)
 
-    ip = ip_create(sensor, display)
+        # ----- Demosaic -----
+        method = getattr(ip, "demosaic_method", None)
+        if method is None:
+            method = "bilinear"
+            ip.demosaic_method = method
+        with ie_trace_span("demosaic", volts=sensor.volts, method=method) as span:
+            vols = ie_as_float(sensor.volts, ie_precision(sensor))
+            if vols.ndim == 2:
+                pattern = getattr(sensor, "filter_color_letters", "rggb")
+                rgb = ip_demosaic(vols, pattern, method=method)
+            elif vols.ndim == 3 and vols.shape[2] == 3:
+                rgb = vols
+            else:
+                rgb = np.repeat(vols[:, :, None], 3, axis=2)
+            span.note(out=rgb)
 
-    # ----- Demosaic -----
-    method = getattr(ip, "demosaic_method", None)
-    if method is None:
-        method = "bilinear"
-        ip.demosaic_method = method
-    vols = np.asarray(sensor.volts, dtype=float)
-    if vols.ndim == 2:
-        pattern = getattr(sensor, "filter_color_letters", "rggb")
-        rgb = ip_demosaic(vols, pattern, method=method)
-    elif vols.ndim == 3 and vols.shape[2] == 3:
-        rgb = vols
-    else:
-        rgb = np.repeat(vols[:, :, None], 3, axis=2)
-
-    # ----- Convert to internal color space -----
-    ics = getattr(ip, "internal_cs", None)
-    if ics is None:
-        ics = "XYZ"
-        ip.internal_cs = ics
-    cs_key = ics.replace(" ", "").lower()
-    if cs_key == "xyz":
-        T = color_transform_matrix("srgb2xyz")
-        img_ics = _image_linear_transform(rgb, T)
-    elif cs_key in {"linearsrgb", "srgb"}:
-        img_ics = rgb
-    else:
-        raise ValueError("Unknown internal color space")
-
-    # ----- Illuminant correction -----
-    illum_method = getattr(ip, "illuminant_correction_method", None)
-    if illum_method is None:
-        illum_method = "none"
-        ip.illuminant_correction_method = illum_method
-    img_ics, _ = image_illuminant_correction(
-        img_ics, method=illum_method, internal_cmf=None, wave=ip.wave
-    )
-
-    # ----- Convert to display space -----
-    if cs_key == "xyz":
-        T = color_transform_matrix("xyz2srgb")
-        lin_rgb = _image_linear_transform(img_ics, T)
-    else:
-        lin_rgb = img_ics
-
-    _ = display_render(lin_rgb, display, apply_gamma=False)
-
-    if display.gamma is not None:
-        rgb_out = display_apply_gamma(lin_rgb, display, inverse=True)
-    else:
-        rgb_out = lin_rgb
-
-    ip.rgb = rgb_out
+        # ----- Color conversion, illuminant correction and gamma -----
+        ics = getattr(ip, "internal_cs", None)
+        if ics is None:
+            ics = "XYZ"
+            ip.internal_cs = ics
+        illum_method = getattr(ip, "illuminant_correction_method", None)
+        if illum_method is None:
+            illum_method = "none"
+            ip.illuminant_correction_method = illum_method
+        with ie_trace_span("color", internal_cs=ics) as span:
+            if pipeline is None:
+                pipeline = ip_color_pipeline(
+                    sensor,
+                    display,
+                    internal_cs=ics,
+                    illuminant_correction_method=illum_method,
+                )
+            rgb_out = pipeline.apply(rgb)
+            span.note(out=rgb_out)
+
+        ip.rgb = rgb_out
     return ip
+
+
+def ip_compute_batch(
+    volts: np.ndarray,
+    sensor: Sensor,
+    display: Display,
+    *,
+    demosaic_method: str = "bilinear",
+    internal_cs: str = "XYZ",
+    illuminant_correction_method: str = "none",
+    pipeline: IPColorPipeline | None = None,
+) -> np.ndarray:
+    """Render a stack of sensor frames to display RGB.
+
+    This runs the same stages as :func:`ip_compute` on ``volts`` with shape
+    ``(frames, rows, cols)``.  Bilinear demosaicing, the color transforms and
+    the inverse gamma operate on the whole stack at once; other demosaic
+    methods and image-dependent illuminant corrections run per frame.
+
+    Parameters
+    ----------
+    volts : np.ndarray
+        Sensor frames with shape ``(frames, rows, cols)``.
+    sensor : Sensor
+        Sensor providing ``filter_color_letters``.
+    display : Display
+        Target display.
+    demosaic_method, internal_cs, illuminant_correction_method : str
+        Processing options with the same meaning and defaults as the
+        corresponding :class:`VCImage` fields used by :func:`ip_compute`.
+    pipeline : IPColorPipeline, optional
+        Prebuilt color pipeline.  When given, ``internal_cs`` and
+        ``illuminant_correction_method`` are taken from it.
+
+    Returns
+    -------
+    np.ndarray
+        RGB frames with shape ``(frames, rows, cols, 3)``.
+    """
+    vols = ie_as_float(volts, ie_precision(sensor))
+    if vols.ndim != 3:
+        raise ValueError("volts must have shape (frames, rows, cols)")
+
+    with ie_trace_span("ip_compute_batch"):
+        pattern = getattr(sensor, "filter_color_letters", "rggb")
+        with ie_trace_span("demosaic", volts=vols, method=demosaic_method) as span:
+            if demosaic_method.lower() == "bilinear":
+                rgb = _bilinear(vols, pattern)
+            else:
+                rgb = np.stack(
+                    [ip_demosaic(v, pattern, method=demosaic_method) for v in vols]
+                )
+            span.note(out=rgb)
+
+        with ie_trace_span("color", internal_cs=internal_cs):
+            if pipeline is None:
+                pipeline = ip_color_pipeline(
+                    sensor,
+                    display,
+                    internal_cs=internal_cs,
+                    illuminant_correction_method=illuminant_correction_method,
+                )
+            return pipeline.apply(rgb, out=rgb)
+
+
+__all__ = ["ip_compute", "ip_compute_batch"]
@@ -3,26 +3,16 @@
 
 from __future__ import annotations
 
-from pathlib import Path
 from typing import Optional
 
 import numpy as np
-from scipy.io import loadmat
 
 from .vc_get_image_format import vc_get_image_format
-from .data_path import data_path
+from .ie_spectral_projector import ie_spectral_projector
 
 _DEF_BINWIDTH = 10
 
 
-def _photopic_luminosity(wave: np.ndarray) -> np.ndarray:
-    """Return the photopic luminosity function interpolated to ``wave``."""
-    data = loadmat(data_path('human/luminosity.mat'))
-    src_wave = data['wavelength'].ravel()
-    V = data['data'].ravel()
-    return np.interp(wave, src_wave, V, left=0.0, right=0.0)
-
-
 def luminance_from_energy(
     energy: np.ndarray, wavelength: np.ndarray, binwidth: Optional[float] = None
 ) -> np.ndarray:
@@ -70,8 +60,7 @@ def luminance_from_energy(
             raise ValueError('Energy must be in XW format with wavelength columns')
         n = m = None
 
-    V = _photopic_luminosity(wavelength)
-    lum = 683 * xw.dot(V) * binwidth
+    lum = xw @ ie_spectral_projector('luminance', wavelength, binwidth=binwidth).matrix
 
     if img_format == 'RGB':
         lum = lum.reshape(n, m)
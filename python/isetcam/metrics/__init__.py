@@ -11,7 +11,7 @@ from .xyz_to_vsnr import xyz_to_vsnr
 from .ssim_metric import ssim_metric
 from .exposure_value import exposure_value
 from .iso_acutance import iso_acutance
-from .iso12233_sfr import iso12233_sfr
+from .iso12233_sfr import iso12233_sfr, iso12233_sfr_batch
 from .iso_speed_saturation import iso_speed_saturation
 from .metrics_compute import metrics_compute
 from .metrics_camera import metrics_camera
@@ -32,6 +32,7 @@ __all__ = [
     "exposure_value",
     "iso_acutance",
     "iso12233_sfr",
+    "iso12233_sfr_batch",
     "iso_speed_saturation",
     "cie_whiteness",
     "metrics_compute",
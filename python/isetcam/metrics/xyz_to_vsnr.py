@@ -6,7 +6,7 @@ from __future__ import annotations
 import numpy as np
 from typing import Sequence
 
-from .scielab import SCIELABParams, sc_params, _sc_prepare_filters, _sc_opponent_filter
+from .scielab import SCIELABParams, sc_params, _sc_opponent_filter
 from ..xyz_to_lab import xyz_to_lab
 
 
@@ -32,8 +32,6 @@ def _get_middle_matrix(m: np.ndarray, size: Sequence[int]) -> np.ndarray:
 
 def _sc_compute_scielab(xyz: np.ndarray, white: Sequence[float], params: SCIELABParams) -> np.ndarray:  # noqa: E501
     xyz = _clip_xyz_image(xyz, white)
-    if params.filters is None:
-        params.filters, _ = _sc_prepare_filters(params)
     filtered = _sc_opponent_filter(xyz, params)
     return xyz_to_lab(filtered, white)
 
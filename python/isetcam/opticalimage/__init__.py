@@ -8,7 +8,7 @@ from .oi_get import oi_get
 from .oi_set import oi_set
 from .oi_from_file import oi_from_file
 from .oi_create import oi_create
-from .oi_compute import oi_compute
+from .oi_compute import oi_compute, oi_otf_cache_clear
 from .oi_photon_noise import oi_photon_noise
 from .oi_to_file import oi_to_file
 from .oi_crop import oi_crop
@@ -54,6 +54,7 @@ __all__ = [
     "oi_from_file",
     "oi_create",
     "oi_compute",
+    "oi_otf_cache_clear",
     "oi_crop",
     "oi_pad",
     "oi_pad_value",
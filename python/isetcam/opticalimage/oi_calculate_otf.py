@@ -12,17 +12,21 @@ from ..optics import Optics, optics_defocus_core
 
 
 def _cpd_scale(units: str, optics: Optics) -> float:
-    """Conversion factor from ``units`` to cycles/degree."""
-    deg_per_mm = 1.0 / (np.tan(np.deg2rad(1.0)) * optics.f_length * 1000.0)
+    """Conversion factor from ``units`` to cycles/degree.
+
+    :func:`oi_frequency_support` reports ``"cyclesPerDegree"`` support in
+    cycles per meter of image plane, so it shares the meter factor.
+    """
+    mm_per_deg = np.tan(np.deg2rad(1.0)) * optics.f_length * 1000.0
     u = units.lower()
     if u in {"cyclesperdegree", "cycperdeg", "cpd"}:
-        return deg_per_mm * 1e-3
+        return mm_per_deg * 1e-3
     if u in {"cyclespermillimeter", "mm", "millimeter", "millimeters"}:
-        return deg_per_mm
+        return mm_per_deg
     if u in {"cyclespermicron", "um", "micron", "microns", "micrometer", "micrometers"}:
-        return deg_per_mm * 1e3
+        return mm_per_deg * 1e3
     if u in {"cyclespermeter", "m", "meter", "meters"}:
-        return deg_per_mm / 1e3
+        return mm_per_deg * 1e-3
     raise ValueError(f"Unknown frequency unit '{units}'")
 
 
@@ -50,13 +54,13 @@ def _dl_otf(
         if D.size != wave.size:
             raise ValueError("defocus_diopters length must match wave")
 
-    otf_flat, _ = optics_defocus_core(optics, sample_sf.ravel(), D)
+    # Prepend the DC term: the defocused MTF is normalized by its first
+    # sample, which must therefore be the zero frequency.
+    sf = np.concatenate(([0.0], sample_sf.ravel()))
+    otf_flat, _ = optics_defocus_core(optics, sf, D)
 
     r, c = fx.shape
-    otf = np.zeros((r, c, wave.size), dtype=float)
-    for i in range(wave.size):
-        otf[:, :, i] = otf_flat[i].reshape(r, c)
-    return otf
+    return np.ascontiguousarray(otf_flat[:, 1:].T).reshape(r, c, wave.size)
 
 
 def _custom_otf(
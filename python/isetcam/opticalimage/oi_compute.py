@@ -3,33 +3,182 @@
 
 from __future__ import annotations
 
+import hashlib
+import threading
+from collections import OrderedDict
+
 import numpy as np
+from scipy.fft import irfft2, rfft2
 
+from ..ie_precision import ie_as_float, ie_precision
+from ..ie_spectral_resample import ie_spectral_resample_matrix
+from ..ie_trace import ie_trace_span
 from ..scene import Scene
 from ..optics import Optics
 from .oi_class import OpticalImage
+from .oi_calculate_otf import oi_calculate_otf
 
 
-def oi_compute(scene: Scene, optics: Optics) -> OpticalImage:
-    """Return the irradiance image formed by ``optics`` on ``scene``.
+_OTF_CACHE_SIZE = 16
+# Working-set size for converting memory-mapped scene photons.
+_CHUNK_BYTES = 64 * 2**20
+_OTF_CACHE: "OrderedDict[tuple, np.ndarray]" = OrderedDict()
+# Guards ``_OTF_CACHE``; tiles and camera modules are computed on threads.
+_OTF_LOCK = threading.Lock()
 
-    This simplified model interpolates the scene radiance to the
-    optics wavelength sampling, applies the optics transmittance and
-    scales the result by ``(f_length / f_number)**2``.
+
+def _array_digest(value) -> str | None:
+    if value is None:
+        return None
+    if isinstance(value, dict):
+        return "|".join(f"{k}:{_array_digest(v)}" for k, v in sorted(value.items()))
+    arr = np.ascontiguousarray(value)
+    return hashlib.sha1(arr.tobytes() + str(arr.shape).encode()).hexdigest()
+
+
+def _otf_key(
+    optics: Optics,
+    shape: tuple[int, int],
+    spacing: float,
+    wave: np.ndarray,
+    dtype: np.dtype,
+) -> tuple:
+    """Return the cache key describing everything the OTF depends on."""
+    return (
+        str(getattr(optics, "model", "diffractionlimited")).lower(),
+        float(optics.f_number),
+        float(optics.f_length),
+        _array_digest(np.asarray(optics.wave, dtype=float)),
+        _array_digest(getattr(optics, "defocus_diopters", None)),
+        _array_digest(getattr(optics, "otf_data", None)),
+        _array_digest(getattr(optics, "otf_support", None)),
+        str(getattr(optics, "otf_support_units", "")),
+        shape,
+        float(spacing),
+        _array_digest(wave),
+        np.dtype(dtype).str,
+    )
+
+
+def _rfft_otf(
+    optics: Optics,
+    rows: int,
+    cols: int,
+    spacing: float,
+    wave: np.ndarray,
+    dtype=np.complex128,
+) -> np.ndarray:
+    """Return the OTF of :func:`_cached_otf` without caching it."""
+    # Only the shape of the optical image matters for the OTF.
+    shape_only = np.broadcast_to(np.zeros(1), (rows, cols, wave.size))
+    oi = OpticalImage(photons=shape_only, wave=wave)
+    oi.sample_spacing = spacing
+    centered, _ = oi_calculate_otf(oi, optics, wave=wave)
+    otf = np.fft.ifftshift(centered, axes=(0, 1))[:, : cols // 2 + 1, :]
+    return np.ascontiguousarray(otf, dtype=dtype)
+
+
+def _cached_otf(
+    optics: Optics,
+    rows: int,
+    cols: int,
+    spacing: float,
+    wave: np.ndarray,
+    dtype=np.complex128,
+) -> np.ndarray:
+    """Return the per-wavelength OTF of a ``rows x cols`` image in rfft2 layout.
+
+    The OTF from :func:`oi_calculate_otf` is centered; it is shifted so the
+    DC term sits at ``(0, 0)`` and only the non-negative column frequencies
+    are kept.  Results are cached by optics parameters, image size, sample
+    spacing, wavelength grid and complex ``dtype``.
     """
+    key = _otf_key(optics, (rows, cols), spacing, wave, dtype)
+    with _OTF_LOCK:
+        otf = _OTF_CACHE.get(key)
+        if otf is not None:
+            _OTF_CACHE.move_to_end(key)
+            return otf
+
+    otf = _rfft_otf(optics, rows, cols, spacing, wave, dtype)
+    otf.setflags(write=False)
+
+    with _OTF_LOCK:
+        _OTF_CACHE[key] = otf
+        _OTF_CACHE.move_to_end(key)
+        while len(_OTF_CACHE) > _OTF_CACHE_SIZE:
+            _OTF_CACHE.popitem(last=False)
+    return otf
+
+
+def oi_otf_cache_clear() -> None:
+    """Discard all OTFs cached by :func:`oi_compute`."""
+    with _OTF_LOCK:
+        _OTF_CACHE.clear()
+
+
+def _shift_invariant_blur(
+    photons: np.ndarray,
+    optics: Optics,
+    spacing: float,
+    wave: np.ndarray,
+    pad: bool,
+    workers: int | None,
+) -> np.ndarray:
+    """Blur every waveband of ``photons`` with the optics OTF.
+
+    The spatial axes are the two before the wavelength axis, so a stack of
+    frames ``(frames, rows, cols, n_wave)`` is blurred in the same call.
+    """
+    rows, cols = photons.shape[-3:-1]
+    pr, pc = (rows // 8, cols // 8) if pad else (0, 0)
+    if pr or pc:
+        pad_width = [(0, 0)] * (photons.ndim - 3) + [(pr, pr), (pc, pc), (0, 0)]
+        photons = np.pad(photons, pad_width, mode="constant")
+
+    shape = photons.shape[-3:-1]
+    spectrum = rfft2(photons, axes=(-3, -2), workers=workers)
+    otf = _cached_otf(optics, shape[0], shape[1], spacing, wave, spectrum.dtype)
+    spectrum *= otf
+    blurred = irfft2(spectrum, s=shape, axes=(-3, -2), workers=workers)
+    np.maximum(blurred, 0.0, out=blurred)
+    return blurred[..., pr : pr + rows, pc : pc + cols, :]
 
-    sc_wave = np.asarray(scene.wave, dtype=float).reshape(-1)
-    oi_wave = np.asarray(optics.wave, dtype=float).reshape(-1)
 
-    photons = np.asarray(scene.photons, dtype=float)
+def _is_memmap(arr: np.ndarray) -> bool:
+    """Return ``True`` if ``arr`` is a view of a memory-mapped file."""
+    while arr is not None:
+        if isinstance(arr, np.memmap) and getattr(arr, "_mmap", None) is not None:
+            return True
+        arr = getattr(arr, "base", None)
+        if not isinstance(arr, np.ndarray):
+            return False
+    return False
+
+
+def _apply_optics(
+    photons: np.ndarray,
+    sc_wave: np.ndarray,
+    optics: Optics,
+    spacing: float | None,
+    shift_invariant: bool,
+    pad: bool,
+    workers: int | None,
+    dtype=None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return ``(oi_photons, oi_wave)`` for scene ``photons``.
+
+    ``photons`` may carry leading frame axes; every step acts on the last
+    three axes only.  The result has ``dtype``, by default the floating
+    dtype of ``photons``.  Scene bands that do not contribute to the optics
+    wavelengths are never read, and memory-mapped photons are converted
+    ``_CHUNK_BYTES`` at a time so the full cube is never loaded at once.
+    """
+    oi_wave = np.asarray(optics.wave, dtype=float).reshape(-1)
     if photons.shape[-1] != sc_wave.size:
         raise ValueError("scene.wave length must match photons shape")
-
-    flat = photons.reshape(-1, sc_wave.size)
-    interp = np.empty((flat.shape[0], oi_wave.size), dtype=float)
-    for i, spec in enumerate(flat):
-        interp[i] = np.interp(oi_wave, sc_wave, spec, left=0.0, right=0.0)
-    oi_photons = interp.reshape(photons.shape[0], photons.shape[1], oi_wave.size)
+    photons = np.asanyarray(photons)
+    dtype = ie_as_float(photons[..., :0]).dtype if dtype is None else dtype
 
     trans = optics.transmittance
     if trans is None:
@@ -38,12 +187,106 @@ def oi_compute(scene: Scene, optics: Optics) -> OpticalImage:
         trans = np.asarray(trans, dtype=float)
         if trans.size != oi_wave.size:
             raise ValueError("optics.transmittance length must match optics.wave")
-    oi_photons *= trans
 
+    # Fold transmittance and the f-number scale into the resampling so the
+    # cube is traversed by a single product.
     scale = (float(optics.f_length) / float(optics.f_number)) ** 2
-    oi_photons *= scale
+    gain = (trans * scale).astype(dtype, copy=False)
+    bands = slice(None)
+    if sc_wave.size == oi_wave.size and np.array_equal(sc_wave, oi_wave):
+        mat = None
+    else:
+        mat = ie_spectral_resample_matrix(sc_wave, oi_wave) * gain
+        used = np.flatnonzero(mat.any(axis=1))
+        if used.size < sc_wave.size:
+            bands = used
+            mat = mat[used]
+        mat = mat.astype(dtype, copy=False)
+
+    def spectral(block: np.ndarray) -> np.ndarray:
+        block = ie_as_float(block[..., bands], dtype)
+        return block * gain if mat is None else block @ mat
+
+    with ie_trace_span("spectral", photons=photons) as span:
+        if _is_memmap(photons):
+            oi_photons = np.empty(photons.shape[:-1] + (oi_wave.size,), dtype=dtype)
+            rows = photons.shape[-3]
+            row_bytes = max(1, photons[..., :1, :, :].size * np.dtype(dtype).itemsize)
+            step = max(1, _CHUNK_BYTES // row_bytes)
+            for r0 in range(0, rows, step):
+                rs = slice(r0, r0 + step)
+                oi_photons[..., rs, :, :] = spectral(photons[..., rs, :, :])
+        else:
+            oi_photons = spectral(photons)
+        span.note(out=oi_photons)
+
+    if shift_invariant:
+        with ie_trace_span("blur", photons=oi_photons, pad=pad) as span:
+            oi_photons = _shift_invariant_blur(
+                oi_photons,
+                optics,
+                1.0 if spacing is None else float(spacing),
+                oi_wave,
+                pad,
+                workers,
+            )
+            span.note(out=oi_photons)
+    return oi_photons, oi_wave
+
+
+def oi_compute(
+    scene: Scene,
+    optics: Optics,
+    *,
+    shift_invariant: bool = False,
+    pad: bool = True,
+    workers: int | None = None,
+) -> OpticalImage:
+    """Return the irradiance image formed by ``optics`` on ``scene``.
+
+    This simplified model interpolates the scene radiance to the
+    optics wavelength sampling, applies the optics transmittance and
+    scales the result by ``(f_length / f_number)**2``.
+
+    The computation runs in the precision of ``scene`` (see
+    :func:`ie_precision`), which the optical image inherits.  Memory-mapped
+    scenes (see :func:`scene_from_memmap`) are read in row chunks and only
+    the bands needed for the optics wavelengths are touched.
 
-    return OpticalImage(
+    Parameters
+    ----------
+    scene : Scene
+        Input scene.
+    optics : Optics
+        Optics description.
+    shift_invariant : bool, optional
+        When ``True`` each waveband is also blurred by the optics OTF from
+        :func:`oi_calculate_otf`.  All bands are transformed with one
+        batched ``rfft2`` and the OTF is cached, so repeated calls with the
+        same optics, image size and wavelengths skip the OTF computation.
+    pad : bool, optional
+        Zero pad the image by one eighth of its size on each side before
+        blurring to avoid wrap-around.  The result is cropped back to the
+        scene size.
+    workers : int, optional
+        Number of threads used by :mod:`scipy.fft`.
+    """
+
+    sc_wave = np.asarray(scene.wave, dtype=float).reshape(-1)
+    spacing = getattr(scene, "sample_spacing", None)
+    with ie_trace_span("oi_compute", shift_invariant=shift_invariant):
+        oi_photons, oi_wave = _apply_optics(
+            scene.photons,
+            sc_wave,
+            optics,
+            spacing,
+            shift_invariant,
+            pad,
+            workers,
+            ie_precision(scene),
+        )
+
+    oi = OpticalImage(
         photons=oi_photons,
         wave=oi_wave,
         name=getattr(scene, "name", None),
@@ -51,3 +294,11 @@ def oi_compute(scene: Scene, optics: Optics) -> OpticalImage:
         optics_f_length=float(optics.f_length),
         optics_model=getattr(optics, "model", ""),
     )
+    if getattr(scene, "precision", None) is not None:
+        oi.precision = scene.precision
+    if spacing is not None:
+        oi.sample_spacing = spacing
+    return oi
+
+
+__all__ = ["oi_compute", "oi_otf_cache_clear"]
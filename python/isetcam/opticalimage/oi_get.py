@@ -16,7 +16,7 @@ def oi_get(oi: OpticalImage, param: str, units: str | None = None) -> Any:
     """Return a parameter value from ``oi``.
 
     Supported parameters include ``photons``, ``wave``, ``n_wave``/``nwave``,
-    ``name``, ``luminance``, and several optics parameters.
+    ``name``, ``luminance``, ``precision`` and several optics parameters.
     """
     key = ie_param_format(param)
     if key == "photons":
@@ -53,4 +53,6 @@ def oi_get(oi: OpticalImage, param: str, units: str | None = None) -> Any:
         return 1.0 / float(oi.optics_f_length)
     if key == "opticsmodel":
         return oi.optics_model
+    if key == "precision":
+        return getattr(oi, "precision", None)
     raise KeyError(f"Unknown optical image parameter '{param}'")
@@ -9,6 +9,7 @@ import numpy as np
 
 from .oi_class import OpticalImage
 from ..illuminant.illuminant_class import Illuminant
+from ..ie_spectral_resample import ie_spectral_resample
 
 
 def oi_interpolate_w(oi: OpticalImage, wave: Sequence[float]) -> OpticalImage:
@@ -21,11 +22,7 @@ def oi_interpolate_w(oi: OpticalImage, wave: Sequence[float]) -> OpticalImage:
     if photons.shape[-1] != src_wave.size:
         raise ValueError("oi.wave length must match photons shape")
 
-    flat = photons.reshape(-1, src_wave.size)
-    interp = np.empty((flat.shape[0], tgt_wave.size), dtype=float)
-    for i, spec in enumerate(flat):
-        interp[i] = np.interp(tgt_wave, src_wave, spec, left=0.0, right=0.0)
-    new_photons = interp.reshape(photons.shape[0], photons.shape[1], tgt_wave.size)
+    new_photons = ie_spectral_resample(photons, src_wave, tgt_wave)
 
     out = OpticalImage(photons=new_photons, wave=tgt_wave, name=oi.name)
 
@@ -46,15 +43,11 @@ def oi_interpolate_w(oi: OpticalImage, wave: Sequence[float]) -> OpticalImage:
             if ill.ndim == 1:
                 if ill.size != src_wave.size:
                     raise ValueError("Illuminant vector length must match oi wave")
-                out.illuminant = np.interp(tgt_wave, src_wave, ill, left=0.0, right=0.0)
+                out.illuminant = ie_spectral_resample(ill, src_wave, tgt_wave)
             elif ill.ndim == 3:
                 if ill.shape != photons.shape:
                     raise ValueError("Illuminant cube must match oi photon shape")
-                flat = ill.reshape(-1, src_wave.size)
-                interp_ill = np.empty((flat.shape[0], tgt_wave.size), dtype=float)
-                for i, spec in enumerate(flat):
-                    interp_ill[i] = np.interp(tgt_wave, src_wave, spec, left=0.0, right=0.0)
-                out.illuminant = interp_ill.reshape(ill.shape[0], ill.shape[1], tgt_wave.size)
+                out.illuminant = ie_spectral_resample(ill, src_wave, tgt_wave)
             else:
                 raise ValueError("Illuminant must be 1-D or 3-D or Illuminant object")
 
@@ -44,7 +44,7 @@ def _photons_to_srgb(oi: OpticalImage, display: Display) -> np.ndarray:
     else:
         rgb = rgb_lin
     rgb = xw_to_rgb_format(rgb, rows, cols)
-    spectral = display_render(rgb, display, apply_gamma=True)
+    spectral = display_render(rgb, display, apply_gamma=True, normalized=True)
     xyz = ie_xyz_from_photons(spectral, display.wave)
     srgb, _, _ = xyz_to_srgb(xyz)
     return np.clip(srgb, 0.0, 1.0)
@@ -40,7 +40,7 @@ def oi_save_image(oi: OpticalImage, path: str | Path, display: Display | None =
         display = display_create()
 
     rgb = _photons_to_rgb(oi, display)
-    spectral = display_render(rgb, display, apply_gamma=True)
+    spectral = display_render(rgb, display, apply_gamma=True, normalized=True)
     xyz = ie_xyz_from_photons(spectral, display.wave)
     srgb, _, _ = xyz_to_srgb(xyz)
 
@@ -9,13 +9,15 @@ import numpy as np
 
 from .oi_class import OpticalImage
 from ..ie_param_format import ie_param_format
+from ..ie_precision import ie_as_float
 
 
 def oi_set(oi: OpticalImage, param: str, val: Any, units: str | None = None) -> None:
     """Set a parameter value on ``oi``.
 
-    Supported parameters include ``photons``, ``wave``, ``name`` and basic optics
-    properties.
+    Supported parameters include ``photons``, ``wave``, ``name``,
+    ``precision`` and basic optics properties.  Setting ``precision`` also
+    converts the photons.
     """
     key = ie_param_format(param)
     if key == "photons":
@@ -39,4 +41,10 @@ def oi_set(oi: OpticalImage, param: str, val: Any, units: str | None = None) ->
     if key == "opticsmodel":
         oi.optics_model = None if val is None else str(val)
         return
+    if key == "precision":
+        # Convert first: an invalid precision raises before anything is set.
+        if val is not None:
+            oi.photons = ie_as_float(oi.photons, val)
+        oi.precision = val
+        return
     raise KeyError(f"Unknown or read-only optical image parameter '{param}'")
@@ -47,7 +47,7 @@ def oi_show_image(oi: OpticalImage, display: Display | None = None):
 
     rgb = _photons_to_rgb(oi, display)
     # Render through the display model
-    spectral = display_render(rgb, display, apply_gamma=True)
+    spectral = display_render(rgb, display, apply_gamma=True, normalized=True)
     if spectral.shape[-1] != len(display.wave):
         raise ValueError(
             "display.spd must be resampled to display.wave; expected"
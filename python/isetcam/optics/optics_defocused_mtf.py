@@ -24,7 +24,9 @@ def optics_defocused_mtf(s: np.ndarray, alpha: np.ndarray) -> np.ndarray:
     """
     s = np.asarray(s, dtype=float)
     alpha = np.asarray(alpha, dtype=float)
-    nf = np.abs(s) / 2.0
+    # Frequencies beyond the diffraction cutoff (``nf > 1``) transfer no
+    # contrast; clipping them to the cutoff makes both branches return 0.
+    nf = np.minimum(np.abs(s) / 2.0, 1.0)
     beta = np.sqrt(1.0 - nf ** 2)
     otf = np.zeros_like(nf)
     ii = alpha == 0
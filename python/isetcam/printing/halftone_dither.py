@@ -11,13 +11,19 @@ from ..ie_scale import ie_scale
 def halftone_dither(cell: np.ndarray, image: np.ndarray) -> np.ndarray:
     """Halftone ``image`` using the provided dither ``cell``.
 
+    The threshold matrix is never tiled over the whole image: the image is
+    viewed as a grid of cell-sized blocks and compared against the cell
+    by broadcasting.
+
     Parameters
     ----------
     cell : np.ndarray
-        Halftone threshold matrix. If the maximum value exceeds ``1`` it is
-        linearly scaled into the range ``[0, 1]``.
+        Halftone threshold matrix, or ``(rows, cols, channels)`` matrices
+        with one screen per channel. If the maximum value exceeds ``1`` it
+        is linearly scaled into the range ``[0, 1]``.
     image : np.ndarray
-        2-D grayscale image with values between ``0`` and ``1``.
+        2-D grayscale image, or ``(rows, cols, channels)`` image such as
+        CMYK separations, with values between ``0`` and ``1``.
 
     Returns
     -------
@@ -32,15 +38,27 @@ def halftone_dither(cell: np.ndarray, image: np.ndarray) -> np.ndarray:
         high = 1.0 - low
         cell, _, _ = ie_scale(cell, low, high)
 
-    cell_rows, cell_cols = cell.shape
-    img_rows, img_cols = img.shape
+    if img.ndim not in (2, 3) or cell.ndim not in (2, 3):
+        raise ValueError("cell and image must be 2-D or 3-D")
+    if cell.ndim == 3 and (img.ndim != 3 or cell.shape[2] != img.shape[2]):
+        raise ValueError("cell must have one screen per image channel")
+    if img.ndim == 3 and cell.ndim == 2:
+        cell = cell[:, :, np.newaxis]
+
+    cell_rows, cell_cols = cell.shape[:2]
+    img_rows, img_cols = img.shape[:2]
 
-    r = int(np.ceil(img_rows / cell_rows))
-    c = int(np.ceil(img_cols / cell_cols))
-    mask = np.tile(cell, (r, c))
-    mask = mask[:img_rows, :img_cols]
+    # One band of thresholds as wide as the image.
+    reps = (1, -(-img_cols // cell_cols)) + (1,) * (cell.ndim - 2)
+    band = np.tile(cell, reps)[:, :img_cols]
 
-    return (mask < img).astype(int)
+    out = np.empty(img.shape, dtype=int)
+    full = img_rows - img_rows % cell_rows
+    blocks = img[:full].reshape((-1, cell_rows) + img.shape[1:])
+    np.less(band, blocks, out=out[:full].reshape(blocks.shape))
+    rest = img_rows - full
+    np.less(band[:rest], img[full:], out=out[full:])
+    return out
 
 
 __all__ = ["halftone_dither"]
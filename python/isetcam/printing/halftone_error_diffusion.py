@@ -3,10 +3,149 @@
 
 from __future__ import annotations
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 
+try:  # pragma: no cover - optional dependency
+    import numba  # type: ignore
+except Exception:  # pragma: no cover - library may not be present
+    numba = None  # type: ignore
+
+
+def _diffuse_scalar(temp, fs, fc, serpentine):
+    """Error diffuse the padded ``temp`` in place, one pixel at a time.
+
+    This is the kernel compiled by numba.  Without ``serpentine`` errors
+    leaving a row on one side re-enter the neighboring row on the other,
+    as if the image were a single raster line.  With ``serpentine`` odd
+    rows are scanned right to left with a mirrored matrix and errors
+    leaving the image are discarded.
+    """
+    fs_r, fs_w = fs.shape
+    n_rows = temp.shape[0] - fs_r
+    n_cols = temp.shape[1] - 2 * fc
+    for ir in range(n_rows):
+        if serpentine:
+            backward = ir % 2 == 1
+            for n in range(n_cols):
+                ic = fc + n_cols - 1 - n if backward else fc + n
+                val = temp[ir, ic]
+                q = np.rint(val)
+                temp[ir, ic] = q
+                err = val - q
+                for r in range(fs_r):
+                    for k in range(fs_w):
+                        w = fs[r, fs_w - 1 - k] if backward else fs[r, k]
+                        if w != 0.0:
+                            temp[ir + r, ic - fc + k] += err * w
+        else:
+            for seg in range(2):
+                if seg == 1:
+                    for r in range(fs_r):
+                        for k in range(fc):
+                            temp[ir + r, n_cols + k] += temp[ir + r + 1, k]
+                start = fc if seg == 0 else n_cols
+                stop = n_cols if seg == 0 else n_cols + fc
+                for ic in range(start, stop):
+                    val = temp[ir, ic]
+                    q = np.rint(val)
+                    temp[ir, ic] = q
+                    err = val - q
+                    for r in range(fs_r):
+                        for k in range(fs_w):
+                            w = fs[r, k]
+                            if w != 0.0:
+                                temp[ir + r, ic - fc + k] += err * w
+            for r in range(fs_r):
+                for k in range(fc):
+                    temp[ir + r + 1, fc + k] += temp[ir + r, n_cols + fc + k]
+        for r in range(ir, ir + fs_r + 1):
+            for k in range(fc):
+                temp[r, k] = 0.0
+                temp[r, n_cols + fc + k] = 0.0
+
+
+if numba is not None:  # pragma: no cover - optional dependency
+    _diffuse_jit = numba.njit(cache=True, nogil=True)(_diffuse_scalar)
+else:
+    _diffuse_jit = None
+
+
+def _diffuse_segment(temp, ir, start, stop, fs, fc):
+    """Quantize ``temp[ir, start:stop]`` and diffuse the errors.
+
+    Only the taps on the current row need a sequential scan.  Taps on the
+    following rows are applied afterwards as one slice update per tap,
+    ordered so that every pixel sums its contributions in the same order
+    as a pixel-by-pixel scan.
+    """
+    if stop <= start:
+        return
+    fs_r, fs_w = fs.shape
+    taps = [(k - fc, float(fs[0, k])) for k in range(fs_w) if fs[0, k] != 0]
+    row = temp[ir].tolist()
+    errs = []
+    for ic in range(start, stop):
+        val = row[ic]
+        q = float(round(val))
+        row[ic] = q
+        err = val - q
+        errs.append(err)
+        for off, w in taps:
+            row[ic + off] += err * w
+    temp[ir] = row
+
+    errs = np.array(errs)
+    for r in range(1, fs_r):
+        for k in range(fs_w - 1, -1, -1):
+            if fs[r, k] != 0:
+                temp[ir + r, start + k - fc : stop + k - fc] += errs * fs[r, k]
+
 
-def halftone_error_diffusion(FS: np.ndarray, image: np.ndarray) -> np.ndarray:
+def _diffuse_numpy(temp, fs, fc, serpentine):
+    """NumPy version of :func:`_diffuse_scalar` with identical results."""
+    fs_r = fs.shape[0]
+    n_rows = temp.shape[0] - fs_r
+    n_cols = temp.shape[1] - 2 * fc
+    for ir in range(n_rows):
+        if serpentine:
+            # Scanning a reversed view mirrors ``fs`` for the odd rows.
+            view = temp[:, ::-1] if ir % 2 else temp
+            _diffuse_segment(view, ir, fc, fc + n_cols, fs, fc)
+        else:
+            _diffuse_segment(temp, ir, fc, n_cols, fs, fc)
+            # Errors spilled past either border re-enter the neighboring row.
+            temp[ir : ir + fs_r, n_cols : n_cols + fc] += temp[
+                ir + 1 : ir + fs_r + 1, :fc
+            ]
+            _diffuse_segment(temp, ir, n_cols, n_cols + fc, fs, fc)
+            temp[ir + 1 : ir + fs_r + 1, fc : 2 * fc] += temp[
+                ir : ir + fs_r, n_cols + fc : n_cols + 2 * fc
+            ]
+        temp[ir : ir + fs_r + 1, :fc] = 0
+        temp[ir : ir + fs_r + 1, n_cols + fc :] = 0
+
+
+def _diffuse_channel(img, fs, serpentine, kernel):
+    img_r, img_c = img.shape
+    fs_r, fs_w = fs.shape
+    fc = fs_w // 2
+    temp = np.zeros((img_r + fs_r, img_c + 2 * fc), dtype=float)
+    temp[:img_r, fc : fc + img_c] = img
+    kernel(temp, fs, fc, serpentine)
+    return temp[:img_r, fc : fc + img_c].astype(int)
+
+
+def halftone_error_diffusion(
+    FS: np.ndarray,
+    image: np.ndarray,
+    *,
+    serpentine: bool = False,
+    jit: bool | None = None,
+    workers: int | None = None,
+) -> np.ndarray:
     """Apply error diffusion using diffusion matrix ``FS``.
 
     Parameters
@@ -17,45 +156,54 @@ def halftone_error_diffusion(FS: np.ndarray, image: np.ndarray) -> np.ndarray:
         equals ``1``. The current pixel corresponds to the center element of the
         first row.
     image : np.ndarray
-        2-D grayscale image with values between ``0`` and ``1``.
+        2-D grayscale image, or ``(rows, cols, channels)`` image such as
+        CMYK separations, with values between ``0`` and ``1``.  Channels
+        are halftoned independently.
+    serpentine : bool, optional
+        Scan odd rows right to left with a mirrored ``FS``.  Errors leaving
+        the image are then discarded; by default they wrap to the
+        neighboring row as in a single raster scan.
+    jit : bool, optional
+        Use the numba compiled kernel.  By default it is used when numba
+        is installed; otherwise a NumPy implementation with identical
+        results runs.
+    workers : int, optional
+        Number of channels processed in parallel.  Defaults to the number
+        of CPUs with the compiled kernel and to ``1`` without it.
 
     Returns
     -------
     np.ndarray
         Binary halftoned image of the same shape as ``image``.
     """
-    fs = np.asarray(FS, dtype=float)
+    fs = np.array(FS, dtype=float)
     fs /= fs.sum()
 
-    img = np.asarray(image, dtype=float)
-    img_r, img_c = img.shape
-    fs_r, fs_c_total = fs.shape
-    fs_c = fs_c_total // 2
-
-    temp = np.zeros((img_r + fs_r, img_c + 2 * fs_c), dtype=float)
-    temp[:img_r, fs_c : fs_c + img_c] = img
-
-    for ir in range(img_r):
-        for ic in range(fs_c, img_c):
-            val = temp[ir, ic]
-            temp[ir, ic] = np.round(val)
-            err = val - temp[ir, ic]
-            temp[ir : ir + fs_r, ic - fs_c : ic + fs_c + 1] += err * fs
+    if jit is None:
+        jit = _diffuse_jit is not None
+    if jit and _diffuse_jit is None:
+        raise RuntimeError("numba library is not available")
+    kernel = _diffuse_jit if jit else _diffuse_numpy
 
-        temp[ir : ir + fs_r, img_c : img_c + fs_c] += temp[ir + 1 : ir + fs_r + 1, :fs_c]
-
-        for ic in range(img_c, img_c + fs_c):
-            val = temp[ir, ic]
-            temp[ir, ic] = np.round(val)
-            err = val - temp[ir, ic]
-            temp[ir : ir + fs_r, ic - fs_c : ic + fs_c + 1] += err * fs
-
-        temp[ir + 1 : ir + fs_r + 1, fs_c : 2 * fs_c] += temp[ir : ir + fs_r, img_c + fs_c : img_c + 2 * fs_c]
-        temp[:, :fs_c] = 0
-        temp[:, img_c + fs_c :] = 0
+    img = np.asarray(image, dtype=float)
+    if img.ndim == 2:
+        return _diffuse_channel(img, fs, serpentine, kernel)
+    if img.ndim != 3:
+        raise ValueError("image must be 2-D or 3-D")
 
-    result = temp[:img_r, fs_c : fs_c + img_c]
-    return result.astype(int)
+    if workers is None:
+        workers = (os.cpu_count() or 1) if jit else 1
+    channels = [img[:, :, k] for k in range(img.shape[2])]
+    if workers > 1 and len(channels) > 1:
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            results = list(
+                ex.map(
+                    lambda ch: _diffuse_channel(ch, fs, serpentine, kernel), channels
+                )
+            )
+    else:
+        results = [_diffuse_channel(ch, fs, serpentine, kernel) for ch in channels]
+    return np.stack(results, axis=2)
 
 
 __all__ = ["halftone_error_diffusion"]
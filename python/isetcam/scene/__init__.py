@@ -29,6 +29,8 @@ from .scene_frequency_support import scene_frequency_support
 from .scene_frequency_resample import scene_frequency_resample
 from .scene_interpolate_w import scene_interpolate_w
 from .scene_to_file import scene_to_file
+from .scene_to_memmap import scene_to_memmap
+from .scene_from_memmap import scene_from_memmap, is_memmap_scene
 from .scene_extract_waveband import scene_extract_waveband
 from .scene_add_grid import scene_add_grid
 from .scene_grid_lines import scene_grid_lines
@@ -94,6 +96,9 @@ __all__ = [
     "scene_create",
     "scene_photon_noise",
     "scene_to_file",
+    "scene_to_memmap",
+    "scene_from_memmap",
+    "is_memmap_scene",
     "scene_extract_waveband",
     "scene_add_grid",
     "scene_grid_lines",
@@ -6,11 +6,11 @@ from __future__ import annotations
 from typing import Optional
 
 import numpy as np
-from scipy.io import loadmat
 
 from .scene_class import Scene
 from ..luminance_from_photons import luminance_from_photons
 from ..data_path import data_path
+from ..ie_read_spectra import ie_read_spectra
 from .scene_adjust_illuminant import scene_adjust_illuminant
 from .scene_freq_orient import scene_freq_orient
 
@@ -20,24 +20,16 @@ _DEF_DIR = "data"
 
 def _load_macbeth_data(wave: Optional[np.ndarray]) -> tuple[np.ndarray, np.ndarray]:
     """Return reflectance data and wavelength array for the Macbeth chart."""
-    mat = loadmat(data_path("surfaces/reflectances/macbethChart.mat"))
-    src_wave = mat["wavelength"].ravel().astype(float)
-    refl = mat["data"].astype(float)
-    if wave is None:
-        return refl, src_wave
-    wave = np.asarray(wave, dtype=float).reshape(-1)
-    interp = np.zeros((wave.size, refl.shape[1]), dtype=float)
-    for i in range(refl.shape[1]):
-        interp[:, i] = np.interp(wave, src_wave, refl[:, i], left=0.0, right=0.0)
-    return interp, wave
+    refl, wave, _, _ = ie_read_spectra(
+        data_path("surfaces/reflectances/macbethChart.mat"), wave
+    )
+    return refl, wave
 
 
 def _load_d65(wave: np.ndarray) -> np.ndarray:
     """Return D65 spectral power distribution sampled at ``wave``."""
-    mat = loadmat(data_path("lights/D65.mat"))
-    src_wave = mat["wavelength"].ravel().astype(float)
-    spd = mat["data"].ravel().astype(float)
-    return np.interp(wave, src_wave, spd, left=0.0, right=0.0)
+    spd, _, _, _ = ie_read_spectra(data_path("lights/D65.mat"), wave)
+    return spd.ravel()
 
 
 def _create_macbeth_d65(patch_size: int = 16, wave: Optional[np.ndarray] = None,
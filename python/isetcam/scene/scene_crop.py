@@ -43,7 +43,9 @@ def scene_crop(scene: Scene, rect: Sequence[int]) -> Scene:
     if x < 0 or y < 0 or x + w > width or y + h > height:
         raise ValueError("rect is outside the scene bounds")
 
-    cropped = photons[y : y + h, x : x + w, :].copy()
+    # ``np.array`` copies only the requested region, also for memory-mapped
+    # photons.
+    cropped = np.array(photons[y : y + h, x : x + w, :])
     out = Scene(photons=cropped, wave=scene.wave, name=scene.name)
     # Attach metadata about the crop
     out.crop_rect = (x, y, w, h)
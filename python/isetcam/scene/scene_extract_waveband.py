@@ -36,6 +36,7 @@ def scene_extract_waveband(scene: Scene, wave_list: Sequence[float]) -> Scene:
             raise ValueError(f"Wavelength {w} not found in scene.wave")
         indices.append(matches[0])
 
-    photons = scene.photons[:, :, indices].copy()
+    # Only the selected bands are read from memory-mapped photons.
+    photons = np.array(scene.photons[:, :, indices])
     new_wave = wv[indices]
     return Scene(photons=photons, wave=new_wave, name=scene.name)
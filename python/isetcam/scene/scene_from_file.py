@@ -11,6 +11,7 @@ import imageio.v2 as imageio
 
 from ..luminance_from_energy import luminance_from_energy
 from .scene_class import Scene
+from .scene_from_memmap import is_memmap_scene, scene_from_memmap
 
 
 def scene_from_file(
@@ -22,7 +23,9 @@ def scene_from_file(
 
     Integer-valued images are normalized to the [0, 1] range using the
     maximum value representable by their data type.  Floating-point images
-    are left unchanged.
+    are left unchanged.  A directory written by :func:`scene_to_memmap` is
+    opened lazily with :func:`scene_from_memmap`; ``mean_luminance`` then
+    scales the data into memory.
 
     Parameters
     ----------
@@ -40,6 +43,19 @@ def scene_from_file(
     Scene
         Scene containing the image data.
     """
+    if is_memmap_scene(path):
+        scene = scene_from_memmap(path)
+        if wave is not None and not np.array_equal(
+            np.asarray(wave, dtype=float).reshape(-1), scene.wave
+        ):
+            raise ValueError("wave does not match the stored scene")
+        if mean_luminance is not None:
+            lum = luminance_from_energy(scene.photons, scene.wave)
+            current_mean = float(lum.mean())
+            if current_mean > 0:
+                scene.photons = scene.photons * (mean_luminance / current_mean)
+        return scene
+
     img = imageio.imread(Path(path))
     # Scale integer images to the [0, 1] range by dividing by the maximum
     # representable value.  Floating point images are left as-is.
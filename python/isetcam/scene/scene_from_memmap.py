@@ -0,0 +1,54 @@
+# mypy: ignore-errors
+"""Load a :class:`Scene` saved by :func:`scene_to_memmap` without reading it."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import numpy as np
+
+from .scene_class import Scene
+from .scene_to_memmap import META_FILE, PHOTONS_FILE
+
+
+def is_memmap_scene(path: str | Path) -> bool:
+    """Return ``True`` if ``path`` is a directory written by :func:`scene_to_memmap`."""
+    p = Path(path)
+    return (p / PHOTONS_FILE).is_file() and (p / META_FILE).is_file()
+
+
+def scene_from_memmap(path: str | Path, mode: str = "r") -> Scene:
+    """Return a scene whose photons are memory mapped from ``path``.
+
+    No photon data are read when the scene is created.  ``scene.photons`` is
+    a ``(rows, cols, n_wave)`` view of the band-sequential file, so slicing
+    it, as :func:`scene_crop` and :func:`scene_extract_waveband` do, reads
+    only the requested tiles or bands from disk.
+
+    Parameters
+    ----------
+    path : str or Path
+        Directory written by :func:`scene_to_memmap`.
+    mode : str, optional
+        Memory-map mode: ``"r"`` (read only, default), ``"r+"`` or ``"c"``
+        (copy on write).
+    """
+    p = Path(path)
+    if not is_memmap_scene(p):
+        raise FileNotFoundError(f"No memory-mapped scene in '{p}'")
+    meta = json.loads((p / META_FILE).read_text())
+    if meta.get("layout") != "band_sequential":
+        raise ValueError(f"Unsupported scene layout '{meta.get('layout')}'")
+
+    bands = np.load(p / PHOTONS_FILE, mmap_mode=mode)
+    return Scene(
+        photons=bands.transpose(1, 2, 0),
+        wave=np.asarray(meta["wave"], dtype=float),
+        name=meta.get("name"),
+        distance=meta.get("distance"),
+        fov=meta.get("fov"),
+    )
+
+
+__all__ = ["scene_from_memmap", "is_memmap_scene"]
@@ -15,7 +15,7 @@ def scene_get(scene: Scene, param: str) -> Any:
     """Return a parameter value from ``scene``.
 
     Supported parameters are ``photons``, ``wave``, ``n_wave``/``nwave``,
-    ``name``, ``luminance``, and ``xyz``.
+    ``name``, ``luminance``, ``xyz`` and ``precision``.
     """
     key = ie_param_format(param)
     if key == "photons":
@@ -30,4 +30,6 @@ def scene_get(scene: Scene, param: str) -> Any:
         return luminance_from_photons(scene.photons, scene.wave)
     if key == "xyz":
         return ie_xyz_from_photons(scene.photons, scene.wave)
+    if key == "precision":
+        return getattr(scene, "precision", None)
     raise KeyError(f"Unknown scene parameter '{param}'")
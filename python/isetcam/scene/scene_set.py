@@ -9,13 +9,17 @@ import numpy as np
 
 from .scene_class import Scene
 from ..ie_param_format import ie_param_format
+from ..ie_precision import ie_as_float
 
 
 def scene_set(scene: Scene, param: str, val: Any) -> None:
     """Set a parameter value on ``scene``.
 
-    Supported parameters are ``photons``, ``wave`` and ``name``. ``n_wave`` and
-    ``luminance`` are derived values and therefore cannot be set.
+    Supported parameters are ``photons``, ``wave``, ``name`` and
+    ``precision``. ``n_wave`` and ``luminance`` are derived values and
+    therefore cannot be set.  Setting ``precision`` (``"single"``,
+    ``"double"`` or ``None`` for the session default) also converts the
+    photons.
     """
     key = ie_param_format(param)
     if key == "photons":
@@ -27,4 +31,10 @@ def scene_set(scene: Scene, param: str, val: Any) -> None:
     if key == "name":
         scene.name = None if val is None else str(val)
         return
+    if key == "precision":
+        # Convert first: an invalid precision raises before anything is set.
+        if val is not None:
+            scene.photons = ie_as_float(scene.photons, val)
+        scene.precision = val
+        return
     raise KeyError(f"Unknown or read-only scene parameter '{param}'")
@@ -0,0 +1,79 @@
+# mypy: ignore-errors
+"""Write a :class:`Scene` to a chunked, memory-mappable directory."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import numpy as np
+
+from .scene_class import Scene
+
+PHOTONS_FILE = "photons.npy"
+META_FILE = "scene.json"
+
+
+def scene_to_memmap(
+    scene: Scene,
+    path: str | Path,
+    *,
+    dtype=np.float32,
+    chunk_rows: int = 256,
+) -> Path:
+    """Save ``scene`` to the directory ``path`` for lazy loading.
+
+    The photons are written band-sequentially, with shape
+    ``(n_wave, rows, cols)``, to ``photons.npy``.  The wavelengths, name,
+    distance and field of view go to ``scene.json``.  Each band and each
+    block of rows within a band is contiguous on disk, so reading a
+    waveband or a spatial tile touches only the pages it needs.  The data
+    are copied ``chunk_rows`` rows at a time, so ``scene.photons`` may
+    itself be memory mapped.  Use :func:`scene_from_memmap` to load the
+    scene.
+
+    Parameters
+    ----------
+    scene : Scene
+        Scene to save.
+    path : str or Path
+        Output directory.  It is created if needed.
+    dtype : dtype, optional
+        On-disk data type, ``float32`` by default.
+    chunk_rows : int, optional
+        Number of rows copied per step.
+
+    Returns
+    -------
+    Path
+        The output directory.
+    """
+    photons = scene.photons
+    if photons.ndim != 3:
+        raise ValueError("scene.photons must have shape (rows, cols, n_wave)")
+    rows, cols, n_wave = photons.shape
+    out_dir = Path(path)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    disk = np.lib.format.open_memmap(
+        out_dir / PHOTONS_FILE, mode="w+", dtype=dtype, shape=(n_wave, rows, cols)
+    )
+    step = max(1, int(chunk_rows))
+    for r0 in range(0, rows, step):
+        block = np.asarray(photons[r0 : r0 + step])
+        disk[:, r0 : r0 + step, :] = np.moveaxis(block, -1, 0)
+    disk.flush()
+    del disk
+
+    meta = {
+        "layout": "band_sequential",
+        "wave": np.asarray(scene.wave, dtype=float).reshape(-1).tolist(),
+        "name": scene.name,
+        "distance": scene.distance,
+        "fov": scene.fov,
+    }
+    (out_dir / META_FILE).write_text(json.dumps(meta))
+    return out_dir
+
+
+__all__ = ["scene_to_memmap"]
@@ -3,26 +3,16 @@
 
 from __future__ import annotations
 
-from pathlib import Path
 from typing import Optional
 
 import numpy as np
-from scipy.io import loadmat
 
 from .vc_get_image_format import vc_get_image_format
-from .data_path import data_path
+from .ie_spectral_projector import ie_spectral_projector
 
 _DEF_BINWIDTH = 10
 
 
-def _scotopic_luminosity(wave: np.ndarray) -> np.ndarray:
-    """Return the scotopic luminosity function interpolated to ``wave``."""
-    data = loadmat(data_path('human/rods.mat'))
-    src_wave = data['wavelength'].ravel()
-    Vprime = data['data'].ravel()
-    return np.interp(wave, src_wave, Vprime, left=0.0, right=0.0)
-
-
 def scotopic_luminance_from_energy(
     energy: np.ndarray, wavelength: np.ndarray, binwidth: Optional[float] = None
 ) -> np.ndarray:
@@ -70,8 +60,7 @@ def scotopic_luminance_from_energy(
             raise ValueError('Energy must be in XW format with wavelength columns')
         n = m = None
 
-    Vprime = _scotopic_luminosity(wavelength)
-    lum = 1745 * xw.dot(Vprime) * binwidth
+    lum = xw @ ie_spectral_projector('scotopic', wavelength, binwidth=binwidth).matrix
 
     if img_format == 'RGB':
         lum = lum.reshape(n, m)
@@ -15,6 +15,7 @@ from .sensor_class import Sensor
 from .sensor_get import sensor_get
 from .sensor_set import sensor_set
 from .sensor_from_file import sensor_from_file
+from .sensor_cfa_integrate import sensor_cfa_integrate
 from .sensor_compute import sensor_compute, auto_exposure
 from .sensor_photon_noise import sensor_photon_noise
 from .sensor_add_noise import sensor_add_noise
@@ -25,9 +26,10 @@ from .sensor_snr import sensor_snr
 from .sensor_snr_luxsec import sensor_snr_luxsec
 from .sensor_crop import sensor_crop
 from .sensor_roi import sensor_roi
+from .sensor_roi_stats import sensor_roi_stats
 from .sensor_plot import sensor_plot
 from .sensor_ccm import sensor_ccm
-from .sensor_dng_read import sensor_dng_read
+from .sensor_dng_read import sensor_dng_read, sensor_dng_read_batch
 from .sensor_show_image import sensor_show_image
 from .sensor_rotate import sensor_rotate
 from .sensor_show_cfa import sensor_show_cfa
@@ -85,6 +87,7 @@ __all__ = [
     "sensor_get",
     "sensor_set",
     "sensor_from_file",
+    "sensor_cfa_integrate",
     "sensor_compute",
     "auto_exposure",
     "sensor_photon_noise",
@@ -96,11 +99,13 @@ __all__ = [
     "BAYER_PATTERN_MAP",
     "sensor_crop",
     "sensor_roi",
+    "sensor_roi_stats",
     "sensor_snr",
     "sensor_snr_luxsec",
     "sensor_plot",
     "sensor_ccm",
     "sensor_dng_read",
+    "sensor_dng_read_batch",
     "sensor_show_image",
     "sensor_show_cfa",
     "sensor_show_cfa_weights",
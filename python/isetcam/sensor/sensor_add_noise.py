@@ -5,9 +5,32 @@ import numpy as np
 
 from .sensor_class import Sensor
 from .sensor_get import sensor_get
+from ..ie_noise import ie_noise_normal, ie_noise_seed
+from ..ie_precision import ie_as_float, ie_precision
 
+# Stream identifiers of the sensor noise sources.
+_PHOTON, _PRNU, _DSNU = 0, 1, 2
 
-def sensor_add_noise(sensor: Sensor) -> tuple[np.ndarray, np.ndarray]:
+
+def _noise_state(sensor: Sensor) -> tuple[int, int, int]:
+    """Return ``(seed, stream, frame)`` for the noise of ``sensor``.
+
+    ``noise_seed``, ``noise_stream`` and ``noise_frame`` are optional sensor
+    attributes.  Without ``noise_seed`` a fresh seed is drawn from the
+    global ``np.random`` state on every call.
+    """
+    seed = ie_noise_seed(getattr(sensor, "noise_seed", None))
+    stream = int(getattr(sensor, "noise_stream", 0))
+    frame = int(getattr(sensor, "noise_frame", 0))
+    return seed, stream, frame
+
+
+def sensor_add_noise(
+    sensor: Sensor,
+    *,
+    origin: tuple[int, int] = (0, 0),
+    workers: int | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
     """Add DSNU and PRNU noise to ``sensor.volts``.
 
     The function draws additive dark-signal non-uniformity (DSNU) noise
@@ -17,10 +40,22 @@ def sensor_add_noise(sensor: Sensor) -> tuple[np.ndarray, np.ndarray]:
     ``sensor_get(sensor, "gain_sd")`` percent around unity.  The ``sensor``
     object is updated with the noisy volts.
 
+    Samples come from :func:`ie_noise_normal` keyed by the sensor's
+    ``noise_seed``, ``noise_stream`` and ``noise_frame``.  With a fixed
+    seed the noise of a pixel depends only on its frame and position, so
+    a frame computed in pieces, each with its ``origin``, matches the
+    frame computed at once.
+
     Parameters
     ----------
     sensor : Sensor
         Sensor containing voltage data and optional noise parameters.
+        ``volts`` may be a stack ``(frames, rows, cols)`` of consecutive
+        frames starting at ``noise_frame``.
+    origin : tuple of int, optional
+        ``(row, col)`` of ``volts[0, 0]`` within the full sensor frame.
+    workers : int, optional
+        Number of threads generating noise tiles.
 
     Returns
     -------
@@ -28,20 +63,24 @@ def sensor_add_noise(sensor: Sensor) -> tuple[np.ndarray, np.ndarray]:
         ``(noisy_volts, noise)`` where ``noisy_volts`` are the volts with
         noise added and ``noise`` is the difference from the original volts.
     """
-    volts = np.asarray(sensor.volts, dtype=float)
+    volts = ie_as_float(sensor.volts, ie_precision(sensor))
 
     gain_sd = sensor_get(sensor, "gain_sd") / 100.0
     offset_sd = sensor_get(sensor, "offset_sd")
+    seed, stream, frame = _noise_state(sensor)
+    opts = dict(frame=frame, origin=origin, workers=workers)
 
     if gain_sd == 0:
         gain = 1.0
     else:
-        gain = 1.0 + gain_sd * np.random.randn(*volts.shape)
+        z = ie_noise_normal(volts.shape, seed, stream=(stream, _PRNU), **opts)
+        gain = 1.0 + gain_sd * z
 
     if offset_sd == 0:
         offset = 0.0
     else:
-        offset = offset_sd * np.random.randn(*volts.shape)
+        z = ie_noise_normal(volts.shape, seed, stream=(stream, _DSNU), **opts)
+        offset = offset_sd * z
 
     noisy = volts * gain + offset
     sensor.volts = noisy
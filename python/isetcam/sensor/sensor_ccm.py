@@ -3,10 +3,14 @@
 
 from __future__ import annotations
 
+from pathlib import Path
+
 import numpy as np
 from scipy.io import loadmat
 
 from ..data_path import data_path
+from ..ie_roi_stats import ROIStats
+from ..ie_spectra_cache import ie_spectra_cache_load
 from .sensor_class import Sensor
 
 
@@ -53,24 +57,22 @@ def _chart_rectangles(corners: np.ndarray, n_rows: int = 4, n_cols: int = 6) ->
 def _patch_means(img: np.ndarray, centers: np.ndarray, delta: int) -> np.ndarray:
     """Return mean values around ``centers`` with square half-width ``delta``."""
     h, w = img.shape[:2]
-    n = centers.shape[1]
-    chans = 1 if img.ndim == 2 else img.shape[2]
-    out = np.zeros((n, chans), dtype=float)
-    for i in range(n):
-        r = int(round(centers[0, i]))
-        c = int(round(centers[1, i]))
-        r0 = max(r - delta // 2, 0)
-        c0 = max(c - delta // 2, 0)
-        r1 = min(r0 + delta, h)
-        c1 = min(c0 + delta, w)
-        patch = img[r0:r1, c0:c1]
-        out[i] = np.nanmean(patch.reshape(-1, chans), axis=0)
-    return out
+    r0 = np.maximum(np.round(centers[0]).astype(int) - delta // 2, 0)
+    c0 = np.maximum(np.round(centers[1]).astype(int) - delta // 2, 0)
+    r1 = np.minimum(r0 + delta, h)
+    c1 = np.minimum(c0 + delta, w)
+    rects = np.column_stack([c0, r0, c1 - c0, r1 - r0])
+    return ROIStats(img).mean(rects)
+
+
+def _read_ideal_macbeth(path: Path) -> dict:
+    mat = loadmat(path)
+    return {"lrgb": mat["mcc"][0, 0]["lrgbValuesMCC"].astype(float)}
 
 
 def _ideal_macbeth() -> np.ndarray:
-    mat = loadmat(data_path("surfaces/charts/macbethChartLinearRGB.mat"))
-    return mat["mcc"][0, 0]["lrgbValuesMCC"].astype(float)
+    path = data_path("surfaces/charts/macbethChartLinearRGB.mat")
+    return ie_spectra_cache_load(path, _read_ideal_macbeth, ("mcc",))["lrgb"]
 
 
 def sensor_ccm(sensor: Sensor, corners: np.ndarray) -> np.ndarray:
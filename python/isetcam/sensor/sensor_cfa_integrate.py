@@ -0,0 +1,106 @@
+# mypy: ignore-errors
+"""Integrate optical image photons against the sensor color filter array."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from .sensor_class import Sensor
+
+
+def _parse_pattern(letters: np.ndarray | str) -> np.ndarray | None:
+    """Return CFA pattern array if ``letters`` encodes a square pattern."""
+    if isinstance(letters, str):
+        size = int(np.sqrt(len(letters)))
+        if size * size == len(letters):
+            return np.array(list(letters)).reshape(size, size)
+        return None
+    letters = np.asarray(letters)
+    if letters.ndim == 2:
+        return letters
+    if letters.ndim == 1:
+        size = int(np.sqrt(letters.size))
+        if size * size == letters.size:
+            return letters.reshape(size, size)
+    return None
+
+
+def _sensor_qe(sensor: Sensor) -> np.ndarray:
+    qe = getattr(sensor, "qe", np.ones(sensor.wave.size, dtype=float))
+    qe = np.asarray(qe, dtype=float).reshape(-1)
+    if qe.size != sensor.wave.size:
+        raise ValueError("sensor.qe length must match sensor.wave")
+    return qe
+
+
+def sensor_cfa_integrate(sensor: Sensor, photons: np.ndarray) -> np.ndarray:
+    """Return the per-pixel signal of ``photons`` for a unit exposure time.
+
+    Each pixel is contracted only against the spectral response of its own
+    color filter.  The CFA is visited one phase at a time: for a ``pr x pc``
+    pattern the photons of phase ``(i, j)`` are the strided view
+    ``photons[i::pr, j::pc, :]``, which is multiplied by the combined
+    ``qe * filter`` vector of that phase.  No full-size temporary cube is
+    allocated.
+
+    Parameters
+    ----------
+    sensor : Sensor
+        Sensor providing ``wave`` and optionally ``qe``.  When the sensor
+        also has ``filter_spectra``, ``filter_color_letters`` and
+        ``filter_names`` the CFA pattern is applied, otherwise all
+        wavelengths are summed.
+    photons : np.ndarray
+        Photon data with shape ``(rows, cols, n_wave)``.  A stack of frames
+        ``(frames, rows, cols, n_wave)`` is integrated in one call.
+
+    Returns
+    -------
+    np.ndarray
+        Integrated signal with shape ``(rows, cols)``, or
+        ``(frames, rows, cols)`` for a stack.  Multiply by the exposure time
+        to obtain volts.
+    """
+    photons = np.asarray(photons)
+    if photons.shape[-1] != sensor.wave.size:
+        raise ValueError("OpticalImage and Sensor must have matching wavelengths")
+
+    # float32 photons stay float32; everything else is integrated in float64.
+    dtype = photons.dtype if photons.dtype == np.float32 else np.dtype(float)
+    qe = _sensor_qe(sensor).astype(dtype, copy=False)
+
+    has_cfa = hasattr(sensor, "filter_spectra") and hasattr(
+        sensor, "filter_color_letters"
+    )
+    if not has_cfa:
+        return photons @ qe
+
+    fs = np.asarray(sensor.filter_spectra, dtype=float)
+    if fs.shape[0] != sensor.wave.size:
+        raise ValueError("filter_spectra first dimension must match sensor.wave")
+    pattern = _parse_pattern(getattr(sensor, "filter_color_letters"))
+    if pattern is None:
+        raise ValueError("filter_color_letters must form a square CFA pattern")
+    fnames = getattr(sensor, "filter_names", None)
+    if fnames is None:
+        raise AttributeError("sensor missing 'filter_names'")
+    letter_map = {str(n)[0].lower(): i for i, n in enumerate(fnames)}
+
+    # Fold the quantum efficiency into the filters once.
+    weights = (fs * qe[:, np.newaxis]).astype(dtype, copy=False)
+
+    rows, cols = photons.shape[-3:-1]
+    pr, pc = pattern.shape
+    signal = np.empty(photons.shape[:-1], dtype=dtype)
+    for i in range(min(pr, rows)):
+        for j in range(min(pc, cols)):
+            letter = pattern[i, j]
+            idx = letter_map.get(str(letter).lower())
+            if idx is None:
+                raise ValueError(f"Unknown CFA letter '{letter}'")
+            out = signal[..., i::pr, j::pc]
+            np.matmul(photons[..., i::pr, j::pc, :], weights[:, idx], out=out)
+    return signal
+
+
+__all__ = ["sensor_cfa_integrate"]
@@ -5,75 +5,30 @@ from __future__ import annotations
 
 import numpy as np
 
+from ..ie_precision import ie_as_float, ie_precision
+from ..ie_trace import ie_trace_span
 from ..opticalimage import OpticalImage
 from .sensor_class import Sensor
 from .sensor_get import sensor_get
+from .sensor_cfa_integrate import sensor_cfa_integrate
 from .sensor_add_noise import sensor_add_noise
 from .sensor_gain_offset import sensor_gain_offset
 
 
-def _parse_pattern(letters: np.ndarray | str) -> np.ndarray | None:
-    """Return CFA pattern array if ``letters`` encodes a square pattern."""
-    if isinstance(letters, str):
-        size = int(np.sqrt(len(letters)))
-        if size * size == len(letters):
-            return np.array(list(letters)).reshape(size, size)
-        return None
-    letters = np.asarray(letters)
-    if letters.ndim == 2:
-        return letters
-    if letters.ndim == 1:
-        size = int(np.sqrt(letters.size))
-        if size * size == letters.size:
-            return letters.reshape(size, size)
-    return None
+def _exposure_from_signal(sensor: Sensor, signal: np.ndarray, level: float) -> float:
+    """Return the exposure time mapping the peak of ``signal`` to ``level``."""
+    max_signal = float(signal.max()) if signal.size else 0.0
+    if max_signal <= 0:
+        return 0.0
+    v_swing = sensor_get(sensor, "voltage_swing")
+    return float(level * v_swing / max_signal)
 
 
 def auto_exposure(sensor: Sensor, oi: OpticalImage, level: float = 0.95) -> float:
     """Return exposure time that keeps peak signal below ``level`` of swing."""
 
-    if oi.photons.shape[-1] != sensor.wave.size:
-        raise ValueError("OpticalImage and Sensor must have matching wavelengths")
-
-    qe = getattr(sensor, "qe", np.ones(sensor.wave.size, dtype=float))
-    qe = np.asarray(qe, dtype=float)
-    if qe.size != sensor.wave.size:
-        raise ValueError("sensor.qe length must match sensor.wave")
-
-    photons = np.asarray(oi.photons, dtype=float) * qe
-
-    if hasattr(sensor, "filter_spectra") and hasattr(sensor, "filter_color_letters"):
-        fs = np.asarray(sensor.filter_spectra, dtype=float)
-        if fs.shape[0] != sensor.wave.size:
-            raise ValueError("filter_spectra first dimension must match sensor.wave")
-        pattern = _parse_pattern(getattr(sensor, "filter_color_letters"))
-        if pattern is None:
-            raise ValueError("filter_color_letters must form a square CFA pattern")
-        fnames = getattr(sensor, "filter_names", None)
-        if fnames is None:
-            raise AttributeError("sensor missing 'filter_names'")
-        letter_map = {str(n)[0].lower(): i for i, n in enumerate(fnames)}
-        pr, pc = pattern.shape
-        rows, cols = sensor.volts.shape[:2]
-        mosaic = np.tile(pattern, (rows // pr + 1, cols // pc + 1))[:rows, :cols]
-        max_signal = 0.0
-        for letter in np.unique(mosaic):
-            idx = letter_map.get(str(letter).lower())
-            if idx is None:
-                raise ValueError(f"Unknown CFA letter '{letter}'")
-            spectral = fs[:, idx]
-            integ = (photons * spectral).sum(axis=2)
-            val = float(np.max(integ[mosaic == letter]))
-            if val > max_signal:
-                max_signal = val
-    else:
-        max_signal = float((photons.sum(axis=2)).max())
-
-    if max_signal <= 0:
-        return 0.0
-
-    v_swing = sensor_get(sensor, "voltage_swing")
-    return float(level * v_swing / max_signal)
+    signal = sensor_cfa_integrate(sensor, oi.photons)
+    return _exposure_from_signal(sensor, signal, level)
 
 
 def sensor_compute(sensor: Sensor, oi: OpticalImage) -> Sensor:
@@ -83,7 +38,9 @@ def sensor_compute(sensor: Sensor, oi: OpticalImage) -> Sensor:
     ----------
     sensor : Sensor
         Sensor dataclass which may optionally contain a ``qe`` attribute
-        giving the quantum efficiency for each wavelength sample.
+        giving the quantum efficiency for each wavelength sample.  The
+        volts are computed in the sensor precision (see
+        :func:`ie_precision`).
     oi : OpticalImage
         Optical image providing photon data.
 
@@ -91,52 +48,31 @@ def sensor_compute(sensor: Sensor, oi: OpticalImage) -> Sensor:
     -------
     Sensor
         ``sensor`` with its ``volts`` attribute set to the integrated
-        response.
+        response.  ``sensor.noise_frame`` is advanced by one so repeated
+        calls with a fixed ``noise_seed`` draw fresh noise.
     """
-    if oi.photons.shape[-1] != sensor.wave.size:
-        raise ValueError("OpticalImage and Sensor must have matching wavelengths")
-
-    if getattr(sensor, "auto_exposure", False):
-        sensor.exposure_time = auto_exposure(sensor, oi)
-
-    qe = getattr(sensor, "qe", np.ones(sensor.wave.size, dtype=float))
-    qe = np.asarray(qe, dtype=float)
-    if qe.size != sensor.wave.size:
-        raise ValueError("sensor.qe length must match sensor.wave")
-
-    photons = np.asarray(oi.photons, dtype=float) * qe
-
-    if hasattr(sensor, "filter_spectra") and hasattr(sensor, "filter_color_letters"):
-        fs = np.asarray(sensor.filter_spectra, dtype=float)
-        if fs.shape[0] != sensor.wave.size:
-            raise ValueError("filter_spectra first dimension must match sensor.wave")
-        pattern = _parse_pattern(getattr(sensor, "filter_color_letters"))
-        if pattern is None:
-            raise ValueError("filter_color_letters must form a square CFA pattern")
-        fnames = getattr(sensor, "filter_names", None)
-        if fnames is None:
-            raise AttributeError("sensor missing 'filter_names'")
-        letter_map = {str(n)[0].lower(): i for i, n in enumerate(fnames)}
-        pr, pc = pattern.shape
-        rows, cols = sensor.volts.shape[:2]
-        mosaic = np.tile(pattern, (rows // pr + 1, cols // pc + 1))[:rows, :cols]
-        volts = np.zeros((rows, cols), dtype=float)
-        for letter in np.unique(mosaic):
-            idx = letter_map.get(str(letter).lower())
-            if idx is None:
-                raise ValueError(f"Unknown CFA letter '{letter}'")
-            spectral = fs[:, idx]
-            integ = (photons * spectral).sum(axis=2) * float(sensor.exposure_time)
-            volts[mosaic == letter] = integ[mosaic == letter]
-    else:
-        volts = photons.sum(axis=2) * float(sensor.exposure_time)
-
-    sensor.volts = volts
-
-    sensor_add_noise(sensor)
-    gain = getattr(sensor, "analog_gain", 1.0)
-    offset = getattr(sensor, "analog_offset", 0.0)
-    sensor_gain_offset(sensor, gain=gain, offset=offset)
+    with ie_trace_span("sensor_compute"):
+        # The CFA integration is shared between auto exposure and the volts
+        # so the photon cube is only traversed once.
+        with ie_trace_span("cfa_integrate", photons=oi.photons) as span:
+            photons = ie_as_float(oi.photons, ie_precision(sensor))
+            signal = sensor_cfa_integrate(sensor, photons)
+            span.note(out=signal)
+
+        if getattr(sensor, "auto_exposure", False):
+            with ie_trace_span("auto_exposure"):
+                sensor.exposure_time = _exposure_from_signal(sensor, signal, 0.95)
+
+        signal *= float(sensor.exposure_time)
+        sensor.volts = signal
+
+        with ie_trace_span("noise", volts=signal):
+            sensor_add_noise(sensor)
+        with ie_trace_span("gain_offset") as span:
+            gain = getattr(sensor, "analog_gain", 1.0)
+            offset = getattr(sensor, "analog_offset", 0.0)
+            sensor_gain_offset(sensor, gain=gain, offset=offset)
+            span.note(out=sensor.volts)
+        sensor.noise_frame = int(getattr(sensor, "noise_frame", 0)) + 1
 
     return sensor
-
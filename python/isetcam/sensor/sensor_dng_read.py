@@ -4,49 +4,67 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Any, Dict, Iterable, List
 
 import numpy as np
 
-try:  # pragma: no cover - optional dependency
-    import rawpy  # type: ignore
-except Exception:  # pragma: no cover - library may not be present
-    rawpy = None  # type: ignore
-
-from ..io import dng_read
+from ..io import dng_read_raw, dng_read_stack
+from ..io.dng_read import _dng_paths
+from ..ie_precision import ie_as_float
 from .sensor_class import Sensor
 
 
-def sensor_dng_read(path: str | Path) -> Sensor:
+def _dng_sensor(data: np.ndarray, meta: Dict[str, Any], name: str, dtype) -> Sensor:
+    exposure = meta.get("exposure")
+    exposure_time = float(exposure) if exposure is not None else 0.0
+    if dtype is not None:
+        data = ie_as_float(data, dtype)
+    sensor = Sensor(volts=data, exposure_time=exposure_time, name=name)
+
+    if meta.get("iso_speed") is not None:
+        sensor.iso_speed = meta["iso_speed"]
+    if meta.get("orientation") is not None:
+        sensor.orientation = meta["orientation"]
+    if meta.get("black_level") is not None:
+        sensor.black_level = np.asarray(meta["black_level"]).reshape(-1)
+    if meta.get("white_level") is not None:
+        sensor.white_level = meta["white_level"]
+    return sensor
+
+
+def sensor_dng_read(path: str | Path, dtype: Any = None) -> Sensor:
     """Read ``path`` as a DNG image and return a :class:`Sensor`.
 
-    The raw pixel data are stored in ``sensor.volts`` and common metadata
-    such as ISO speed, exposure time, orientation and black level are stored
-    as attributes on the returned object when available.
+    The file is opened once for both the pixels and the metadata.  The raw
+    pixel data are stored in ``sensor.volts`` as the native ``uint16``
+    values; the processing functions convert them to floating point when
+    used.  Pass ``dtype`` (``"single"``, ``"double"`` or a float dtype) to
+    convert them up front.  Common metadata such as ISO speed, exposure
+    time, orientation, black and white level are stored as attributes on
+    the returned object when available.
     """
-    if rawpy is None:  # pragma: no cover - dependency missing
-        raise RuntimeError("rawpy library is not available")
-
     p = Path(path)
+    data, meta = dng_read_raw(p)
+    return _dng_sensor(data, meta, p.name, dtype)
 
-    # Raw sensor values
-    data = dng_read(p)
 
-    # Extract metadata using rawpy
-    with rawpy.imread(str(p)) as raw:
-        meta = raw.metadata
-        iso_speed = getattr(meta, "iso_speed", None)
-        exposure = getattr(meta, "exposure", None)
-        orientation = getattr(meta, "orientation", None)
-        black_level = getattr(meta, "black_level_per_channel", None)
+def sensor_dng_read_batch(
+    paths: str | Path | Iterable[str | Path],
+    workers: int | None = None,
+) -> List[Sensor]:
+    """Read a burst of DNG files, or the DNG files of a directory.
 
-    exposure_time = float(exposure) if exposure is not None else 0.0
-    sensor = Sensor(volts=data.astype(float), exposure_time=exposure_time, name=p.name)
+    The files are decoded by ``workers`` threads into a single
+    ``(N, H, W)`` ``uint16`` stack (see :func:`~isetcam.io.dng_read_stack`)
+    and the ``volts`` of each returned sensor is a view of its slice.
+    All files must have the same size.
+    """
+    files = _dng_paths(paths)
+    stack, metas = dng_read_stack(files, workers)
+    return [
+        _dng_sensor(data, meta, f.name, None)
+        for data, meta, f in zip(stack, metas, files)
+    ]
 
-    if iso_speed is not None:
-        sensor.iso_speed = iso_speed
-    if orientation is not None:
-        sensor.orientation = orientation
-    if black_level is not None:
-        sensor.black_level = np.asarray(black_level).reshape(-1)
 
-    return sensor
+__all__ = ["sensor_dng_read", "sensor_dng_read_batch"]
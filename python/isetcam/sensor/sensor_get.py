@@ -17,9 +17,10 @@ def sensor_get(sensor: Sensor, param: str) -> Any:
     Supported parameters are ``volts``, ``wave``, ``n_wave``/``nwave``,
     ``exposure_time``/``exposure time`` and ``name``.  Additional optional
     noise related parameters are ``conversion_gain``, ``read_noise_electrons``,
-    ``gain_sd`` (in percent), ``offset_sd`` and ``voltage_swing``.  These are
-    returned as attributes on ``sensor`` and default to sensible values when
-    absent.
+    ``gain_sd`` (in percent), ``offset_sd`` and ``voltage_swing``, the noise
+    generator state ``noise_seed``, ``noise_stream`` and ``noise_frame``, and
+    the data ``precision``.  These are returned as attributes on ``sensor``
+    and default to sensible values when absent.
     """
     key = ie_param_format(param)
     if key == "volts":
@@ -42,6 +43,14 @@ def sensor_get(sensor: Sensor, param: str) -> Any:
         return getattr(sensor, "offset_sd", 0.0)
     if key in {"voltageswing", "voltage_swing"}:
         return getattr(sensor, "voltage_swing", 1.0)
+    if key == "precision":
+        return getattr(sensor, "precision", None)
+    if key in {"noiseseed", "noise_seed"}:
+        return getattr(sensor, "noise_seed", None)
+    if key in {"noisestream", "noise_stream"}:
+        return getattr(sensor, "noise_stream", 0)
+    if key in {"noiseframe", "noise_frame"}:
+        return getattr(sensor, "noise_frame", 0)
     if key in {"ncolors", "n_colors"}:
         if hasattr(sensor, "n_colors") and sensor.n_colors is not None:
             return sensor.n_colors
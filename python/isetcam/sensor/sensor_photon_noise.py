@@ -4,19 +4,33 @@ from __future__ import annotations
 import numpy as np
 
 from .sensor_class import Sensor
+from .sensor_add_noise import _PHOTON, _noise_state
+from ..ie_noise import ie_noise_poisson
+from ..ie_precision import ie_as_float, ie_precision
 
 
-def sensor_photon_noise(sensor: Sensor) -> tuple[np.ndarray, np.ndarray]:
+def sensor_photon_noise(
+    sensor: Sensor,
+    *,
+    origin: tuple[int, int] = (0, 0),
+    workers: int | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
     """Apply photon noise to sensor volts.
 
     A Gaussian approximation is used when the mean signal is at least 15;
     otherwise samples are drawn from a Poisson distribution. The ``sensor``
-    object is updated with the noisy volts.
+    object is updated with the noisy volts.  Samples come from
+    :func:`ie_noise_poisson` keyed by the sensor's ``noise_seed``,
+    ``noise_stream`` and ``noise_frame`` as in :func:`sensor_add_noise`.
 
     Parameters
     ----------
     sensor : Sensor
         Sensor providing the mean voltage data.
+    origin : tuple of int, optional
+        ``(row, col)`` of ``volts[0, 0]`` within the full sensor frame.
+    workers : int, optional
+        Number of threads generating noise tiles.
 
     Returns
     -------
@@ -24,20 +38,18 @@ def sensor_photon_noise(sensor: Sensor) -> tuple[np.ndarray, np.ndarray]:
         ``(noisy_volts, noise)`` where ``noisy_volts`` are the volts with
         noise added and ``noise`` is the difference from the mean volts.
     """
-    volts = np.asarray(sensor.volts, dtype=float)
-
-    noisy = np.empty_like(volts, dtype=float)
-    noise = np.empty_like(volts, dtype=float)
-
-    mask = volts >= 15
-    if np.any(mask):
-        g_noise = np.sqrt(volts[mask]) * np.random.randn(*volts[mask].shape)
-        noisy[mask] = volts[mask] + g_noise
-        noise[mask] = g_noise
-    if np.any(~mask):
-        samples = np.random.poisson(volts[~mask])
-        noisy[~mask] = samples
-        noise[~mask] = samples - volts[~mask]
+    volts = ie_as_float(sensor.volts, ie_precision(sensor))
+
+    seed, stream, frame = _noise_state(sensor)
+    noisy = ie_noise_poisson(
+        volts,
+        seed,
+        stream=(stream, _PHOTON),
+        frame=frame,
+        origin=origin,
+        workers=workers,
+    )
+    noise = noisy - volts
 
     sensor.volts = noisy
     return noisy, noise
@@ -8,14 +8,7 @@ from typing import Sequence
 import numpy as np
 
 from .sensor_class import Sensor
-
-
-def _interp_matrix(data: np.ndarray, src_wave: np.ndarray, tgt_wave: np.ndarray) -> np.ndarray:
-    """Helper to interpolate columns of ``data`` to ``tgt_wave``."""
-    out = np.empty((tgt_wave.size, data.shape[1]), dtype=float)
-    for i in range(data.shape[1]):
-        out[:, i] = np.interp(tgt_wave, src_wave, data[:, i], left=0.0, right=0.0)
-    return out
+from ..ie_spectral_resample import ie_spectral_resample
 
 
 def sensor_resample_wave(sensor: Sensor, wave: Sequence[float]) -> Sensor:
@@ -40,19 +33,19 @@ def sensor_resample_wave(sensor: Sensor, wave: Sequence[float]) -> Sensor:
         qe = np.asarray(qe, dtype=float).reshape(-1)
         if qe.size != src_wave.size:
             raise ValueError("sensor.qe length must match sensor.wave")
-        out.qe = np.interp(tgt_wave, src_wave, qe, left=0.0, right=0.0)
+        out.qe = ie_spectral_resample(qe, src_wave, tgt_wave)
 
     if hasattr(sensor, "filter_spectra"):
         filt = np.asarray(sensor.filter_spectra, dtype=float)
         if filt.shape[0] != src_wave.size:
             raise ValueError("filter_spectra first dimension must match sensor.wave")
-        out.filter_spectra = _interp_matrix(filt, src_wave, tgt_wave)
+        out.filter_spectra = ie_spectral_resample(filt, src_wave, tgt_wave, axis=0)
 
     if hasattr(sensor, "ir_filter"):
         ir = np.asarray(sensor.ir_filter, dtype=float).reshape(-1)
         if ir.size != src_wave.size:
             raise ValueError("ir_filter length must match sensor.wave")
-        out.ir_filter = np.interp(tgt_wave, src_wave, ir, left=0.0, right=0.0)
+        out.ir_filter = ie_spectral_resample(ir, src_wave, tgt_wave)
 
     return out
 
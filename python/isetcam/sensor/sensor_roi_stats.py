@@ -0,0 +1,51 @@
+# mypy: ignore-errors
+"""Reusable ROI statistics index of the volts of a :class:`Sensor`."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from ..ie_roi_stats import ROIStats
+from .sensor_cfa_integrate import _parse_pattern
+from .sensor_class import Sensor
+
+
+def _channel_pattern(sensor: Sensor) -> np.ndarray | None:
+    """Return the CFA pattern as indices into ``sensor.filter_names``."""
+    pattern = _parse_pattern(getattr(sensor, "filter_color_letters", None))
+    fnames = getattr(sensor, "filter_names", None)
+    if pattern is None or fnames is None:
+        return None
+    letter_map = {str(n)[0].lower(): i for i, n in enumerate(fnames)}
+    idx = [letter_map.get(str(letter).lower()) for letter in pattern.ravel()]
+    if None in idx:
+        raise ValueError("Unknown CFA letter in filter_color_letters")
+    return np.array(idx).reshape(pattern.shape)
+
+
+def sensor_roi_stats(sensor: Sensor, cfa: bool = True) -> ROIStats:
+    """Return the :class:`~isetcam.ie_roi_stats.ROIStats` of ``sensor.volts``.
+
+    With ``cfa`` a 2-D mosaic of a sensor with ``filter_color_letters``
+    and ``filter_names`` is measured per color filter, in the order of
+    ``filter_names``.  Otherwise each channel of ``sensor.volts`` is
+    measured.
+
+    The index is built on first use and kept on the sensor, so that any
+    number of rectangles can be measured on the same frame.  It is rebuilt
+    when ``sensor.volts`` is replaced; after modifying the volts in place
+    assign them again to refresh it.
+    """
+    volts = sensor.volts
+    cache = getattr(sensor, "_roi_stats", None)
+    if cache is None or cache[0] is not volts:
+        cache = (volts, {})
+        sensor._roi_stats = cache
+    key = bool(cfa)
+    if key not in cache[1]:
+        pattern = _channel_pattern(sensor) if cfa and np.ndim(volts) == 2 else None
+        cache[1][key] = ROIStats(volts, pattern)
+    return cache[1][key]
+
+
+__all__ = ["sensor_roi_stats"]
@@ -9,6 +9,7 @@ import numpy as np
 
 from .sensor_class import Sensor
 from ..ie_param_format import ie_param_format
+from ..ie_precision import ie_as_float
 
 
 def sensor_set(sensor: Sensor, param: str, val: Any) -> None:
@@ -17,8 +18,10 @@ def sensor_set(sensor: Sensor, param: str, val: Any) -> None:
     Supported parameters are ``volts``, ``wave``, ``exposure_time``/``exposure time``
     and ``name``. ``n_wave`` is derived from ``wave`` and therefore cannot be set.
     Noise related parameters (``conversion_gain``, ``read_noise_electrons``,
-    ``gain_sd``, ``offset_sd`` and ``voltage_swing``) are stored as attributes on
-    ``sensor`` when supplied.
+    ``gain_sd``, ``offset_sd`` and ``voltage_swing``) and the noise generator
+    state (``noise_seed``, ``noise_stream`` and ``noise_frame``) are stored as
+    attributes on ``sensor`` when supplied.  ``precision`` sets the floating
+    point precision of the sensor data and converts ``volts``.
     """
     key = ie_param_format(param)
     if key == "volts":
@@ -48,4 +51,19 @@ def sensor_set(sensor: Sensor, param: str, val: Any) -> None:
     if key in {"voltageswing", "voltage_swing"}:
         sensor.voltage_swing = float(val)
         return
+    if key == "precision":
+        # Convert first: an invalid precision raises before anything is set.
+        if val is not None:
+            sensor.volts = ie_as_float(sensor.volts, val)
+        sensor.precision = val
+        return
+    if key in {"noiseseed", "noise_seed"}:
+        sensor.noise_seed = None if val is None else int(val)
+        return
+    if key in {"noisestream", "noise_stream"}:
+        sensor.noise_stream = int(val)
+        return
+    if key in {"noiseframe", "noise_frame"}:
+        sensor.noise_frame = int(val)
+        return
     raise KeyError(f"Unknown or read-only sensor parameter '{param}'")
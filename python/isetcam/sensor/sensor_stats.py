@@ -7,6 +7,7 @@ import numpy as np
 
 from .sensor_class import Sensor
 from .sensor_photon_noise import sensor_photon_noise
+from .sensor_roi_stats import sensor_roi_stats
 
 
 def sensor_stats(
@@ -28,7 +29,8 @@ def sensor_stats(
         :func:`sensor_photon_noise` before computing the statistics.  The
         ``sensor`` object is updated with the noisy volts and noise is
         measured from the added noise.  When ``False`` noise is estimated
-        from the standard deviation of the ROI data.
+        from the standard deviation of the ROI data, read from the
+        :func:`sensor_roi_stats` index of the sensor without copying it.
 
     Returns
     -------
@@ -43,17 +45,16 @@ def sensor_stats(
     if w <= 0 or h <= 0:
         raise ValueError("width and height must be positive")
 
-    volts = np.asarray(sensor.volts, dtype=float)
-    if x < 0 or y < 0 or x + w > volts.shape[1] or y + h > volts.shape[0]:
+    rows, cols = np.shape(sensor.volts)[:2]
+    if x < 0 or y < 0 or x + w > cols or y + h > rows:
         raise ValueError("roi is outside the sensor bounds")
 
-    if use_photon_noise:
-        noisy_volts, noise_full = sensor_photon_noise(sensor)
-        roi_volts = noisy_volts[y : y + h, x : x + w, ...]
-        roi_noise = noise_full[y : y + h, x : x + w, ...]
-    else:
-        roi_volts = volts[y : y + h, x : x + w, ...]
-        roi_noise = roi_volts - np.nanmean(roi_volts, axis=(0, 1), keepdims=True)
+    if not use_photon_noise:
+        return sensor_roi_stats(sensor, cfa=False).stats((x, y, w, h))
+
+    noisy_volts, noise_full = sensor_photon_noise(sensor)
+    roi_volts = noisy_volts[y : y + h, x : x + w, ...]
+    roi_noise = noise_full[y : y + h, x : x + w, ...]
 
     if roi_volts.ndim == 2:
         roi_volts = roi_volts[..., np.newaxis]
@@ -7,7 +7,7 @@ import numpy as np
 
 from .ie_xyz_from_energy import ie_xyz_from_energy
 from .xyz_to_uv import xyz_to_uv
-from .cct import cct
+from .cct import _cct_uv
 
 __all__ = ["spd_to_cct"]
 
@@ -43,6 +43,6 @@ def spd_to_cct(wave: np.ndarray, spd: np.ndarray) -> tuple[np.ndarray, np.ndarra
 
     xyz = ie_xyz_from_energy(spd.T, wave)
     uv = xyz_to_uv(xyz, mode="uv")
-    temps = np.array([cct(uv[i].reshape(1, 2)) for i in range(uv.shape[0])])
+    temps = _cct_uv(uv[:, 0], uv[:, 1])
 
     return temps.squeeze(), uv
@@ -3,6 +3,8 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 import numpy as np
 from scipy.io import loadmat
 
@@ -15,6 +17,7 @@ from .illuminant import illuminant_blackbody
 __all__ = ["srgb_to_cct"]
 
 
+@lru_cache(maxsize=1)
 def _default_table() -> np.ndarray:
     """Return lookup table of xy chromaticities for sample color temperatures."""
     wave = np.arange(400, 701, 10)
@@ -52,7 +55,7 @@ def srgb_to_cct(rgb: np.ndarray, *, table: np.ndarray | None = None) -> tuple[fl
     """
     rgb = np.asarray(rgb, dtype=float)
     if table is None:
-        table = _default_table()
+        table = _default_table().copy()
     ctemps = table[:, 0]
     xy_table = table[:, 1:]
 
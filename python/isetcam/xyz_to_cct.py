@@ -6,13 +6,13 @@ from __future__ import annotations
 import numpy as np
 
 from .xyz_to_uv import xyz_to_uv
-from .cct import cct
+from .cct import CCT_CHUNK, _cct_uv
 from .rgb_to_xw_format import rgb_to_xw_format
 
 __all__ = ["xyz_to_cct"]
 
 
-def xyz_to_cct(xyz: np.ndarray) -> np.ndarray:
+def xyz_to_cct(xyz: np.ndarray, *, chunk_size: int = CCT_CHUNK) -> np.ndarray:
     """Return estimated correlated color temperature from XYZ tristimulus values.
 
     Parameters
@@ -20,6 +20,9 @@ def xyz_to_cct(xyz: np.ndarray) -> np.ndarray:
     xyz : np.ndarray
         XYZ values in either ``(n, 3)`` XW format or ``(rows, cols, 3)`` RGB
         format.
+    chunk_size : int, optional
+        Number of pixels processed together.  The work space grows with the
+        chunk size times the number of isotemperature lines.
 
     Returns
     -------
@@ -39,7 +42,7 @@ def xyz_to_cct(xyz: np.ndarray) -> np.ndarray:
         raise ValueError("xyz must be (n,3) or (rows,cols,3)")
 
     uv = xyz_to_uv(xw, mode="uv")
-    temps = np.array([cct(uv[i].reshape(1, 2)) for i in range(uv.shape[0])])
+    temps = _cct_uv(uv[:, 0], uv[:, 1], chunk_size)
 
     if reshape:
         temps = temps.reshape(r, c)
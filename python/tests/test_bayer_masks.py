@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+from isetcam.imgproc import bayer_masks, bayer_phases, ie_bilinear
+
+
+def test_bayer_masks_grbg():
+    r, g, b = bayer_masks("grbg", (3, 4))
+    assert np.array_equal(r, [[0, 1, 0, 1], [0, 0, 0, 0], [0, 1, 0, 1]])
+    assert np.array_equal(b, [[0, 0, 0, 0], [1, 0, 1, 0], [0, 0, 0, 0]])
+    assert np.array_equal(g, ~(r | b))
+    assert not r.flags.writeable
+
+
+def test_bayer_masks_cached():
+    assert bayer_masks("rggb", (4, 4))[0] is bayer_masks("RGGB", [4, 4])[0]
+
+
+def test_bayer_phases_are_views():
+    mosaic = np.arange(16.0).reshape(4, 4)
+    phases = bayer_phases("rggb")
+    assert len(phases["g"]) == 2
+    rs, cs = phases["b"][0]
+    view = mosaic[rs, cs]
+    assert np.shares_memory(view, mosaic)
+    assert np.array_equal(view, [[5, 7], [13, 15]])
+
+
+def test_bayer_masks_bad_pattern():
+    with pytest.raises(ValueError):
+        bayer_masks("rgbw", (2, 2))
+
+
+def test_bilinear_interior_values():
+    bayer = np.arange(1.0, 26.0).reshape(5, 5)
+    out = ie_bilinear(bayer, "rggb")
+    # Blue at a red site is the mean of the four diagonal blue samples.
+    assert np.isclose(out[2, 2, 2], np.mean([7.0, 9.0, 17.0, 19.0]))
+    # Red at a green site on a red row is the mean of its horizontal pair.
+    assert np.isclose(out[2, 1, 0], np.mean([11.0, 13.0]))
+    # Green at a blue site is the mean of the four neighbours.
+    assert np.isclose(out[1, 1, 1], np.mean([2.0, 6.0, 8.0, 12.0]))
@@ -0,0 +1,60 @@
+import json
+
+import pytest
+
+from isetcam.bench import BENCH_CASES, bench_compare, bench_load, bench_run, bench_save
+from isetcam.cli import main
+
+
+def test_bench_run_grid_and_round_trip(tmp_path):
+    report = bench_run(
+        stages=["scene_create", "iso12233_sfr"],
+        sizes=[16, 32],
+        n_waves=[4, 8],
+        repeat=2,
+    )
+    rows = [(r["stage"], r["size"], r["n_wave"]) for r in report["results"]]
+    assert rows == [
+        ("scene_create", 16, 4),
+        ("scene_create", 16, 8),
+        ("scene_create", 32, 4),
+        ("scene_create", 32, 8),
+        ("iso12233_sfr", 16, None),
+        ("iso12233_sfr", 32, None),
+    ]
+    for r in report["results"]:
+        assert len(r["times"]) == 2
+        assert r["best"] <= r["median"]
+        assert r["peak_bytes"] >= 0
+
+    path = tmp_path / "bench.json"
+    bench_save(report, path)
+    assert bench_load(path) == json.loads(json.dumps(report))
+    assert "ip_compute" in BENCH_CASES
+    with pytest.raises(ValueError):
+        bench_run(stages=["nope"])
+
+
+def test_bench_compare_flags_regressions():
+    def entry(median, peak):
+        return {"stage": "s", "size": 8, "n_wave": None, "median": median,
+                "peak_bytes": peak}
+
+    baseline = {"results": [entry(1.0, 100)]}
+    assert bench_compare({"results": [entry(1.05, 100)]}, baseline) == []
+    regs = bench_compare({"results": [entry(2.0, 300)]}, baseline, threshold=0.5)
+    assert [r["metric"] for r in regs] == ["median", "peak_bytes"]
+    assert regs[0]["ratio"] == pytest.approx(2.0)
+
+
+def test_cli_bench_compare(tmp_path, capsys):
+    out = tmp_path / "run.json"
+    args = ["bench", "--stages", "iso12233_sfr", "--sizes", "16", "--repeat", "1"]
+    assert main(args + ["--output", str(out)]) == 0
+    report = bench_load(out)
+    for r in report["results"]:
+        r["median"] /= 1000.0
+    base = tmp_path / "base.json"
+    bench_save(report, base)
+    assert main(args + ["--baseline", str(base)]) == 1
+    assert "REGRESSION iso12233_sfr" in capsys.readouterr().out
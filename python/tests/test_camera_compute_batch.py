@@ -0,0 +1,103 @@
+import numpy as np
+import pytest
+
+from isetcam.camera import camera_compute, camera_compute_batch, camera_create
+from isetcam.display import Display
+from isetcam.ip import ip_compute
+from isetcam.optics import Optics
+from isetcam.opticalimage import oi_compute
+from isetcam.scene import Scene
+from isetcam.sensor import Sensor, sensor_compute
+
+
+def _scenes(n: int = 3, h: int = 4, w: int = 6, n_wave: int = 3) -> list[Scene]:
+    wave = np.arange(500, 500 + 10 * n_wave, 10)
+    rng = np.random.default_rng(0)
+    return [
+        Scene(photons=rng.random((h, w, n_wave)), wave=wave) for _ in range(n)
+    ]
+
+
+def _bayer_sensor(wave: np.ndarray) -> Sensor:
+    s = Sensor(volts=np.zeros((4, 6)), wave=wave, exposure_time=1.0)
+    s.filter_spectra = np.array(
+        [[1.0, 0.2, 0.0], [0.2, 1.0, 0.2], [0.0, 0.2, 1.0]]
+    )
+    s.filter_names = ["r", "g", "b"]
+    s.filter_color_letters = "rggb"
+    return s
+
+
+def test_camera_compute_batch_matches_per_frame():
+    scenes = _scenes()
+    cam = camera_create()
+    volts, rgb = camera_compute_batch(cam, scenes, exposure_times=[1.0, 0.5, 2.0])
+    assert rgb is None
+    assert volts.shape == (3, 4, 6)
+    for sc, et, v in zip(scenes, [1.0, 0.5, 2.0], volts):
+        ref = camera_create()
+        ref.sensor.exposure_time = et
+        ref = camera_compute(ref, sc)
+        assert np.allclose(v, ref.sensor.volts)
+    assert np.allclose(cam.sensor.volts, volts[-1])
+    assert cam.sensor.exposure_time == 2.0
+
+
+def test_camera_compute_batch_chunking_and_stack_input():
+    scenes = _scenes(n=5)
+    stack = np.stack([sc.photons for sc in scenes])
+    v1, _ = camera_compute_batch(camera_create(), scenes, chunk_size=2)
+    v2, _ = camera_compute_batch(
+        camera_create(), stack, wave=scenes[0].wave, chunk_size=8
+    )
+    v3, _ = camera_compute_batch(camera_create(), iter(scenes), chunk_size=1)
+    assert np.allclose(v1, v2)
+    assert np.allclose(v1, v3)
+
+
+def test_camera_compute_batch_optics_cfa_display():
+    scenes = _scenes(n=2)
+    wave = scenes[0].wave
+    optics = Optics(f_number=4.0, f_length=0.004, wave=wave)
+    display = Display(
+        spd=np.eye(3),
+        wave=wave,
+        gamma=np.linspace(0, 1, 256)[:, None].repeat(3, axis=1),
+    )
+    cam = camera_create()
+    cam.sensor = _bayer_sensor(wave)
+    volts, rgb = camera_compute_batch(cam, scenes, optics=optics, display=display)
+    assert rgb.shape == (2, 4, 6, 3)
+    for sc, v, r in zip(scenes, volts, rgb):
+        sensor = sensor_compute(_bayer_sensor(wave), oi_compute(sc, optics))
+        assert np.allclose(v, sensor.volts)
+        assert np.allclose(r, ip_compute(sensor, display).rgb)
+
+
+def test_camera_compute_batch_errors():
+    scenes = _scenes(n=2)
+    odd = Scene(photons=np.ones((2, 2, 3)), wave=scenes[0].wave)
+    with pytest.raises(ValueError):
+        camera_compute_batch(camera_create(), scenes + [odd])
+    with pytest.raises(ValueError):
+        camera_compute_batch(camera_create(), scenes, exposure_times=[1.0, 2.0, 3.0])
+    with pytest.raises(ValueError):
+        camera_compute_batch(camera_create(), np.ones((2, 2, 2, 3)))
+
+
+def test_camera_compute_batch_seeded_noise_matches_serial():
+    scenes = _scenes(n=3)
+    cam = camera_create()
+    cam.sensor.noise_seed = 5
+    cam.sensor.gain_sd = 2.0
+    cam.sensor.offset_sd = 0.01
+    volts, _ = camera_compute_batch(cam, scenes, chunk_size=2)
+    assert cam.sensor.noise_frame == 3
+
+    ref = camera_create()
+    ref.sensor.noise_seed = 5
+    ref.sensor.gain_sd = 2.0
+    ref.sensor.offset_sd = 0.01
+    for sc, v in zip(scenes, volts):
+        ref = camera_compute(ref, sc)
+        assert np.array_equal(v, ref.sensor.volts)
@@ -0,0 +1,131 @@
+import importlib
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pytest
+
+from isetcam.camera import camera_compute_tiled, camera_create
+from isetcam.camera.camera_compute_tiled import _psf_radius
+from isetcam.display import Display
+from isetcam.ip import ip_compute
+from isetcam.opticalimage import oi_compute, oi_otf_cache_clear
+from isetcam.optics import Optics
+from isetcam.scene import Scene, scene_from_memmap, scene_to_memmap
+from isetcam.sensor import Sensor, sensor_compute
+
+WAVE = np.arange(450, 660, 30)
+
+
+def _scene(rows: int = 70, cols: int = 54) -> Scene:
+    rng = np.random.default_rng(0)
+    scene = Scene(photons=rng.random((rows, cols, WAVE.size)), wave=WAVE)
+    scene.sample_spacing = 2e-6
+    return scene
+
+
+def _sensor(rows: int = 70, cols: int = 54) -> Sensor:
+    s = Sensor(volts=np.zeros((rows, cols)), wave=WAVE, exposure_time=1e4)
+    s.filter_spectra = np.stack(
+        [np.exp(-((WAVE - c) / 50.0) ** 2) for c in (600, 540, 460)], axis=1
+    )
+    s.filter_names = ["r", "g", "b"]
+    s.filter_color_letters = "rggb"
+    s.gain_sd = 1.0
+    s.offset_sd = 1e-3
+    s.noise_seed = 3
+    return s
+
+
+def _display() -> Display:
+    return Display(
+        spd=np.eye(WAVE.size)[:, :3],
+        wave=WAVE,
+        gamma=np.linspace(0, 1, 256)[:, None].repeat(3, axis=1),
+    )
+
+
+def _camera(rows: int = 70, cols: int = 54):
+    cam = camera_create()
+    cam.sensor = _sensor(rows, cols)
+    return cam
+
+
+def test_camera_compute_tiled_matches_full_frame():
+    scene = _scene()
+    optics = Optics(f_number=4.0, f_length=0.004, wave=WAVE)
+    display = _display()
+    volts, rgb = camera_compute_tiled(
+        _camera(), scene, optics=optics, display=display, tile=16
+    )
+
+    ref = sensor_compute(_sensor(), oi_compute(scene, optics))
+    assert np.allclose(volts, ref.volts)
+    assert np.allclose(rgb, ip_compute(ref, display).rgb)
+
+
+def test_camera_compute_tiled_shift_invariant():
+    scene = _scene(96, 96)
+    optics = Optics(f_number=2.0, f_length=0.004, wave=WAVE)
+    cam = _camera(96, 96)
+    volts, _ = camera_compute_tiled(
+        cam, scene, optics=optics, tile=32, halo=32, shift_invariant=True
+    )
+    ref = sensor_compute(
+        _sensor(96, 96), oi_compute(scene, optics, shift_invariant=True)
+    )
+    assert np.max(np.abs(volts - ref.volts)) < 1e-3 * np.max(ref.volts)
+    assert np.allclose(cam.sensor.volts, volts)
+
+    # The default halo only covers the PSF core.
+    volts, _ = camera_compute_tiled(
+        _camera(96, 96), scene, optics=optics, tile=32, shift_invariant=True
+    )
+    assert np.max(np.abs(volts - ref.volts)) < 2e-2 * np.max(ref.volts)
+
+
+def test_camera_compute_tiled_psf_radius():
+    cache = importlib.import_module("isetcam.opticalimage.oi_compute")._OTF_CACHE
+    oi_otf_cache_clear()
+    wave = np.arange(400, 701, 10.0)
+    radii = []
+    for f_number, pitch in ((1.4, 10e-6), (4.0, 2e-6), (8.0, 1e-6)):
+        optics = Optics(f_number=f_number, f_length=0.004, wave=wave)
+        airy = 1.22 * 700e-9 * f_number / pitch
+        r = _psf_radius(optics, pitch, wave)
+        assert r <= 1.5 * airy + 1
+        radii.append(r)
+    assert radii == sorted(radii) and radii[-1] > 0
+    # Probe OTFs do not evict those of oi_compute.
+    assert len(cache) == 0
+
+
+def test_camera_compute_tiled_memmap_and_processes(tmp_path):
+    scene = _scene()
+    scene_to_memmap(scene, tmp_path / "scene", dtype=np.float64)
+    lazy = scene_from_memmap(tmp_path / "scene")
+    lazy.sample_spacing = scene.sample_spacing
+    out = np.lib.format.open_memmap(
+        tmp_path / "volts.npy", mode="w+", dtype=float, shape=(70, 54)
+    )
+
+    serial, _ = camera_compute_tiled(_camera(), scene, tile=20)
+    with ProcessPoolExecutor(max_workers=2) as ex:
+        volts, rgb = camera_compute_tiled(
+            _camera(), lazy, tile=20, executor=ex, max_pending=4, volts_out=out
+        )
+    assert rgb is None
+    assert volts is out
+    assert np.array_equal(np.asarray(out), serial)
+    with pytest.raises(ValueError):
+        camera_compute_tiled(_camera(), scene, tile=20, max_pending=0)
+
+
+def test_camera_compute_tiled_auto_exposure():
+    scene = _scene()
+    cam = _camera()
+    cam.sensor.auto_exposure = True
+    cam.sensor.voltage_swing = 2.0
+    cam.sensor.gain_sd = 0.0
+    cam.sensor.offset_sd = 0.0
+    volts, _ = camera_compute_tiled(cam, scene, tile=16)
+    assert np.isclose(volts.max(), 0.95 * 2.0)
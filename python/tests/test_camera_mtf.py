@@ -37,3 +37,18 @@ def test_camera_mtf_custom_freq_and_error():
     assert np.allclose(mtf, expected)
     with pytest.raises(ValueError):
         camera_mtf(cam, f, method="unknown")
+
+
+def test_camera_mtf_sfr_averages_rois():
+    from isetcam.metrics import iso12233_sfr
+
+    cam = camera_create()
+    x, y = np.meshgrid(np.arange(64), np.arange(64))
+    img = (x >= 0.1 * y + 20).astype(float)
+    rects = [(0, 0, 48, 32), (0, 32, 48, 32)]
+    freqs, mtf = camera_mtf(cam, method="sfr", image=img, rects=rects)
+    delta = cam.sensor.pixel_size * 1e3
+    f0, m0 = iso12233_sfr(img[:32, :48], delta_x=delta)
+    f1, m1 = iso12233_sfr(img[32:, :48], delta_x=delta)
+    assert np.allclose(freqs, f0)
+    assert np.allclose(mtf, (m0 + m1) / 2)
@@ -3,8 +3,7 @@ import numpy as np
 from isetcam.camera import camera_create, camera_vsnr_sl
 from isetcam.camera.camera_vsnr_sl import VSNRSLResult, _base_scene
 from isetcam.scene import Scene, scene_adjust_luminance
-from isetcam.quanta2energy import quanta_to_energy
-from isetcam.ie_xyz_from_energy import ie_xyz_from_energy
+from isetcam.ie_xyz_from_photons import ie_xyz_from_photons
 from isetcam.metrics import xyz_to_vsnr
 
 
@@ -25,7 +24,6 @@ def test_camera_vsnr_sl_matches_manual():
     for lum in levels:
         sc = _base_scene()
         sc = scene_adjust_luminance(sc, "mean", float(lum))
-        energy = quanta_to_energy(sc.wave, sc.photons)
-        xyz = ie_xyz_from_energy(energy, sc.wave)
+        xyz = ie_xyz_from_photons(sc.photons, sc.wave)
         expected.append(xyz_to_vsnr(xyz, np.array([1.0, 1.0, 1.0])))
     assert np.allclose(res.vsnr, expected)
@@ -1,9 +1,17 @@
 import numpy as np
+import pytest
 
 from isetcam.scene import Scene
 from isetcam.sensor import sensor_create
 from isetcam.optics import optics_create
-from isetcam.cp import CPScene, CPCModule, CPCamera, cp_burst_camera, cp_burst_ip
+from isetcam.cp import (
+    CPBurstMerger,
+    CPCamera,
+    CPCModule,
+    CPScene,
+    cp_burst_camera,
+    cp_burst_ip,
+)
 
 
 def _simple_scene() -> Scene:
@@ -53,3 +61,94 @@ def test_burst_camera_hdr_ev_step():
     exp = cp_burst_camera(3, 0.01, mode="hdr", ev_step=0.5)
     expected = [0.01 * 2 ** (-0.5), 0.01, 0.01 * 2 ** (0.5)]
     assert np.allclose(exp, expected)
+
+
+def test_burst_ip_streams_frames():
+    rng = np.random.default_rng(0)
+    frames = [rng.random((20, 30)).astype(np.float32) for _ in range(5)]
+    assert np.array_equal(cp_burst_ip(iter(frames)), np.stack(frames).sum(axis=0))
+    assert np.array_equal(cp_burst_ip(iter(frames), mode="longest"), frames[-1])
+    with pytest.raises(ValueError):
+        cp_burst_ip(iter([]))
+    with pytest.raises(ValueError):
+        cp_burst_ip(frames, mode="median")
+
+
+def test_burst_ip_sum_promotes_integer_frames():
+    frames = [np.full((4, 6), v, dtype=np.uint16) for v in (20000, 40000, 60000)]
+    combined = cp_burst_ip(iter(frames))
+    assert np.array_equal(combined, np.stack(frames).sum(axis=0))
+    assert np.all(combined == 120000)
+    assert frames[0][0, 0] == 20000
+
+
+def test_burst_ip_aligned_recovers_shifts():
+    from scipy.ndimage import gaussian_filter
+
+    rng = np.random.default_rng(1)
+    scene = 0.5 + 3 * gaussian_filter(rng.random((200, 240)), 3)
+    shifts = [(0, 0), (4, -6), (-8, 2), (6, 10)]
+    frames = [
+        scene[20 + dy : 148 + dy, 20 + dx : 212 + dx] + rng.normal(0, 0.02, (128, 192))
+        for dy, dx in shifts
+    ]
+    merger = CPBurstMerger("aligned", tile=8)
+    for f in frames:
+        merger.add(f)
+    for offset, (dy, dx) in zip(merger.offsets, shifts):
+        # Offsets are in 2x2 CFA quads.
+        assert np.median(offset[..., 0]) == -dy // 2
+        assert np.median(offset[..., 1]) == -dx // 2
+
+    merged = merger.result()
+    clean = scene[20:148, 20:212] * len(frames)
+    inner = (slice(24, -24), slice(24, -24))
+    err = np.std((merged - clean)[inner])
+    assert err < np.std((frames[0] * len(frames) - clean)[inner]) * 0.7
+    assert err < np.std((cp_burst_ip(frames) - clean)[inner]) * 0.5
+
+    # Identical frames merge to their sum.
+    static = [frames[0]] * 3
+    assert np.allclose(cp_burst_ip(static, mode="aligned"), frames[0] * 3)
+
+
+def test_burst_ip_aligned_rejects_moving_content():
+    from scipy.ndimage import gaussian_filter
+
+    rng = np.random.default_rng(2)
+    scene = 0.5 + 3 * gaussian_filter(rng.random((128, 192)), 3)
+    frames = [scene + rng.normal(0, 0.02, scene.shape) for _ in range(3)]
+    frames[2][40:80, 60:100] += 0.5
+    merged = cp_burst_ip(frames, mode="aligned") / len(frames)
+    assert np.abs(merged - scene)[40:80, 60:100].max() < 0.1
+
+
+def test_take_picture_parallel_shares_optical_images(monkeypatch):
+    import isetcam.cp.cp_cmodule as cmodule
+
+    calls = []
+    real = cmodule.oi_compute
+
+    def counting(scene, optics):
+        calls.append(id(scene))
+        return real(scene, optics)
+
+    monkeypatch.setattr(cmodule, "oi_compute", counting)
+    wave = np.array([550.0])
+    modules = [
+        CPCModule(sensor=sensor_create(wave=wave), optics=optics_create(wave=wave))
+        for _ in range(3)
+    ]
+    camera = CPCamera(modules)
+    scene = CPScene([_simple_scene()])
+    exp_times = [0.01, 0.02]
+
+    out = camera.take_picture(scene, exposure_times=exp_times)
+    assert len(out) == 6
+    # Both frames repeat one scene; all modules and frames share its OI.
+    assert len(calls) == 1
+    assert [s.exposure_time for s in out] == exp_times * 3
+
+    serial = camera.take_picture(scene, exposure_times=exp_times, workers=1)
+    for a, b in zip(out, serial):
+        assert np.allclose(a.volts, b.volts)
@@ -2,7 +2,12 @@ import shutil
 import numpy as np
 import pytest
 
-from isetcam.cp import CPScene
+from isetcam.cp import (
+    CPScene,
+    cp_render_cache_clear,
+    cp_render_cache_configure,
+    cp_render_cache_info,
+)
 from isetcam.scene import Scene
 
 
@@ -32,10 +37,65 @@ def test_cp_scene_render_pbrt(monkeypatch, tmp_path):
 
     monkeypatch.setattr(cp_pkg.cp_scene, "scene_from_pbrt", fake_scene_from_pbrt)
 
+    cp_render_cache_clear()
     sc = CPScene(scene_type="pbrt", scene_path=str(pbrt_path))
     out = sc.render([0.1, 0.2])
     assert len(out) == 2
 
+    # Both exposures share one render.
     comp = dest_root / "data" / "computed"
     files = sorted(comp.glob("test-*.exr"))
-    assert len(files) == 2
+    assert len(files) == 1
+
+
+def test_cp_scene_render_cache(monkeypatch, tmp_path):
+    from isetcam import cp as cp_pkg
+
+    pbrt_path = tmp_path / "test.pbrt"
+    pbrt_path.write_text("WorldBegin")
+    dest_root = tmp_path / "root"
+    monkeypatch.setattr(cp_pkg.cp_scene, "iset_root_path", lambda: dest_root)
+    calls = []
+
+    def fake_scene_from_pbrt(path):
+        calls.append(path)
+        photons = np.full((2, 3, 1), float(len(calls)))
+        return Scene(photons=photons, wave=np.array([550.0])), None, {}
+
+    monkeypatch.setattr(cp_pkg.cp_scene, "scene_from_pbrt", fake_scene_from_pbrt)
+    cp_render_cache_clear()
+    sc = CPScene(scene_type="pbrt", scene_path=str(pbrt_path))
+
+    out = sc.render([0.1, 0.2, 0.4, 0.8, 1.6])
+    assert len(out) == 5 and len(calls) == 1
+    assert not out[0].photons.flags.writeable
+
+    # The renderer ignores focus and flags, so they do not cause renders.
+    out = sc.render([0.1, 0.2, 0.3], focus_dists=[1.0, 2.0, 1.0])
+    assert len(calls) == 1
+    assert out[0] is out[1] is out[2]
+    sc.render([0.1], focus_dists=[2.0], render_flags=[True])
+    assert len(calls) == 1
+
+    # Renders persist on disk across processes.
+    cp_render_cache_clear()
+    again = sc.render([0.5])
+    assert len(calls) == 1 and cp_render_cache_info()["disk_hits"] == 1
+    assert np.array_equal(again[0].photons, np.ones((2, 3, 1)))
+
+    # Editing the scene invalidates its renders.
+    pbrt_path.write_text("WorldBegin # edited")
+    sc.render([0.5])
+    assert len(calls) == 2
+
+    # The disk store is bounded.
+    store = dest_root / "data" / "computed" / "render_cache"
+    cp_render_cache_configure(max_bytes=0)
+    try:
+        pbrt_path.write_text("WorldBegin # edited again")
+        sc.render([0.1])
+        assert len(calls) == 3
+        assert len(list(store.glob("*.npz"))) == 1
+    finally:
+        cp_render_cache_configure(max_bytes=2 << 30)
+        cp_render_cache_clear(store)
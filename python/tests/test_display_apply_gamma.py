@@ -1,6 +1,6 @@
 import numpy as np
 
-from isetcam.display import Display, display_apply_gamma
+from isetcam.display import Display, DisplayGamma, display_apply_gamma, display_gamma
 
 
 def _make_display(n_levels: int = 16) -> Display:
@@ -26,3 +26,85 @@ def test_display_apply_gamma_round_trip_rgb():
     lin = display_apply_gamma(dac, disp)
     dac2 = display_apply_gamma(lin, disp, inverse=True)
     assert np.allclose(dac2, dac, atol=1e-6)
+
+
+def _reference(xw, gamma, inverse):
+    n_levels = gamma.shape[0]
+    out = np.empty_like(xw)
+    xw = xw.astype(np.float64)
+    if inverse:
+        levels = np.linspace(0, 1, n_levels)
+        for i in range(xw.shape[1]):
+            out[:, i] = np.interp(xw[:, i], gamma[:, i], levels)
+        return out
+    scale = n_levels - 1 if xw.max() <= 1 else 1
+    idx = np.clip(np.round(xw * scale).astype(int), 0, n_levels - 1)
+    for i in range(xw.shape[1]):
+        out[:, i] = gamma[idx[:, i], i]
+    return out
+
+
+def test_display_gamma_matches_per_channel_reference():
+    disp = _make_display(256)
+    disp.gamma = disp.gamma ** np.array([2.2, 2.0, 1.8])
+    rng = np.random.default_rng(0)
+    for dtype in (np.float64, np.float32):
+        for scale in (1.0, 300.0):
+            x = (rng.random((2000, 3)) * 1.2 * scale - 0.1 * scale).astype(dtype)
+            for inverse in (False, True):
+                out = display_apply_gamma(x, disp, inverse=inverse)
+                assert out.dtype == dtype
+                assert np.array_equal(out, _reference(x, disp.gamma, inverse))
+
+    codes = rng.integers(0, 256, size=(8, 9, 3))
+    expected = _reference(codes.reshape(-1, 3).astype(float), disp.gamma, False)
+    assert np.array_equal(display_apply_gamma(codes, disp).reshape(-1, 3), expected)
+
+
+def test_display_gamma_engine_cached_in_place_and_chunked():
+    disp = _make_display(64)
+    engine = display_gamma(disp)
+    assert display_gamma(disp) is engine
+
+    img = np.random.default_rng(1).random((33, 17, 3))
+    expected = display_apply_gamma(img, disp)
+    chunked = DisplayGamma(disp.gamma, chunk=50)
+    assert np.array_equal(chunked.forward(img), expected)
+    buf = img.copy()
+    assert chunked.inverse(chunked.forward(buf, out=buf), out=buf) is buf
+    assert np.array_equal(buf, display_apply_gamma(expected, disp, inverse=True))
+
+    # Changing the gamma table rebuilds the engine.
+    disp.gamma = disp.gamma ** 2
+    assert display_gamma(disp) is not engine
+    # A single-column table applies to every channel.
+    single = DisplayGamma(disp.gamma[:, 0])
+    assert np.array_equal(single.forward(img), display_gamma(disp).forward(img))
+
+
+def test_display_gamma_float32_rounding_ties():
+    disp = _make_display(256)
+    disp.gamma = disp.gamma ** 2.2
+    # Values halfway between levels round differently in single precision.
+    x = ((np.arange(255) + 0.5) / 255).astype(np.float32)
+    img = np.repeat(x[:, None], 3, axis=1)
+    expected = display_apply_gamma(img.astype(np.float64), disp)
+    out = display_apply_gamma(img, disp)
+    assert out.dtype == np.float32
+    assert np.array_equal(out, expected.astype(np.float32))
+
+
+def test_display_apply_gamma_normalized_and_out():
+    disp = _make_display(16)
+    # A frame of small code values would be taken as normalized by default.
+    codes = np.array([[0.0, 1.0, 1.0]])
+    as_codes = display_apply_gamma(codes, disp, normalized=False)
+    assert np.array_equal(as_codes[0], disp.gamma[[0, 1, 1], 0])
+    as_drive = display_apply_gamma(codes, disp)
+    assert np.array_equal(as_drive[0], disp.gamma[[0, 15, 15], 0])
+
+    img = np.random.default_rng(2).random((4, 5, 3))
+    expected = display_apply_gamma(img, disp)
+    buf = img.copy()
+    assert display_apply_gamma(buf, disp, out=buf, normalized=True) is buf
+    assert np.array_equal(buf, expected)
@@ -49,3 +49,12 @@ def test_display_render_apply_gamma_rgb():
     expected = xw_to_rgb_format(expected, rows, cols)
     out = display_render(img, disp, apply_gamma=True)
     assert np.allclose(out, expected)
+
+
+def test_display_render_normalized_flag():
+    disp = _make_display()
+    img = np.array([[0.0, 1.0, 1.0]])
+    lin = display_apply_gamma(img, disp, normalized=False)
+    out = display_render(img, disp, normalized=False)
+    assert np.allclose(out, lin @ disp.spd.T)
+    assert not np.allclose(out, display_render(img, disp))
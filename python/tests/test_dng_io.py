@@ -1,7 +1,7 @@
 import numpy as np
 import pytest
 
-from isetcam.io import dng_read, dng_write
+from isetcam.io import dng_read, dng_read_stack, dng_write
 
 
 def _backend_available() -> bool:
@@ -20,3 +20,101 @@ def test_dng_roundtrip(tmp_path):
     loaded = dng_read(path)
     assert loaded.shape == data.shape
     assert np.all(loaded == data)
+
+
+@pytest.mark.skipif(not _backend_available(), reason="rawpy not available")
+def test_dng_read_stack(tmp_path):
+    frames = [np.full((3, 4), 10 * i, dtype=np.uint16) for i in range(3)]
+    paths = []
+    for i, data in enumerate(frames):
+        paths.append(tmp_path / f"f{i}.dng")
+        dng_write(paths[-1], data)
+    stack, metas = dng_read_stack(paths, workers=2)
+    assert stack.shape == (3, 3, 4) and stack.dtype == np.uint16
+    assert np.array_equal(stack, np.stack(frames))
+    assert len(metas) == 3 and "exposure" in metas[0]
+
+    dng_write(tmp_path / "small.dng", np.zeros((2, 2), dtype=np.uint16))
+    with pytest.raises(ValueError):
+        dng_read_stack(paths + [tmp_path / "small.dng"])
+
+
+class _FakeRaw:
+    def __init__(self, image, meta):
+        self.raw_image = image
+        self.metadata = meta
+        self.white_level = 4095
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        # rawpy invalidates the pixel buffer once the file is closed.
+        self.raw_image[...] = 0
+
+
+class _FakeMeta:
+    iso_speed = 200
+    exposure = 0.02
+    orientation = 0
+    black_level_per_channel = [64, 64, 64, 64]
+
+
+def fake_rawpy(monkeypatch, images):
+    """Serve ``images`` (``{path: array}``) through a fake ``rawpy``."""
+    import importlib
+    import types
+
+    # ``isetcam.io.dng_read`` names the function; fetch the module itself.
+    dng_mod = importlib.import_module("isetcam.io.dng_read")
+
+    def imread(path):
+        return _FakeRaw(images[path].copy(), _FakeMeta())
+
+    monkeypatch.setattr(dng_mod, "rawpy", types.SimpleNamespace(imread=imread))
+
+
+def test_dng_read_raw_single_open_with_fake_backend(monkeypatch, tmp_path):
+    from isetcam.io import dng_read_raw
+
+    data = np.arange(12, dtype=np.uint16).reshape(3, 4)
+    path = tmp_path / "a.dng"
+    fake_rawpy(monkeypatch, {str(path): data})
+
+    pixels, meta = dng_read_raw(path)
+    assert pixels.dtype == np.uint16 and np.array_equal(pixels, data)
+    assert meta == {
+        "iso_speed": 200,
+        "exposure": 0.02,
+        "orientation": 0,
+        "black_level": [64, 64, 64, 64],
+        "white_level": 4095,
+    }
+    out = np.empty((3, 4), dtype=np.uint16)
+    assert dng_read_raw(path, out=out)[0] is out
+    assert np.array_equal(out, data)
+    with pytest.raises(ValueError):
+        dng_read_raw(path, out=np.empty((2, 4), dtype=np.uint16))
+
+
+def test_dng_read_stack_with_fake_backend(monkeypatch, tmp_path):
+    frames = {}
+    for i in range(5):
+        path = tmp_path / f"f{i}.DNG"
+        path.touch()
+        frames[str(path)] = np.full((3, 4), 1000 * i, dtype=np.uint16)
+    (tmp_path / "notes.txt").touch()
+    fake_rawpy(monkeypatch, frames)
+
+    stack, metas = dng_read_stack(tmp_path, workers=3)
+    assert stack.shape == (5, 3, 4) and stack.dtype == np.uint16
+    assert np.array_equal(stack, np.stack(list(frames.values())))
+    assert [m["iso_speed"] for m in metas] == [200] * 5
+
+    small = tmp_path / "small.dng"
+    frames[str(small)] = np.zeros((2, 2), dtype=np.uint16)
+    with pytest.raises(ValueError):
+        dng_read_stack(list(frames)[:2] + [small])
+    (tmp_path / "empty").mkdir()
+    with pytest.raises(ValueError):
+        dng_read_stack(tmp_path / "empty")
@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+from isetcam.printing import halftone_dither, halftone_error_diffusion
+from isetcam.printing.halftone_error_diffusion import (
+    _diffuse_channel,
+    _diffuse_jit,
+    _diffuse_scalar,
+)
+
+_FS = np.array([[0, 0, 0, 7, 5], [3, 5, 7, 5, 3], [1, 3, 5, 3, 1]], dtype=float)
+
+
+@pytest.mark.parametrize("serpentine", [False, True])
+def test_error_diffusion_matches_scalar_kernel(serpentine):
+    rng = np.random.default_rng(0)
+    img = rng.random((12, 17))
+    fs = _FS / _FS.sum()
+    expected = _diffuse_channel(img, fs, serpentine, _diffuse_scalar)
+    out = halftone_error_diffusion(_FS, img, serpentine=serpentine, jit=False)
+    assert np.array_equal(out, expected)
+    assert set(np.unique(out)).issubset({0, 1})
+    assert abs(out.mean() - img.mean()) < 0.02
+
+
+def test_error_diffusion_channels_and_jit_option():
+    rng = np.random.default_rng(1)
+    cmyk = rng.random((10, 9, 4))
+    out = halftone_error_diffusion(_FS, cmyk, jit=False, workers=2)
+    assert out.shape == cmyk.shape
+    for k in range(4):
+        assert np.array_equal(
+            out[:, :, k], halftone_error_diffusion(_FS, cmyk[:, :, k], jit=False)
+        )
+    if _diffuse_jit is None:
+        with pytest.raises(RuntimeError):
+            halftone_error_diffusion(_FS, cmyk[:, :, 0], jit=True)
+
+
+def test_dither_per_channel_screens():
+    rng = np.random.default_rng(2)
+    img = rng.random((10, 7, 2))
+    cells = np.stack([np.arange(16).reshape(4, 4) / 16, np.eye(4) * 0.9], axis=2)
+    out = halftone_dither(cells, img)
+    assert out.shape == img.shape
+    mask = np.tile(cells, (3, 2, 1))[:10, :7]
+    assert np.array_equal(out, (mask < img).astype(int))
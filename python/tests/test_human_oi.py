@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 from isetcam.scene import Scene
 from isetcam.human import human_oi
 
@@ -12,3 +13,60 @@ def test_human_oi_basic():
     assert oi.photons.shape == photons.shape
     assert hasattr(oi, "illuminance")
     assert oi.illuminance.shape == photons.shape[:2]
+
+
+def _reference_photons(sc):
+    from scipy.signal import fftconvolve
+
+    from isetcam.human import human_otf
+    from isetcam.optics import optics_cos4th, optics_otf
+
+    photons = sc.photons.astype(float)
+    rows, cols = photons.shape[:2]
+    x = (np.arange(cols) - (cols - 1) / 2) * sc.sample_spacing
+    y = (np.arange(rows) - (rows - 1) / 2) * sc.sample_spacing
+    X, Y = np.meshgrid(x, y)
+    diag = np.sqrt(np.ptp(x) ** 2 + np.ptp(y) ** 2)
+    photons = photons * optics_cos4th(X, Y, 0.017, diag, 4.0, magnification=0)[
+        ..., None
+    ]
+    psf = optics_otf(human_otf(wave=sc.wave)[0])
+    return np.stack(
+        [
+            fftconvolve(photons[:, :, i], psf[:, :, i], mode="same")
+            for i in range(sc.wave.size)
+        ],
+        axis=2,
+    )
+
+
+def test_human_oi_batch_matches_per_band_convolution():
+    from isetcam.human import human_oi_batch
+
+    rng = np.random.default_rng(0)
+    wave = np.array([450, 550, 650], dtype=float)
+    scenes = []
+    for _ in range(3):
+        sc = Scene(photons=rng.random((9, 12, 3)), wave=wave)
+        sc.sample_spacing = 2e-6
+        scenes.append(sc)
+
+    expected = np.stack([_reference_photons(sc) for sc in scenes])
+    oi = human_oi(scenes[0])
+    assert np.allclose(oi.photons, expected[0])
+    assert np.allclose(human_oi_batch(scenes, chunk_size=2), expected)
+    gen = (sc for sc in scenes)
+    assert np.allclose(human_oi_batch(gen, chunk_size=2), expected)
+    stack = np.stack([sc.photons for sc in scenes])
+    out = human_oi_batch(stack, wave=wave, sample_spacing=2e-6)
+    assert np.allclose(out, expected)
+
+
+def test_human_oi_batch_rejects_mismatched_scene():
+    from isetcam.human import human_oi_batch
+
+    wave = np.array([450, 550], dtype=float)
+    scenes = [Scene(photons=np.ones((4, 5, 2)), wave=wave) for _ in range(2)]
+    scenes.append(Scene(photons=np.ones((4, 6, 2)), wave=wave))
+    with pytest.raises(ValueError):
+        human_oi_batch(iter(scenes), chunk_size=2)
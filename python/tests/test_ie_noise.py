@@ -0,0 +1,77 @@
+import numpy as np
+
+from isetcam import (
+    ie_noise_normal,
+    ie_noise_poisson,
+    ie_noise_seed,
+    ie_noise_uniform,
+)
+
+
+def test_ie_noise_normal_reproducible_and_float32():
+    a = ie_noise_normal((40, 50), 3)
+    b = ie_noise_normal((40, 50), 3)
+    assert a.dtype == np.float32
+    assert np.array_equal(a, b)
+    assert not np.array_equal(a, ie_noise_normal((40, 50), 4))
+    assert not np.array_equal(a, ie_noise_normal((40, 50), 3, stream=1))
+    assert not np.array_equal(a, ie_noise_normal((40, 50), 3, frame=1))
+
+
+def test_ie_noise_normal_split_matches_full():
+    full = ie_noise_normal((2, 70, 45), 11, frame=5, tile=16)
+    top = ie_noise_normal((2, 33, 45), 11, frame=5, tile=16)
+    bottom_right = ie_noise_normal(
+        (2, 37, 20), 11, frame=5, origin=(33, 25), tile=16
+    )
+    assert np.array_equal(full[:, :33], top)
+    assert np.array_equal(full[:, 33:, 25:], bottom_right)
+    # Frames of a stack equal separately generated frames.
+    second = ie_noise_normal((70, 45), 11, frame=6, tile=16)
+    assert np.array_equal(full[1], second)
+    # Threads do not change the result.
+    threaded = ie_noise_normal((2, 70, 45), 11, frame=5, tile=16, workers=4)
+    assert np.array_equal(full, threaded)
+
+
+def test_ie_noise_small_region_matches_full_tiles():
+    # Small regions draw only the tile rows they need, with equal values.
+    full = ie_noise_normal((300, 300), 2)
+    small = ie_noise_normal((4, 4), 2, origin=(250, 10))
+    assert np.array_equal(small, full[250:254, 10:14])
+    uni = ie_noise_uniform((300, 300), 2, dtype=np.float64)
+    small = ie_noise_uniform((3, 5), 2, origin=(1, 255), dtype=np.float64)
+    assert np.array_equal(small, uni[1:4, 255:260])
+
+
+def test_ie_noise_statistics():
+    z = ie_noise_normal((300, 300), 0, dtype=np.float64)
+    assert z.dtype == np.float64
+    assert abs(z.mean()) < 0.01
+    assert abs(z.std() - 1.0) < 0.01
+    u = ie_noise_uniform((300, 300), 0)
+    assert u.min() >= 0 and u.max() < 1
+    assert abs(u.mean() - 0.5) < 0.01
+
+
+def test_ie_noise_poisson():
+    lam = np.full((300, 300), 3.0)
+    lam[:, 150:] = 40.0
+    samples = ie_noise_poisson(lam, 2)
+    low, high = samples[:, :150], samples[:, 150:]
+    assert np.array_equal(low, np.round(low))
+    assert abs(low.mean() - 3.0) < 0.05
+    assert abs(low.var() - 3.0) < 0.15
+    assert abs(high.mean() - 40.0) < 0.2
+    assert abs(high.var() - 40.0) < 2.0
+    part = ie_noise_poisson(lam[100:], 2, origin=(100, 0))
+    assert np.array_equal(samples[100:], part)
+    assert np.all(ie_noise_poisson(np.zeros((4, 4)), 2) == 0)
+
+
+def test_ie_noise_seed():
+    assert ie_noise_seed(5) == 5
+    np.random.seed(0)
+    a = ie_noise_seed()
+    np.random.seed(0)
+    assert ie_noise_seed() == a
@@ -0,0 +1,127 @@
+import numpy as np
+import pytest
+
+from isetcam import ie_as_float, ie_precision, ie_session_get, ie_session_set
+from isetcam.display import Display, display_render
+from isetcam.ip import ip_compute
+from isetcam.metrics import scielab, sc_params
+from isetcam.opticalimage import OpticalImage, oi_compute, oi_set
+from isetcam.optics import Optics
+from isetcam.scene import Scene, scene_get, scene_set
+from isetcam.sensor import Sensor, sensor_compute, sensor_set
+
+WAVE = np.arange(400, 710, 10)
+
+
+def _cube(dtype):
+    rng = np.random.default_rng(0)
+    return (rng.random((32, 40, WAVE.size)) * 100).astype(dtype)
+
+
+def _sensor(precision=None):
+    s = Sensor(volts=np.zeros((32, 40)), wave=WAVE, exposure_time=0.01)
+    sensor_set(s, "precision", precision)
+    s.filter_spectra = np.stack(
+        [np.exp(-((WAVE - c) / 40.0) ** 2) for c in (600, 540, 460)], axis=1
+    )
+    s.filter_names = ["r", "g", "b"]
+    s.filter_color_letters = "rggb"
+    return s
+
+
+def _display():
+    return Display(
+        spd=np.stack([np.linspace(0.1, 1, WAVE.size)] * 3, axis=1),
+        wave=WAVE,
+        gamma=np.linspace(0, 1, 256)[:, None].repeat(3, axis=1) ** 2.2,
+    )
+
+
+def _run(stage, precision):
+    """Return the output of ``stage`` computed at ``precision``."""
+    dtype = np.float32 if precision == "single" else np.float64
+    scene = Scene(photons=_cube(dtype), wave=WAVE)
+    scene_set(scene, "precision", precision)
+    optics = Optics(f_number=4.0, f_length=0.004, wave=WAVE)
+    if stage == "oi_compute":
+        return oi_compute(scene, optics, shift_invariant=True).photons
+    oi = OpticalImage(photons=_cube(dtype), wave=WAVE)
+    oi_set(oi, "precision", precision)
+    sensor = sensor_compute(_sensor(precision), oi)
+    if stage == "sensor_compute":
+        return sensor.volts
+    if stage == "ip_compute":
+        sensor.volts = sensor.volts / sensor.volts.max()
+        return ip_compute(sensor, _display()).rgb
+    rgb = np.random.default_rng(1).random((24, 24, 3)).astype(dtype)
+    if stage == "display_render":
+        return display_render(rgb, _display())
+    xyz = rgb * 50
+    return scielab(xyz, xyz * 1.05, np.array([95.05, 100.0, 108.9]), sc_params())
+
+
+@pytest.mark.parametrize(
+    "stage, tol",
+    [
+        ("oi_compute", 1e-5),
+        ("sensor_compute", 1e-5),
+        ("ip_compute", 1e-4),
+        ("display_render", 1e-6),
+        ("scielab", 1e-3),
+    ],
+)
+def test_precision_matrix(stage, tol):
+    single = _run(stage, "single")
+    double = _run(stage, "double")
+    assert double.dtype == np.float64
+    if stage != "scielab":
+        assert single.dtype == np.float32
+    drift = np.max(np.abs(single - double)) / np.max(np.abs(double))
+    assert drift < tol, f"{stage}: relative drift {drift:.2e} vs float64"
+
+
+def test_ie_precision_resolution():
+    assert ie_session_get("precision") == "double"
+    assert ie_precision() == np.float64
+    scene = Scene(photons=np.zeros((1, 1, 1)))
+    scene_set(scene, "precision", "single")
+    assert scene.photons.dtype == np.float32
+    assert ie_precision(scene) == np.float32
+    try:
+        ie_session_set("precision", "single")
+        assert ie_precision() == np.float32
+        assert ie_precision(Sensor(volts=np.zeros(1), exposure_time=1.0)) == (
+            np.float32
+        )
+        assert ie_as_float(np.arange(3)).dtype == np.float32
+    finally:
+        ie_session_set("precision", "double")
+    with pytest.raises(ValueError):
+        ie_session_set("precision", "half")
+
+    # A rejected precision leaves the object unchanged.
+    oi = OpticalImage(photons=np.zeros((1, 1, 1)))
+    sensor = Sensor(volts=np.zeros((1, 1)), exposure_time=1.0)
+    for obj, setter in ((scene, scene_set), (oi, oi_set), (sensor, sensor_set)):
+        before = getattr(obj, "precision", None)
+        with pytest.raises(ValueError):
+            setter(obj, "precision", "half")
+        assert getattr(obj, "precision", None) == before
+
+
+def test_ie_as_float_no_copy():
+    a = np.ones((4, 4), dtype=np.float32)
+    assert ie_as_float(a) is a
+    assert ie_as_float(a, "single") is a
+    assert ie_as_float(a, "double").dtype == np.float64
+    assert ie_as_float([1, 2]).dtype == np.float64
+
+
+def test_oi_compute_keeps_float32_cube():
+    scene = Scene(photons=_cube(np.float32), wave=WAVE)
+    scene.precision = "single"
+    optics = Optics(f_number=4.0, f_length=0.004, wave=WAVE)
+    oi = oi_compute(scene, optics)
+    assert oi.photons.dtype == np.float32
+    assert oi.precision == "single"
+    assert scene_get(scene, "precision") == "single"
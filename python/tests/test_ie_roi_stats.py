@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from isetcam import ROIStats
+
+
+def _random_rois(rng, shape, n):
+    rows, cols = shape
+    x = rng.integers(0, cols - 1, n)
+    y = rng.integers(0, rows - 1, n)
+    w = rng.integers(1, cols - x + 1)
+    h = rng.integers(1, rows - y + 1)
+    return np.column_stack([x, y, w, h])
+
+
+def test_roi_stats_matches_slices():
+    rng = np.random.default_rng(0)
+    img = rng.random((31, 27, 3)) * 10 + 1e4
+    rois = _random_rois(rng, img.shape[:2], 50)
+    stats = ROIStats(img)
+    mean, sd, snr = stats.stats(rois)
+    assert mean.shape == (50, 3)
+    for k, (x, y, w, h) in enumerate(rois):
+        patch = img[y : y + h, x : x + w]
+        assert np.allclose(mean[k], patch.mean(axis=(0, 1)), rtol=1e-12)
+        assert np.allclose(sd[k], patch.std(axis=(0, 1)), atol=1e-7)
+    assert np.allclose(snr, mean / sd)
+
+    single = stats.mean(rois[0])
+    assert single.shape == (3,)
+    with pytest.raises(ValueError):
+        stats.mean((20, 0, 10, 5))
+    with pytest.raises(ValueError):
+        stats.mean((0, 0, 0, 5))
+
+
+def test_roi_stats_cfa_channels_and_nan():
+    rng = np.random.default_rng(1)
+    mosaic = rng.random((20, 18))
+    mosaic[3, 4] = np.nan
+    pattern = np.array([[1, 0], [2, 1]])
+    stats = ROIStats(mosaic, pattern)
+    rows, cols = np.indices(mosaic.shape)
+    channel = pattern[rows % 2, cols % 2]
+    for x, y, w, h in _random_rois(rng, mosaic.shape, 40):
+        n, mean, var = stats.moments((x, y, w, h))
+        for c in range(3):
+            vals = mosaic[y : y + h, x : x + w][channel[y : y + h, x : x + w] == c]
+            vals = vals[~np.isnan(vals)]
+            assert n[c] == vals.size
+            if vals.size:
+                assert np.isclose(mean[c], vals.mean())
+                assert np.isclose(var[c], vals.var())
+            else:
+                assert np.isnan(mean[c]) and np.isnan(var[c])
+
+
+def test_roi_stats_uniform_patch_has_zero_noise():
+    rng = np.random.default_rng(2)
+    img = rng.random((400, 400)) * 2000
+    img[100:200, 150:250] = 1000.0
+    stats = ROIStats(img)
+    mean, sd, snr = stats.stats(np.array([[150, 100, 100, 100], [300, 300, 1, 1]]))
+    assert np.allclose(mean[0], 1000.0)
+    assert np.all(sd == 0) and np.all(np.isinf(snr))
+
+    # Small but genuine variation is kept.
+    noisy = rng.normal(1e4, 1e-3, (200, 200))
+    sd = ROIStats(noisy).std((50, 50, 40, 40))
+    assert np.isclose(sd[0], noisy[50:90, 50:90].std(), rtol=1e-3)
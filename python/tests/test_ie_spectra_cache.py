@@ -0,0 +1,103 @@
+import os
+
+import numpy as np
+import pytest
+from scipy.io import savemat
+
+from isetcam import (
+    ie_read_spectra,
+    ie_spectra_cache_clear,
+    ie_spectra_cache_configure,
+    ie_spectra_cache_info,
+    ie_spectra_cache_load,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    info = ie_spectra_cache_info()
+    ie_spectra_cache_configure(disk_dir=None)
+    ie_spectra_cache_clear()
+    yield
+    ie_spectra_cache_configure(maxsize=info["maxsize"], disk_dir=info["disk_dir"])
+    ie_spectra_cache_clear()
+
+
+def _write_spectra(path, scale=1.0):
+    wave = np.arange(400, 701, 10, dtype=float)
+    data = scale * np.column_stack([wave / 700, 1 - wave / 1000])
+    savemat(path, {"wavelength": wave, "data": data, "comment": "test"})
+    return wave, data
+
+
+def test_ie_read_spectra_hits_cache(tmp_path):
+    path = tmp_path / "spec.mat"
+    _write_spectra(path)
+    wave = np.arange(400, 701, 5)
+    res1, _, comment, _ = ie_read_spectra(path, wave)
+    res2, _, _, _ = ie_read_spectra(path, wave)
+    info = ie_spectra_cache_info()
+    assert info["misses"] == 1 and info["hits"] == 1
+    assert comment == "test"
+    assert np.array_equal(res1, res2)
+    # Callers get private copies.
+    res1[:] = 0
+    res3, _, _, _ = ie_read_spectra(path, wave)
+    assert np.array_equal(res3, res2)
+
+    ie_read_spectra(path, np.arange(400, 701, 20))
+    assert ie_spectra_cache_info()["misses"] == 2
+
+
+def test_modified_file_is_reloaded(tmp_path):
+    path = tmp_path / "spec.mat"
+    _, data = _write_spectra(path)
+    res, _, _, _ = ie_read_spectra(path)
+    assert np.allclose(res, data)
+
+    _write_spectra(path, scale=2.0)
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    res, _, _, _ = ie_read_spectra(path)
+    assert np.allclose(res, 2 * data)
+    assert ie_spectra_cache_info()["misses"] == 2
+
+
+def test_lru_eviction_and_read_only(tmp_path):
+    ie_spectra_cache_configure(maxsize=2)
+    path = tmp_path / "spec.mat"
+    _write_spectra(path)
+    calls = []
+
+    def loader(p):
+        calls.append(p)
+        return {"x": np.arange(3.0)}
+
+    entry = ie_spectra_cache_load(path, loader, ("a",))
+    with pytest.raises(ValueError):
+        entry["x"][0] = 1
+    ie_spectra_cache_load(path, loader, ("b",))
+    ie_spectra_cache_load(path, loader, ("a",))
+    ie_spectra_cache_load(path, loader, ("c",))
+    assert ie_spectra_cache_info()["size"] == 2
+    ie_spectra_cache_load(path, loader, ("b",))
+    assert len(calls) == 4
+
+
+def test_disk_cache(tmp_path):
+    path = tmp_path / "spec.mat"
+    _write_spectra(path)
+    cache_dir = tmp_path / "cache"
+    ie_spectra_cache_configure(disk_dir=cache_dir)
+    wave = np.arange(400, 701, 5)
+    res, _, comment, _ = ie_read_spectra(path, wave)
+    assert len(list(cache_dir.glob("*.npz"))) == 1
+
+    ie_spectra_cache_clear()
+    res2, _, comment2, _ = ie_read_spectra(path, wave)
+    info = ie_spectra_cache_info()
+    assert info["disk_hits"] == 1 and info["misses"] == 0
+    assert np.array_equal(res, res2) and comment2 == comment
+
+    ie_spectra_cache_clear(disk=True)
+    assert not list(cache_dir.glob("*.npz"))
@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from isetcam import (
+    ie_spectral_projector,
+    ie_xyz_from_energy,
+    ie_xyz_from_photons,
+    luminance_from_energy,
+    luminance_from_photons,
+    quanta_to_energy,
+    scotopic_luminance_from_energy,
+    scotopic_luminance_from_photons,
+)
+
+
+def test_projector_is_memoized_and_read_only():
+    wave = np.arange(400, 701, 10)
+    p1 = ie_spectral_projector("xyz", wave)
+    p2 = ie_spectral_projector("XYZ", list(wave))
+    assert p1 is p2
+    assert p1.matrix.shape == (wave.size, 3)
+    with pytest.raises(ValueError):
+        p1.matrix[0, 0] = 1.0
+    assert ie_spectral_projector("xyz", wave, units="quanta") is ie_spectral_projector(
+        "xyz", wave, units="photons"
+    )
+    assert ie_spectral_projector("luminance", wave).matrix.shape == (wave.size,)
+
+
+def test_photon_projection_matches_energy_path():
+    rng = np.random.default_rng(0)
+    wave = np.arange(400, 701, 10)
+    photons = rng.uniform(1e15, 1e16, (4, 5, wave.size))
+    energy = quanta_to_energy(wave, photons)
+
+    assert np.allclose(
+        ie_xyz_from_photons(photons, wave), ie_xyz_from_energy(energy, wave)
+    )
+    assert np.allclose(
+        luminance_from_photons(photons, wave), luminance_from_energy(energy, wave)
+    )
+    assert np.allclose(
+        scotopic_luminance_from_photons(photons, wave, binwidth=5),
+        scotopic_luminance_from_energy(energy, wave, binwidth=5),
+    )
+    xw = photons.reshape(-1, wave.size)
+    assert ie_xyz_from_photons(xw, wave).shape == (20, 3)
+    assert luminance_from_photons(xw[0], wave).shape == (1,)
+
+
+def test_lms_projector():
+    wave = np.arange(400, 701, 10)
+    energy = np.ones(wave.size)
+    lms = ie_spectral_projector("lms", wave).apply(energy)
+    assert lms.shape == (1, 3)
+    assert np.all(lms > 0)
+
+
+def test_projector_errors():
+    with pytest.raises(ValueError):
+        ie_spectral_projector("rgb", [500, 510])
+    with pytest.raises(ValueError):
+        ie_spectral_projector("xyz", [500, 510], units="volts")
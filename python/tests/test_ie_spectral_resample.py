@@ -0,0 +1,33 @@
+import numpy as np
+
+from isetcam import ie_spectral_resample, ie_spectral_resample_matrix
+
+
+def test_ie_spectral_resample_matches_np_interp():
+    rng = np.random.default_rng(0)
+    src = np.arange(400, 701, 10, dtype=float)
+    tgt = np.arange(380, 721, 5, dtype=float)
+    data = rng.random((3, 4, src.size))
+    out = ie_spectral_resample(data, src, tgt)
+    assert out.shape == (3, 4, tgt.size)
+    expected = np.apply_along_axis(
+        lambda s: np.interp(tgt, src, s, left=0.0, right=0.0), 2, data
+    )
+    assert np.allclose(out, expected)
+
+
+def test_ie_spectral_resample_axis_and_identity():
+    src = np.array([400.0, 500.0, 600.0])
+    data = np.array([[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]])
+    out = ie_spectral_resample(data, src, [450.0, 550.0], axis=0)
+    assert np.allclose(out, [[2.0, 3.0], [4.0, 5.0]])
+    same = ie_spectral_resample(data, src, src, axis=0)
+    assert np.array_equal(same, data) and not np.shares_memory(same, data)
+
+
+def test_ie_spectral_resample_matrix_cached():
+    m1 = ie_spectral_resample_matrix([400, 500], [450])
+    m2 = ie_spectral_resample_matrix(np.array([400.0, 500.0]), np.array([450.0]))
+    assert m1 is m2
+    assert not m1.flags.writeable
+    assert np.allclose(m1, [[0.5], [0.5]])
@@ -0,0 +1,106 @@
+import json
+import threading
+
+import numpy as np
+
+from isetcam import ie_trace, ie_trace_enabled, ie_trace_span
+from isetcam.camera import camera_compute, camera_create
+from isetcam.display import display_create
+from isetcam.ip import ip_compute
+from isetcam.opticalimage import oi_compute
+from isetcam.optics import optics_create
+from isetcam.scene import Scene
+
+
+def test_ie_trace_disabled_is_noop():
+    assert not ie_trace_enabled()
+    a = ie_trace_span("a")
+    b = ie_trace_span("b", x=np.zeros(3))
+    assert a is b
+    with a as span:
+        span.note(y=1)
+
+
+def test_ie_trace_hierarchy_and_attrs():
+    with ie_trace() as trace:
+        assert ie_trace_enabled()
+        with ie_trace_span("outer", data=np.zeros((2, 3), dtype=np.float32)):
+            with ie_trace_span("inner") as span:
+                span.note(out=np.ones(4), label="x")
+            with ie_trace_span("inner"):
+                pass
+    assert not ie_trace_enabled()
+
+    outer, first, second = trace.spans
+    assert outer.name == "outer" and outer.depth == 0 and outer.parent is None
+    assert first.parent == 0 and second.parent == 0 and first.depth == 1
+    assert outer.attrs["data"] == {"shape": [2, 3], "dtype": "float32", "nbytes": 24}
+    assert first.attrs["out"]["shape"] == [4]
+    assert first.attrs["label"] == "x"
+    assert outer.duration >= first.duration + second.duration
+    assert outer.alloc_bytes is None
+
+    summary = trace.summary()
+    assert summary["inner"]["calls"] == 2
+    expected = outer.duration - first.duration - second.duration
+    assert np.isclose(summary["outer"]["self"], expected)
+
+
+def _traced_work():
+    with ie_trace_span("t"):
+        pass
+
+
+def test_ie_trace_memory_and_threads():
+    with ie_trace(memory=True) as trace:
+        with ie_trace_span("outer"):
+            with ie_trace_span("alloc"):
+                data = np.ones(1 << 18)
+                del data
+            worker = threading.Thread(target=_traced_work)
+            worker.start()
+            worker.join()
+    outer, alloc, other = trace.spans
+    assert alloc.peak_bytes >= 8 << 18
+    assert outer.peak_bytes >= alloc.peak_bytes
+    assert abs(alloc.alloc_bytes) < 8 << 18
+    # Spans of another thread start their own hierarchy.
+    assert other.parent is None and other.thread != outer.thread
+
+
+def test_ie_trace_pipeline_chrome_export(tmp_path):
+    wave = np.arange(400, 701, 10)
+    photons = np.random.default_rng(0).random((16, 16, wave.size))
+    scene = Scene(photons=photons, wave=wave)
+    optics = optics_create(wave=wave)
+    cam = camera_create()
+    with ie_trace() as trace:
+        oi = oi_compute(scene, optics, shift_invariant=True)
+        camera_compute(cam, oi)
+        ip_compute(cam.sensor, display_create(wave=wave))
+
+    names = [s.name for s in trace.spans]
+    for name in (
+        "oi_compute",
+        "spectral",
+        "blur",
+        "camera_compute",
+        "sensor_compute",
+        "cfa_integrate",
+        "noise",
+        "gain_offset",
+        "ip_compute",
+        "demosaic",
+        "color",
+    ):
+        assert name in names
+    cfa = trace.spans[names.index("cfa_integrate")]
+    assert trace.spans[cfa.parent].name == "sensor_compute"
+    assert trace.spans[trace.spans[cfa.parent].parent].name == "camera_compute"
+    assert cfa.attrs["photons"]["shape"] == [16, 16, wave.size]
+
+    path = tmp_path / "trace.json"
+    trace.save_chrome_trace(path)
+    events = json.loads(path.read_text())["traceEvents"]
+    assert len(events) == len(trace.spans)
+    assert all(e["ph"] == "X" and e["dur"] >= 0 for e in events)
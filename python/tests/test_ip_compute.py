@@ -40,3 +40,49 @@ def test_ip_set_new_params():
     assert ip_get(ip, "internal cs") == "linear sRGB"
     assert ip_get(ip, "conversion method sensor") == "current"
     assert ip_get(ip, "illuminant correction method") == "gray world"
+
+
+def test_ip_color_pipeline_matches_staged_computation():
+    from isetcam import color_transform_matrix
+    from isetcam.display import display_create
+    from isetcam.imgproc.image_illuminant_correction import (
+        image_illuminant_correction,
+    )
+    from isetcam.ip import ip_color_pipeline
+
+    rng = np.random.default_rng(0)
+    sensor = _simple_sensor()
+    disp = display_create()
+    rgb = rng.random((2, 6, 5, 3))
+    to_xyz = color_transform_matrix("srgb2xyz")
+    to_srgb = color_transform_matrix("xyz2srgb")
+
+    pipe = ip_color_pipeline(sensor, disp)
+    out = pipe.apply(rgb)
+    for img, res in zip(rgb, out):
+        expected = display_apply_gamma((img @ to_xyz) @ to_srgb, disp, inverse=True)
+        assert np.allclose(res, expected)
+    # The inverse gamma LUT reproduces ``np.interp`` exactly.
+    lin = rng.random((1000, 3)) ** 4
+    lin[0] = [-0.1, 1.5, np.nan]
+    assert np.array_equal(
+        ip_color_pipeline(sensor, disp, internal_cs="linear sRGB").apply(lin),
+        display_apply_gamma(lin, disp, inverse=True),
+        equal_nan=True,
+    )
+
+    gray = ip_color_pipeline(sensor, disp, illuminant_correction_method="gray world")
+    buf = rgb.copy()
+    assert gray.apply(buf, out=buf) is buf
+    for img, res in zip(rgb, buf):
+        ics, _ = image_illuminant_correction(
+            img @ to_xyz, "gray world", wave=sensor.wave
+        )
+        expected = display_apply_gamma(ics @ to_srgb, disp, inverse=True)
+        assert np.allclose(res, expected)
+
+    # The XYZ round trip folds to the identity and is dropped.
+    assert pipe.fused is None
+    # XW input is corrected as one image.
+    xw = rgb[0].reshape(-1, 3)
+    assert np.allclose(gray.apply(xw), buf[0].reshape(-1, 3))
@@ -27,3 +27,24 @@ def test_iso12233_sfr_color_matches_gray():
     f2, m2 = iso12233_sfr(color, delta_x=1)
     assert np.allclose(f1, f2)
     assert np.allclose(m1, m2)
+
+
+def test_iso12233_sfr_batch_matches_single_roi():
+    from scipy.ndimage import gaussian_filter
+
+    from isetcam.metrics import iso12233_sfr_batch
+
+    img = gaussian_filter(_slanted_edge(96, 96, 0.1), 1.0)
+    rects = [(8, 4, 48, 40), (20, 50, 48, 40), (10, 10, 30, 60)]
+    results = iso12233_sfr_batch(img, rects, delta_x=1)
+    assert len(results) == 3
+    for (x, y, w, h), (freq, mtf) in zip(rects, results):
+        f_ref, m_ref = iso12233_sfr(img[y : y + h, x : x + w], delta_x=1)
+        assert np.array_equal(freq, f_ref)
+        assert np.allclose(mtf, m_ref)
+
+    stack = np.stack([img, 1 - img.T])
+    results = iso12233_sfr_batch(stack, delta_x=1)
+    assert np.allclose(results[1][1], iso12233_sfr(1 - img.T, delta_x=1)[1])
+    with pytest.raises(ValueError):
+        iso12233_sfr_batch(img, [(90, 0, 20, 20)])
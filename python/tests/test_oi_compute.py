@@ -32,3 +32,55 @@ def test_oi_compute_transmittance_and_scale():
     assert np.array_equal(oi.wave, sc.wave)
 
 
+def _point_scene(n: int = 16) -> Scene:
+    wave = np.array([450.0, 550.0, 650.0])
+    photons = np.zeros((n, n, wave.size))
+    photons[n // 2, n // 2, :] = 1.0
+    sc = Scene(photons=photons, wave=wave)
+    sc.sample_spacing = 2e-6
+    return sc
+
+
+def test_oi_compute_shift_invariant_blurs_and_conserves():
+    sc = _point_scene()
+    optics = Optics(f_number=8.0, f_length=0.004, wave=sc.wave)
+    oi = oi_compute(sc, optics, shift_invariant=True, pad=False)
+    scale = (optics.f_length / optics.f_number) ** 2
+    assert np.allclose(oi.photons.sum(axis=(0, 1)), scale, rtol=0.02)
+    # Longer wavelengths spread the point further.
+    assert np.all(np.diff(oi.photons[8, 8]) < 0)
+    assert oi.sample_spacing == sc.sample_spacing
+
+
+def test_oi_compute_shift_invariant_matches_per_band_fft():
+    from isetcam.opticalimage import OpticalImage, oi_calculate_otf
+
+    sc = _point_scene(12)
+    optics = Optics(f_number=4.0, f_length=0.004, wave=sc.wave)
+    oi = oi_compute(sc, optics, shift_invariant=True, pad=False, workers=2)
+
+    ref_oi = OpticalImage(photons=sc.photons, wave=sc.wave)
+    ref_oi.sample_spacing = sc.sample_spacing
+    otf, _ = oi_calculate_otf(ref_oi, optics)
+    otf = np.fft.ifftshift(otf, axes=(0, 1))
+    scale = (optics.f_length / optics.f_number) ** 2
+    for i in range(sc.wave.size):
+        ref = np.real(np.fft.ifft2(np.fft.fft2(sc.photons[:, :, i]) * otf[:, :, i]))
+        assert np.allclose(oi.photons[:, :, i], np.maximum(ref, 0) * scale)
+
+
+def test_oi_compute_shift_invariant_caches_otf():
+    import importlib
+
+    from isetcam.opticalimage import oi_otf_cache_clear
+
+    cache = importlib.import_module("isetcam.opticalimage.oi_compute")._OTF_CACHE
+    oi_otf_cache_clear()
+    optics = Optics(f_number=4.0, f_length=0.004, wave=np.array([450.0, 550.0, 650.0]))
+    oi_compute(_point_scene(), optics, shift_invariant=True)
+    assert len(cache) == 1
+    oi_compute(_point_scene(), optics, shift_invariant=True)
+    assert len(cache) == 1
+    optics.f_number = 2.0
+    oi_compute(_point_scene(), optics, shift_invariant=True)
+    assert len(cache) == 2
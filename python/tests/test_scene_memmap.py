@@ -0,0 +1,69 @@
+import importlib
+
+import numpy as np
+
+from isetcam.opticalimage import oi_compute
+from isetcam.optics import Optics
+from isetcam.scene import (
+    Scene,
+    is_memmap_scene,
+    scene_crop,
+    scene_extract_waveband,
+    scene_from_file,
+    scene_from_memmap,
+    scene_to_memmap,
+)
+
+WAVE = np.arange(400, 710, 10)
+
+
+def _scene() -> Scene:
+    rng = np.random.default_rng(0)
+    photons = rng.random((40, 30, WAVE.size)).astype(np.float32)
+    return Scene(photons=photons, wave=WAVE, name="cube", fov=5.0)
+
+
+def test_scene_memmap_roundtrip(tmp_path):
+    scene = _scene()
+    out = scene_to_memmap(scene, tmp_path / "cube", chunk_rows=7)
+    assert is_memmap_scene(out)
+    assert not is_memmap_scene(tmp_path)
+
+    loaded = scene_from_memmap(out)
+    assert isinstance(loaded.photons.base, np.memmap)
+    assert loaded.photons.shape == scene.photons.shape
+    assert np.array_equal(loaded.photons, scene.photons)
+    assert np.array_equal(loaded.wave, WAVE)
+    assert loaded.name == "cube"
+    assert loaded.fov == 5.0
+
+    via_file = scene_from_file(out)
+    assert np.array_equal(via_file.photons, scene.photons)
+
+
+def test_scene_memmap_crop_and_waveband(tmp_path):
+    scene = _scene()
+    loaded = scene_from_memmap(scene_to_memmap(scene, tmp_path / "cube"))
+
+    crop = scene_crop(loaded, (3, 5, 10, 12))
+    assert type(crop.photons) is np.ndarray
+    assert np.array_equal(crop.photons, scene.photons[5:17, 3:13])
+
+    bands = scene_extract_waveband(loaded, [450, 600])
+    assert type(bands.photons) is np.ndarray
+    assert np.array_equal(bands.photons, scene.photons[:, :, [5, 20]])
+
+
+def test_oi_compute_memmap_matches_in_memory(tmp_path, monkeypatch):
+    scene = _scene()
+    loaded = scene_from_memmap(scene_to_memmap(scene, tmp_path / "cube"))
+    # Force several row chunks and a band subset.
+    module = importlib.import_module("isetcam.opticalimage.oi_compute")
+    monkeypatch.setattr(module, "_CHUNK_BYTES", 2000)
+    optics = Optics(f_number=4.0, f_length=0.004, wave=np.arange(500, 605, 5))
+
+    ref = oi_compute(scene, optics)
+    oi = oi_compute(loaded, optics)
+    assert type(oi.photons) is np.ndarray
+    assert oi.photons.dtype == np.float64
+    assert np.allclose(oi.photons, ref.photons)
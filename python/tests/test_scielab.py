@@ -19,10 +19,9 @@ def test_scielab_matches_deltae2000():
     de = scielab(img1, img2, WHITEPOINT, params)
     lab1 = xyz_to_lab(img1, WHITEPOINT)
     lab2 = xyz_to_lab(img2, WHITEPOINT)
-    # internal helper for deltaE2000
-    from isetcam.metrics.scielab import _delta_e_2000
+    from isetcam.metrics import delta_e_2000
 
-    expected = _delta_e_2000(lab1, lab2)
+    expected = delta_e_2000(lab1, lab2)
     assert np.allclose(de, expected)
 
 
@@ -33,3 +32,27 @@ def test_scielab_symmetry():
     d1 = scielab(img1, img2, WHITEPOINT, params)
     d2 = scielab(img2, img1, WHITEPOINT, params)
     assert np.allclose(d1, d2)
+
+
+def test_scielab_stack_and_methods():
+    rng = np.random.default_rng(0)
+    img1 = rng.random((3, 20, 24, 3)) * 50
+    img2 = img1 * 1.05 + rng.random(img1.shape)
+    wp = WHITEPOINT * 100
+    params = sc_params()
+    stack = scielab(img1, img2, wp, params)
+    assert stack.shape == (3, 20, 24)
+    for i in range(3):
+        assert np.allclose(stack[i], scielab(img1[i], img2[i], wp, params))
+
+    sep = scielab(img1, img2, wp, params, method="separable")
+    fft = scielab(img1, img2, wp, params, method="fft")
+    assert np.allclose(sep, fft)
+
+    # User supplied filters take the plain FFT path.
+    custom = SCIELABParams(
+        sampPerDeg=params.sampPerDeg,
+        filterSize=params.filterSize,
+        filters=[np.array(f) for f in params.filters],
+    )
+    assert np.allclose(scielab(img1, img2, wp, custom), fft)
@@ -44,3 +44,20 @@ def test_sensor_add_noise_combined():
     assert abs(noise.mean()) < 1e-2
     assert abs(noise.var() - expected_var) < 5e-3
 
+
+def test_sensor_add_noise_seeded_split():
+    volts = np.full((60, 40), 2.0, dtype=float)
+    s = Sensor(volts=volts.copy(), wave=np.array([550]), exposure_time=0.01)
+    sensor_set(s, "gain_sd", 5.0)
+    sensor_set(s, "offset_sd", 0.2)
+    sensor_set(s, "noise_seed", 9)
+    full, _ = sensor_add_noise(s)
+
+    s.volts = volts[25:].copy()
+    part, _ = sensor_add_noise(s, origin=(25, 0))
+    assert np.array_equal(full[25:], part)
+
+    sensor_set(s, "noise_frame", 1)
+    s.volts = volts.copy()
+    other, _ = sensor_add_noise(s)
+    assert not np.allclose(full, other)
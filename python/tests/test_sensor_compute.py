@@ -3,8 +3,10 @@ from isetcam.sensor import (
     Sensor,
     sensor_compute,
     auto_exposure,
+    sensor_cfa_integrate,
 )
 from isetcam.opticalimage import OpticalImage
+from isetcam import ie_noise_normal
 
 
 def _simple_oi(width: int = 2, height: int = 2, n_wave: int = 3) -> OpticalImage:
@@ -62,12 +64,13 @@ def test_sensor_compute_noise_gain_offset():
     s.offset_sd = 0.1
     s.analog_gain = 2.0
     s.analog_offset = 1.0
+    s.noise_seed = 7
     sensor_compute(s, oi)
-    np.random.seed(0)
-    g = 1.0 + 0.1 * np.random.randn(1, 1)
-    o = 0.1 * np.random.randn(1, 1)
+    g = 1.0 + 0.1 * ie_noise_normal((1, 1), 7, stream=(0, 1))
+    o = 0.1 * ie_noise_normal((1, 1), 7, stream=(0, 2))
     expected = (4.0 * g + o) * 2.0 + 1.0
     assert np.allclose(s.volts, expected)
+    assert s.noise_frame == 1
 
 
 def test_auto_exposure_function():
@@ -77,3 +80,33 @@ def test_auto_exposure_function():
     t = auto_exposure(s, oi)
     expected_t = 0.95 * 4.0 / 5.0
     assert np.isclose(t, expected_t)
+
+
+def test_sensor_cfa_integrate_matches_masked_loop():
+    rng = np.random.default_rng(0)
+    photons = rng.random((5, 7, 4))
+    oi = OpticalImage(photons=photons, wave=np.array([450, 500, 550, 600]))
+    s = Sensor(volts=np.zeros((5, 7)), wave=oi.wave, exposure_time=1.0)
+    s.qe = np.array([0.9, 0.8, 0.7, 0.6])
+    s.filter_spectra = rng.random((4, 3))
+    s.filter_names = ["red", "green", "blue"]
+    s.filter_color_letters = "grbg"
+
+    signal = sensor_cfa_integrate(s, photons)
+
+    mosaic = np.tile(np.array([["g", "r"], ["b", "g"]]), (3, 4))[:5, :7]
+    expected = np.zeros((5, 7))
+    for idx, letter in enumerate("rgb"):
+        integ = (photons * s.qe * s.filter_spectra[:, idx]).sum(axis=2)
+        expected[mosaic == letter] = integ[mosaic == letter]
+    assert np.allclose(signal, expected)
+
+
+def test_auto_exposure_with_color_filters():
+    oi = OpticalImage(photons=np.ones((2, 2, 1)), wave=np.array([500]))
+    s = Sensor(volts=np.zeros((2, 2)), wave=oi.wave, exposure_time=1.0)
+    s.filter_spectra = np.array([[2.0, 0.5]])
+    s.filter_names = ["r", "g"]
+    s.filter_color_letters = "rggr"
+    s.voltage_swing = 1.0
+    assert np.isclose(auto_exposure(s, oi), 0.95 / 2.0)
@@ -2,7 +2,7 @@ import numpy as np
 import pytest
 
 from isetcam.io import dng_write
-from isetcam.sensor import Sensor, sensor_dng_read
+from isetcam.sensor import Sensor, sensor_dng_read, sensor_dng_read_batch
 
 
 def _backend_available() -> bool:
@@ -22,3 +22,68 @@ def test_sensor_dng_read_roundtrip(tmp_path):
     assert isinstance(sensor, Sensor)
     assert np.array_equal(sensor.volts.astype(np.uint16), data)
     assert isinstance(sensor.exposure_time, float)
+    assert sensor.volts.dtype == np.uint16
+    assert sensor_dng_read(path, dtype="single").volts.dtype == np.float32
+
+
+@pytest.mark.skipif(not _backend_available(), reason="rawpy not available")
+def test_sensor_dng_read_batch_directory(tmp_path):
+    frames = [np.arange(12, dtype=np.uint16).reshape(3, 4) + 100 * i for i in range(4)]
+    for i, data in enumerate(frames):
+        dng_write(tmp_path / f"frame{i}.dng", data)
+    (tmp_path / "notes.txt").write_text("not a raw file")
+
+    sensors = sensor_dng_read_batch(tmp_path, workers=2)
+    assert [s.name for s in sensors] == [f"frame{i}.dng" for i in range(4)]
+    for sensor, data in zip(sensors, frames):
+        assert sensor.volts.dtype == np.uint16
+        assert np.array_equal(sensor.volts, data)
+    # All frames are views of one preallocated stack.
+    assert all(np.shares_memory(sensors[0].volts.base, s.volts) for s in sensors)
+
+
+def test_sensor_dng_read_batch_fake_backend_into_burst(monkeypatch, tmp_path):
+    import importlib
+    import types
+
+    # ``isetcam.io.dng_read`` names the function; fetch the module itself.
+    dng_mod = importlib.import_module("isetcam.io.dng_read")
+    from isetcam.cp import cp_burst_ip
+
+    frames = {}
+    for i, value in enumerate((20000, 40000, 60000)):
+        path = tmp_path / f"burst{i}.dng"
+        path.touch()
+        frames[str(path)] = np.full((4, 6), value, dtype=np.uint16)
+
+    class FakeRaw:
+        def __init__(self, path):
+            self.raw_image = frames[path]
+            self.white_level = 4095
+            self.metadata = types.SimpleNamespace(
+                iso_speed=200,
+                exposure=0.02,
+                orientation=0,
+                black_level_per_channel=[64] * 4,
+            )
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            pass
+
+    monkeypatch.setattr(dng_mod, "rawpy", types.SimpleNamespace(imread=FakeRaw))
+
+    single = sensor_dng_read(tmp_path / "burst0.dng")
+    assert single.volts.dtype == np.uint16
+    assert single.exposure_time == 0.02 and single.iso_speed == 200
+    assert np.array_equal(single.black_level, [64, 64, 64, 64])
+    assert single.white_level == 4095
+    assert sensor_dng_read(tmp_path / "burst0.dng", dtype="double").volts.dtype == float
+
+    sensors = sensor_dng_read_batch(tmp_path, workers=2)
+    assert [s.name for s in sensors] == ["burst0.dng", "burst1.dng", "burst2.dng"]
+    assert all(s.volts.dtype == np.uint16 for s in sensors)
+    # Raw uint16 frames sum without wrapping.
+    assert np.all(cp_burst_ip(sensors) == 120000)
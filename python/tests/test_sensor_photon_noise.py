@@ -25,3 +25,17 @@ def test_sensor_photon_noise_poisson():
     assert abs(noisy.mean() - 5.0) < 0.1
     assert abs(noise.mean()) < 0.1
     assert abs(noise.var() - 5.0) < 1.0
+
+
+def test_sensor_photon_noise_seeded_stack():
+    volts = np.full((30, 30), 8.0, dtype=float)
+    volts[:, 15:] = 30.0
+    s = Sensor(volts=np.stack([volts, volts]), wave=np.array([550]), exposure_time=0.01)
+    s.noise_seed = 4
+    stack, _ = sensor_photon_noise(s)
+
+    s.volts = volts.copy()
+    s.noise_frame = 1
+    single, _ = sensor_photon_noise(s)
+    assert np.array_equal(stack[1], single)
+    assert not np.array_equal(stack[0], stack[1])
@@ -0,0 +1,26 @@
+import numpy as np
+
+from isetcam.sensor import Sensor, sensor_roi_stats, sensor_stats
+
+
+def test_sensor_roi_stats_per_filter_and_cached():
+    volts = np.tile(np.array([[1.0, 2.0], [2.0, 3.0]]), (4, 4))
+    s = Sensor(volts=volts, wave=np.array([550]), exposure_time=0.01)
+    s.filter_color_letters = "rggb"
+    s.filter_names = ["r", "g", "b"]
+
+    stats = sensor_roi_stats(s)
+    assert sensor_roi_stats(s) is stats
+    mean, sd, _ = stats.stats((1, 1, 5, 5))
+    assert np.allclose(mean, [1.0, 2.0, 3.0])
+    assert np.allclose(sd, 0.0)
+
+    # Without the CFA the mosaic is a single channel, as in sensor_stats.
+    mean, sd, snr = sensor_stats(s, (0, 0, 4, 4))
+    assert np.allclose(mean, volts[:4, :4].mean())
+    assert np.allclose(sd, volts[:4, :4].std())
+
+    # Replacing the volts rebuilds the index.
+    s.volts = volts * 2
+    assert sensor_roi_stats(s) is not stats
+    assert np.allclose(sensor_roi_stats(s).mean((0, 0, 2, 2)), [2.0, 4.0, 6.0])
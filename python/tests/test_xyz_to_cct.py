@@ -29,3 +29,18 @@ def test_xyz_to_cct_rgb():
     est = xyz_to_cct(xyz)
     assert est.shape == (1, 1)
     assert np.isclose(est[0, 0], expected, atol=1e-6)
+
+
+def test_xyz_to_cct_image_matches_pointwise():
+    from isetcam import cct, xyz_to_uv
+
+    temps = np.linspace(2500, 12000, 12)
+    xyz = np.vstack([_xyz_from_temp(t) for t in temps])
+    xyz = np.tile(xyz, (5, 1)) * np.linspace(0.2, 1.0, 60)[:, np.newaxis]
+    img = xyz.reshape(6, 10, 3)
+    est = xyz_to_cct(img, chunk_size=7)
+    uv = xyz_to_uv(xyz, mode="uv")
+    expected = np.array([cct(uv[i].reshape(1, 2)) for i in range(uv.shape[0])])
+    assert est.shape == (6, 10)
+    assert np.allclose(est.ravel(), expected)
+    assert np.allclose(xyz_to_cct(img), est)